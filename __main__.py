@@ -6,7 +6,9 @@ in a folder with the following files:
 
     app.py      (the primary controller class)
     level.py    (the subcontroller for a single game level)
+    lanes.py    (the lane classes)
     models.py   (the model classes)
+    world.py    (the game rules, without any drawing)
     consts.py   (the application constants)
 
 In addition, you should have the following subfolders
@@ -18,6 +20,13 @@ In addition, you should have the following subfolders
 
 Moving any of these folders or files will prevent the game from working properly
 
+Running the game with the Python flag -O (python -O froggit) turns off the checks
+that game2d makes on every assignment.  See bench/setters.py for what that saves.
+
+Setting the environment variable FROGGIT_PROFILE to a file name (ending in .csv or
+.json) times every frame, shows the times on top of the game, and saves the last
+frames to that file when the game closes.
+
 Author: Walker M. White (wmw2)
 Date:   November 1, 2020
 """
@@ -26,4 +35,6 @@ from app import *
 
 # Application code
 if __name__ == '__main__':
-    Froggit(width=GAME_WIDTH,height=GAME_HEIGHT).run()
+    Froggit(width=GAME_WIDTH,height=GAME_HEIGHT,timestep=GAME_STEP,\
+    maxsteps=GAME_CATCHUP,retained=GAME_RETAINED,atlas=GAME_ATLAS,\
+    sounds=GAME_SOUNDS,voices=SOUND_VOICES,profile=GAME_PROFILE).run()
@@ -80,6 +80,9 @@ class Froggit(GameApp):
     # Attribute height: The height of the window
     # Invariant: height is a number (int)
 
+    # Attribute _labels: Every label made so far, keyed by its text, font and colors
+    # Invariant: _labels is a dictionary of GLabel objects
+
     # DO NOT MAKE A NEW INITIALIZER!
 
     # THREE MAIN GAMEAPP METHODS
@@ -98,16 +101,11 @@ class Froggit(GameApp):
         _text) saying that the user should press a key to play a game.
         """
         self._winstate = 0
-        self._title = GLabel(text='Froggit')
-        self._title.font_size = ALLOY_LARGE
-        self._title.font_name = ALLOY_FONT
-        self._title.linecolor = 'dark green'
+        self._labels = {}
+        self._title = self.__label__('Froggit',ALLOY_LARGE,'dark green')
         self._title.x = self.width / 2
         self._title.y = self.height / 2
-        self._text = GLabel(text='Press "s" to Start')
-        self._text.font_size = ALLOY_MEDIUM
-        self._text.font_name = ALLOY_FONT
-        self._text.linecolor= 'black'
+        self._text = self.__label__('Press "s" to Start',ALLOY_MEDIUM,'black')
         self._text.x = self.width / 2
         self._text.y = self._title.bottom - 35
         self._state = STATE_INACTIVE
@@ -137,7 +135,9 @@ class Froggit(GameApp):
         the screen. The application switches to this state if the state was
         STATE_INACTIVE in the previous frame, and the player pressed a key.
         This state only lasts one animation frame (the amount of time to load
-        the data from the file) before switching to STATE_ACTIVE. One of the
+        the data from the file) before switching to STATE_ACTIVE.  The file is
+        only read the first time (see load_level); after that the level is
+        started from the cached LevelSpec. One of the
         key things about this state is that it resizes the window to match the
         level file.
 
@@ -165,7 +165,6 @@ class Froggit(GameApp):
         Precondition: dt is a number (int or float)
         """
         if self._state == STATE_INACTIVE:
-            self.start()
             if self._input.is_key_down('s'):
                 grass = GTile(x=0,y=0,width=GRID_SIZE,height=GRID_SIZE,\
                 source='grass.png')
@@ -174,12 +173,13 @@ class Froggit(GameApp):
                 self._title = None
                 self._text = None
         if self._state == STATE_LOADING:
-            x = Froggit.load_json(DEFAULT_LEVEL)
-            y = Froggit.load_json('objects.json')
-            self.width = x['size'][0] *GRID_SIZE
-            self.height = (x['size'][1] *(GRID_SIZE))+GRID_SIZE
+            spec = load_level(DEFAULT_LEVEL)
+            self.width = spec.getWidth()
+            self.height = spec.getHeight()
             self._level = Level()
-            self._level.start(x,self.width,self.height,self.input,y)
+            self._level.start(spec,self.input,self.soundpool)
+            if not self.profiler is None:
+                self._level.profile(self.profiler)
             self._state = STATE_ACTIVE
         self.statehelper1(dt)
         self.statehelper2(dt)
@@ -197,6 +197,10 @@ class Froggit(GameApp):
         getters for these attributes or you need to add a draw method to
         those two classes.  We suggest the latter.  See the example subcontroller.py
         from the lesson videos.
+
+        While the game is active, the level is drawn part way between the last two
+        simulation steps (see the GameApp attribute alpha).  Otherwise nothing is
+        moving, so it is drawn where it is.
         """
         if self._state == STATE_INACTIVE:
             self._title.draw(self.view)
@@ -204,7 +208,7 @@ class Froggit(GameApp):
         if self._state == STATE_LOADING:
             self._level.draw(self.view)
         if self._state == STATE_ACTIVE:
-            self._level.draw(self.view)
+            self._level.draw(self.view,self.alpha)
         if self._state == STATE_PAUSED:
             self._level.draw(self.view)
             self._text.draw(self.view)
@@ -243,19 +247,14 @@ class Froggit(GameApp):
 
         Updates the STATE_PAUSED and STATE_CONTINUE states.
 
+        The message is only made when the pause starts.
+
         Parameter dt: The time in seconds since last update
         Precondition: dt is a number (int or float)
         """
         if self._state == STATE_PAUSED:
-            self._text = GLabel(text='Press "c" to Continue')
-            self._text.font_size = ALLOY_SMALL
-            self._text.font_name = ALLOY_FONT
-            self._text.x = self.width / 2
-            self._text.y = (self.height - GRID_SIZE)/2
-            self._text.width = self.width
-            self._text.height = GRID_SIZE
-            self._text.linecolor= 'white'
-            self._text.fillcolor= 'dark green'
+            if self._text is None:
+                self._text = self.__banner__('Press "c" to Continue')
             if self._input.is_key_down('c'):
                 grass = GTile(x=0,y=0,width=GRID_SIZE,height=GRID_SIZE,\
                 source='grass.png')
@@ -273,19 +272,64 @@ class Froggit(GameApp):
 
         Updates the STATE_COMPLETE state.
 
+        The message is only made when the state starts.
+
         Parameter dt: The time in seconds since last update
         Precondition: dt is a number (int or float)
         """
-        if self._state == STATE_COMPLETE:
+        if self._state == STATE_COMPLETE and self._text is None:
             if self._winstate == 0:
-                self._text = GLabel(text='YOU LOSE')
+                self._text = self.__banner__('YOU LOSE')
             if self._winstate == 1:
-                self._text = GLabel(text='YOU WIN!')
-            self._text.font_size = ALLOY_SMALL
-            self._text.font_name = ALLOY_FONT
-            self._text.x = self.width / 2
-            self._text.y = (self.height - GRID_SIZE)/2
-            self._text.width = self.width
-            self._text.height = GRID_SIZE
-            self._text.linecolor= 'white'
-            self._text.fillcolor= 'dark green'
+                self._text = self.__banner__('YOU WIN!')
+
+    def __banner__(self,text):
+        """
+        Returns: A message across the middle of the level
+
+        Parameter text: The message
+        Precondition: text is a string
+        """
+        label = self.__label__(text,ALLOY_SMALL,'white','dark green',\
+        self.width,GRID_SIZE)
+        label.x = self.width / 2
+        label.y = (self.height - GRID_SIZE)/2
+        return label
+
+    def __label__(self,text,size,linecolor,fillcolor=None,width=0,height=0):
+        """
+        Returns: A label with the given text, font size, colors and size
+
+        Drawing the text of a label is slow, so labels are only made once.  After
+        that, this returns the same label (which may need to be moved).
+
+        Parameter text: The text of the label
+        Precondition: text is a string
+
+        Parameter size: The font size
+        Precondition: size is a number (int) > 0
+
+        Parameter linecolor: The text color
+        Precondition: linecolor is a color name
+
+        Parameter fillcolor: The background color (None for no background)
+        Precondition: fillcolor is a color name or None
+
+        Parameter width: The minimum width of the label
+        Precondition: width is a number (int) >= 0
+
+        Parameter height: The minimum height of the label
+        Precondition: height is a number (int) >= 0
+        """
+        key = (text,ALLOY_FONT,size,linecolor,fillcolor,width,height)
+        if not key in self._labels:
+            label = GLabel(text=text)
+            label.font_size = size
+            label.font_name = ALLOY_FONT
+            if width > 0 and height > 0:
+                label.width = width
+                label.height = height
+            label.linecolor = linecolor
+            label.fillcolor = fillcolor
+            self._labels[key] = label
+        return self._labels[key]
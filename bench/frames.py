@@ -0,0 +1,330 @@
+"""
+Frame time benchmarks for Froggit
+
+This script plays every level that ships with the game, and a few synthetic stress
+levels made by levelgen.py, and times each part of a frame on its own:
+
+    build    making a World from a level (once per level, not per frame)
+    lanes    moving the obstacles in every lane (LaneState.update)
+    collide  the collision tests of every lane (issafe, and findentrance for hedges)
+    step     a whole simulation step (World.step)
+    start    making a Level, with its lanes and sprites (once per level)
+    update   Level.update, which is World.step plus the input and the sounds
+    draw     Level.draw, from clearing the view to committing it
+
+The first four phases only need numpy, so they always run.  The last three need Kivy
+(and a window), and are skipped if there is none, or if the flag --headless is given.
+The draw phase times the drawing commands only.  Kivy renders them later, outside of
+the frame.
+
+    python bench/frames.py [--levels easy1,stress-road] [--frames 600]
+                           [--save FILE] [--compare FILE] [--threshold 0.25]
+
+To see how the game scales, play the much larger levels in SCALING by name, as in
+--levels scale-100,scale-200.
+
+Each phase is reported as the median (p50) and the 99th percentile (p99) in
+microseconds.  Like timeit, the garbage collector is off while timing, so that its
+pauses do not land on whichever phase happens to be running.  The frame phases are
+checked against BUDGETS, a share of the frame time.  With --save, the results are
+written to a JSON file.  With --compare, they are checked against a file saved
+earlier, and any p50 that is slower by more than the threshold is a regression.  The
+script exits with status 1 if any phase is over budget or has regressed.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import gc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# consts.py reads the level and frog speed from the arguments, so hide ours from it
+ARGUMENTS = sys.argv[1:]
+sys.argv = sys.argv[:1]
+sys.path.insert(0,ROOT)
+
+from consts import *
+from world import *
+from levelgen import generate
+import numpy as np
+
+# The levels that ship with the game
+LEVELS = ('easy1','easy2','complete','bigones','multihedge','roadsonly')
+
+# The synthetic levels, as the arguments to levelgen.generate (always with seed 0)
+STRESS = {'stress-road' :dict(width=32,height=16,mix={'road':1},density=0.5),
+          'stress-water':dict(width=32,height=16,mix={'water':1},density=0.5),
+          'stress-wide' :dict(width=128,height=16,mix={'road':1},density=0.5)}
+
+# The scaling levels, like STRESS.  These are far past the budgets, so they are only
+# played when named with --levels
+SCALING = {'scale-100'  :dict(width=100,height=100,density=0.7),
+           'scale-200'  :dict(width=200,height=100,density=0.7)}
+
+# The frame phases, in the order they are reported (build and start are not per frame)
+PHASES = ('build','lanes','collide','step','start','update','draw')
+
+# The most time each frame phase may take (p99), as a share of one simulation step
+BUDGETS = {'lanes':0.15,'collide':0.15,'step':0.25,'update':0.25,'draw':0.40}
+
+# How often (in frames) the scripted player hops forward
+HOP_FRAMES = 20
+
+
+def load(name):
+    """
+    Returns: The LevelSpec for the level (shipped or synthetic) name
+
+    Parameter name: The level
+    Precondition: name is in LEVELS or a key of STRESS or SCALING
+    """
+    if name in STRESS or name in SCALING:
+        params = STRESS[name] if name in STRESS else SCALING[name]
+        return LevelSpec(generate(seed=0,**params),load_catalogue(),name)
+    return load_level(name+'.json')
+
+
+def summarize(samples):
+    """
+    Returns: The p50 and p99 (in microseconds) of a list of times in seconds
+
+    Parameter samples: The times
+    Precondition: samples is a non-empty list of numbers
+    """
+    times = np.array(samples)*1e6
+    return {'p50':float(np.percentile(times,50)),'p99':float(np.percentile(times,99))}
+
+
+def hop(frame):
+    """
+    Returns: The direction the scripted player wants to go at the given frame
+
+    Parameter frame: The frame number
+    Precondition: frame is an int >= 0
+    """
+    return 'up' if frame % HOP_FRAMES == 0 else None
+
+
+def bench_world(spec,frames,builds=20):
+    """
+    Returns: The timings of the headless phases for the given level
+
+    The phases lanes and collide use one World, with a probe frog in every lane
+    that sweeps across the level.  The phase step uses another World, played by
+    hopping forward every HOP_FRAMES frames.  A World that is won or lost is
+    replaced (untimed).
+
+    Parameter spec: The level to play
+    Precondition: spec is a LevelSpec object
+
+    Parameter frames: The number of frames to play
+    Precondition: frames is an int > 0
+
+    Parameter builds: The number of Worlds to make for the phase build
+    Precondition: builds is an int > 0
+    """
+    dt = GAME_STEP
+    samples = dict((phase,[]) for phase in ('build','lanes','collide','step'))
+    World(spec)
+    for count in range(builds):
+        start = time.perf_counter()
+        World(spec)
+        samples['build'].append(time.perf_counter()-start)
+
+    world = World(spec)
+    width, height = spec.getFrogSize()
+    hitboxes = spec.getFrogHitboxes()
+    probes = [FrogState(0,lane.getY(),width,height,hitboxes) for lane in world.getLanes()]
+    for frame in range(frames):
+        start = time.perf_counter()
+        for (lane,probe) in zip(world.getLanes(),probes):
+            lane.update(dt,probe)
+        samples['lanes'].append(time.perf_counter()-start)
+
+        x = (frame*7) % spec.getWidth()
+        start = time.perf_counter()
+        for (lane,probe) in zip(world.getLanes(),probes):
+            probe.x = x
+            if isinstance(lane,HedgeState):
+                lane.findentrance(probe,lane.getY()+GRID_SIZE)
+            else:
+                lane.issafe(probe)
+        samples['collide'].append(time.perf_counter()-start)
+
+    world = World(spec)
+    for frame in range(frames):
+        start = time.perf_counter()
+        result = world.step(dt,hop(frame))
+        samples['step'].append(time.perf_counter()-start)
+        if result == 0:
+            world.respawn()
+        elif not result is None:
+            world = World(spec)
+    return dict((phase,summarize(times)) for (phase,times) in samples.items())
+
+
+def make_game():
+    """
+    Returns: A Froggit app to draw the levels in, or None if Kivy cannot make one
+    """
+    os.environ['KIVY_NO_ARGS'] = '1'
+    os.environ.setdefault('KIVY_LOG_MODE','PYTHON')
+    import logging
+    logging.disable(logging.CRITICAL)
+    try:
+        import app
+        game = app.Froggit(width=GAME_WIDTH,height=GAME_HEIGHT,timestep=GAME_STEP,\
+        retained=GAME_RETAINED,atlas=GAME_ATLAS,sounds=GAME_SOUNDS)
+        game.build()
+    except Exception as e:
+        print('Skipping start, update and draw: %s' % e)
+        return None
+    return game
+
+
+def bench_level(game,spec,frames,starts=5):
+    """
+    Returns: The timings of the Kivy phases for the given level
+
+    The level is played like bench_world plays the phase step, except that the
+    player presses the up key, and a level that is won or lost is started again.
+
+    Parameter game: The app to draw in
+    Precondition: game is a built Froggit object
+
+    Parameter spec: The level to play
+    Precondition: spec is a LevelSpec object
+
+    Parameter frames: The number of frames to play
+    Precondition: frames is an int > 0
+
+    Parameter starts: The number of Levels to make for the phase start
+    Precondition: starts is an int > 0
+    """
+    from level import Level
+    samples = dict((phase,[]) for phase in ('start','update','draw'))
+    Level().start(spec,game.input,game.soundpool)   # Loads the images the first time
+    for count in range(starts):
+        start = time.perf_counter()
+        level = Level()
+        level.start(spec,game.input,game.soundpool)
+        samples['start'].append(time.perf_counter()-start)
+
+    view = game.view
+    for frame in range(frames):
+        game.input._keystate.clear()
+        if hop(frame):
+            game.input._keystate[hop(frame)] = True
+        start = time.perf_counter()
+        result = level.update(GAME_STEP)
+        samples['update'].append(time.perf_counter()-start)
+        if result == 0:
+            level.__frogrejack__()
+        elif not result is None:
+            level = Level()
+            level.start(spec,game.input,game.soundpool)
+
+        start = time.perf_counter()
+        view.clear()
+        level.draw(view)
+        view._commit()
+        samples['draw'].append(time.perf_counter()-start)
+    game.input._keystate.clear()
+    game.soundpool.stop()
+    return dict((phase,summarize(times)) for (phase,times) in samples.items())
+
+
+def check(results,baseline,threshold):
+    """
+    Returns: The problems with the results, as a list of strings
+
+    A frame phase is a problem if its p99 is over its share of the frame in BUDGETS.
+    A phase is also a problem if its p50 is slower than in baseline by more than the
+    threshold.
+
+    Parameter results: The timings of each level and phase
+    Precondition: results is a dictionary as returned by bench_world or bench_level,
+    keyed by level
+
+    Parameter baseline: The timings of an earlier run (or None)
+    Precondition: baseline is None or a dictionary like results
+
+    Parameter threshold: The slow down allowed before it is a regression
+    Precondition: threshold is a number >= 0
+    """
+    problems = []
+    for (name,phases) in results.items():
+        for (phase,times) in phases.items():
+            budget = BUDGETS.get(phase)
+            if not budget is None and times['p99'] > budget*GAME_STEP*1e6:
+                problems.append('%s %s p99 is %.1f us, over its budget of %.1f us' % \
+                (name,phase,times['p99'],budget*GAME_STEP*1e6))
+            if baseline is None or not phase in baseline.get(name,{}):
+                continue
+            old = baseline[name][phase]['p50']
+            if times['p50'] > old*(1+threshold):
+                problems.append('%s %s p50 is %.1f us, up from %.1f us' % \
+                (name,phase,times['p50'],old))
+    return problems
+
+
+def report(results):
+    """
+    Prints a table of the p50 and p99 of every level and phase.
+
+    Parameter results: The timings of each level and phase
+    Precondition: results is a dictionary of timings, keyed by level
+    """
+    print('%-14s' % 'p50/p99 (us)'+''.join('%18s' % phase for phase in PHASES))
+    for (name,phases) in results.items():
+        cells = ['%8.1f/%-8.1f' % (phases[phase]['p50'],phases[phase]['p99']) \
+        if phase in phases else '%17s' % '-' for phase in PHASES]
+        print('%-14s' % name+' '.join(['']+cells))
+
+
+def main():
+    """
+    Runs the benchmarks given by the command line arguments.
+    """
+    parser = argparse.ArgumentParser(description='Times each part of a Froggit frame.')
+    parser.add_argument('--levels',default=','.join(LEVELS+tuple(STRESS)),\
+    help='comma separated levels to play (default: all but SCALING)')
+    parser.add_argument('--frames',type=int,default=600,help='frames to play per level')
+    parser.add_argument('--headless',action='store_true',help='skip the Kivy phases')
+    parser.add_argument('--save',help='write the results to this JSON file')
+    parser.add_argument('--compare',help='check the results against this JSON file')
+    parser.add_argument('--threshold',type=float,default=0.25,\
+    help='slow down allowed against --compare (default: 0.25)')
+    args = parser.parse_args(ARGUMENTS)
+
+    game = None if args.headless else make_game()
+    results = {}
+    for name in args.levels.split(','):
+        spec = load(name)
+        gc.collect()
+        gc.disable()
+        try:
+            results[name] = bench_world(spec,args.frames)
+            if not game is None:
+                results[name].update(bench_level(game,spec,args.frames))
+        finally:
+            gc.enable()
+    report(results)
+
+    if args.save:
+        with open(args.save,'w') as file:
+            json.dump(results,file,indent=2)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+    problems = check(results,baseline,args.threshold)
+    for problem in problems:
+        print(problem)
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Benchmark for the fast mode of game2d
+
+Every game2d attribute checks its value when it is assigned, unless Python is run with
+the flag -O (see game2d/__init__.py).  This script measures what those checks cost:
+the time of each attribute assignment that happens every frame, and the time of a
+whole Froggit frame (the row 'game').  It runs itself twice, with and without -O,
+and prints both.
+
+    python bench/setters.py [level] [frames]
+
+The level defaults to easy2.json and the number of frames to 600.  The frames are
+played with the fixed timestep of the game, but without a window on the screen.
+"""
+import os
+import sys
+import json
+import subprocess
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The attribute assignments to time, as (name, statement) for a GSprite s
+ASSIGNMENTS = (('x','s.x = i'),('y','s.y = i'),('angle','s.angle = 90*(i%4)'),
+               ('frame','s.frame = i%5'),('hitbox','s.hitbox = (1,2,3,4)'))
+
+
+def measure(level,frames,repeat=100000):
+    """
+    Returns: A dictionary of timings (in microseconds) for this process
+
+    Parameter level: The level file to play
+    Precondition: level is a string naming a file in the JSON folder
+
+    Parameter frames: The number of frames to play
+    Precondition: frames is an int > 0
+
+    Parameter repeat: The number of times to make each assignment
+    Precondition: repeat is an int > 0
+    """
+    os.environ['KIVY_NO_ARGS'] = '1'
+    os.environ.setdefault('KIVY_LOG_MODE','PYTHON')
+    import logging
+    logging.disable(logging.CRITICAL)
+    sys.argv = [sys.argv[0],level]   # consts.py reads the level from the arguments
+    sys.path.insert(0,ROOT)
+    import consts
+    import app
+    from game2d import GSprite
+
+    game = app.Froggit(width=consts.GAME_WIDTH,height=consts.GAME_HEIGHT,\
+    timestep=consts.GAME_STEP,retained=consts.GAME_RETAINED,sounds=consts.GAME_SOUNDS)
+    game.build()
+    game.start()
+
+    result = {}
+    s = GSprite(x=0,y=0,source=consts.FROG_SPRITE+'.png',format=(1,5),\
+    hitboxes=[(1,2,3,4)]*5)
+    for (name,statement) in ASSIGNMENTS:
+        code = compile('for i in range(%d): %s' % (repeat,statement),name,'exec')
+        start = time.perf_counter()
+        exec(code,{'s':s})
+        result[name] = (time.perf_counter()-start)/repeat*1e6
+
+    # Time the game in blocks of a second, and keep the median block
+    game.input._keystate['s'] = True
+    game._refresh(consts.GAME_STEP)
+    game.input._keystate.clear()
+    blocks = []
+    for block in range(max(1,frames//60)):
+        start = time.perf_counter()
+        for frame in range(60):
+            game._refresh(consts.GAME_STEP)
+        blocks.append((time.perf_counter()-start)/60*1e6)
+    result['game'] = sorted(blocks)[len(blocks)//2]
+    return result
+
+
+def run(optimize,level,frames):
+    """
+    Returns: The timings of a new Python process, with or without the flag -O
+
+    Parameter optimize: Whether to use the flag -O
+    Precondition: optimize is a bool
+
+    Parameter level: The level file to play
+    Precondition: level is a string naming a file in the JSON folder
+
+    Parameter frames: The number of frames to play
+    Precondition: frames is an int > 0
+    """
+    command = [sys.executable]+(['-O'] if optimize else [])+[__file__,level,str(frames)]
+    env = dict(os.environ,BENCH_CHILD='1')
+    output = subprocess.run(command,env=env,stdout=subprocess.PIPE,check=True).stdout
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def main():
+    """
+    Runs the benchmark (in fast mode and checked mode) and prints the results.
+    """
+    level = sys.argv[1] if len(sys.argv) > 1 else 'easy2.json'
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 600
+    if os.environ.get('BENCH_CHILD'):
+        print(json.dumps(measure(level,frames)))
+        return
+
+    checked = run(False,level,frames)
+    fast = run(True,level,frames)
+    print('%-8s %12s %12s %8s' % ('','checked (us)','fast -O (us)','saved'))
+    for name in [name for (name,statement) in ASSIGNMENTS]+['game']:
+        saved = 1-fast[name]/checked[name]
+        print('%-8s %12.3f %12.3f %7.1f%%' % (name,checked[name],fast[name],100*saved))
+
+
+if __name__ == '__main__':
+    main()
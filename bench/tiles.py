@@ -0,0 +1,127 @@
+"""
+Benchmark for building GTile meshes
+
+A GTile draws one quad for every copy of its image.  This script times how long it
+takes to make the quads of tiles with 1,000 to 100,000 copies, with the nested loops
+that GTile used to use and with the numpy arrays it uses now.  It also times making
+the whole GTile (with its meshes), and checks that both ways give the same quads.
+
+    python bench/tiles.py [repeat]
+
+Each time is the best of repeat tries (3 by default), in milliseconds.
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The grid (columns, rows) of each tile to make, and the image to tile
+GRIDS = ((40,25),(100,100),(400,250))
+IMAGE = 'grass.png'
+
+
+def loops(x,y,width,height,grid_x,grid_y):
+    """
+    Returns: The vertices and indices of a tile, made the way GTile used to make them
+
+    Parameter x: The left edge of the tile
+    Precondition: x is a number
+
+    Parameter y: The bottom edge of the tile
+    Precondition: y is a number
+
+    Parameter width: The width of the tile
+    Precondition: width is a number > 0
+
+    Parameter height: The height of the tile
+    Precondition: height is a number > 0
+
+    Parameter grid_x: The width of the image
+    Precondition: grid_x is an int > 0
+
+    Parameter grid_y: The height of the image
+    Precondition: grid_y is an int > 0
+    """
+    size_x = int(width//grid_x)
+    size_y = int(height//grid_y)
+    rem_x = width-grid_x*size_x
+    rem_y = height-grid_y*size_y
+
+    rng_x = size_x+1 if rem_x > 0 else size_x
+    rng_y = size_y+1 if rem_y > 0 else size_y
+
+    vert = []
+    indx = []
+    pos = 0
+    for ii in range(rng_x):
+        for jj in range(rng_y):
+            ni = 1 if ii < size_x else rem_x/grid_x
+            nj = 1 if jj < size_y else rem_y/grid_y
+            vert.extend([x+ii*grid_x,      y+jj*grid_y,         0, 1])
+            vert.extend([x+(ii+ni)*grid_x, y+jj*grid_y,        ni, 1])
+            vert.extend([x+(ii+ni)*grid_x, y+(jj+nj)*grid_y,   ni, 1-nj])
+            vert.extend([x+ii*grid_x,      y+(jj+nj)*grid_y,    0, 1-nj])
+            indx.extend([pos,pos+1,pos+2,pos+2,pos+3,pos])
+            pos += 4
+    return (vert,indx)
+
+
+def best(function,repeat):
+    """
+    Returns: The shortest time (in milliseconds) of repeat calls to function
+
+    Parameter function: The function to time
+    Precondition: function is callable with no arguments
+
+    Parameter repeat: The number of calls
+    Precondition: repeat is an int > 0
+    """
+    times = []
+    for count in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter()-start)
+    return min(times)*1000
+
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    """
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    os.environ['KIVY_NO_ARGS'] = '1'
+    os.environ.setdefault('KIVY_LOG_MODE','PYTHON')
+    import logging
+    logging.disable(logging.CRITICAL)
+    sys.path.insert(0,ROOT)
+    import numpy
+    import consts
+    import app
+    from game2d import GameApp, GTile
+
+    # Making the app finds the Images folder
+    app.Froggit(width=consts.GAME_WIDTH,height=consts.GAME_HEIGHT)
+    texture = GameApp.load_texture(IMAGE)
+    grid_x, grid_y = texture.width, texture.height
+    print('%8s %12s %12s %12s %10s' % ('tiles','loops (ms)','numpy (ms)','GTile (ms)','speedup'))
+    for (cols,rows) in GRIDS:
+        # Cut the last column and row in half, so that the partial copies are checked too
+        width = (cols-0.5)*grid_x
+        height = (rows-0.5)*grid_y
+        tile = GTile(x=0,y=0,width=width,height=height,source=IMAGE)
+        x, y = -width/2.0, -height/2.0
+
+        vert, indx = loops(x,y,width,height,grid_x,grid_y)
+        quads = tile._quads(x,y)
+        assert numpy.allclose(numpy.array(vert,dtype=numpy.float32),quads.ravel()), \
+        'the quads of %d tiles do not match' % (cols*rows)
+
+        old = best(lambda: loops(x,y,width,height,grid_x,grid_y),repeat)
+        new = best(lambda: tile._quads(x,y),repeat)
+        full = best(tile._reset,repeat)
+        print('%8d %12.2f %12.2f %12.2f %9.1fx' % (cols*rows,old,new,full,old/new))
+
+
+if __name__ == '__main__':
+    main()
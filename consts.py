@@ -11,6 +11,7 @@ access them.
 """
 import introcs
 import sys
+import os
 
 ### WINDOW CONSTANTS (all coordinates are in pixels) ###
 
@@ -18,6 +19,16 @@ import sys
 GAME_WIDTH  = 1024
 # The initial height of the game display
 GAME_HEIGHT = 896
+# The fixed simulation step in seconds (None to update once per animation frame)
+GAME_STEP   = 1/60
+# The most simulation steps to take in one animation frame before dropping time
+GAME_CATCHUP = 5
+# Whether the view keeps its contents between frames (instead of rebuilding them)
+GAME_RETAINED = True
+# The name of the texture atlas for the images (None to give each image its own texture)
+GAME_ATLAS  = 'froggit'
+# The file (.csv or .json) to save a profile of the last frames to, or None to not profile
+GAME_PROFILE = os.environ.get('FROGGIT_PROFILE')
 # The size in pixels of a single grid square
 GRID_SIZE    = 64
 
@@ -66,6 +77,21 @@ STATE_CONTINUE = 4
 STATE_COMPLETE = 5
 
 
+### OBSTACLE CONSTANTS ###
+
+# An obstacle that kills the frog on contact (cars, trucks)
+KIND_HAZARD   = 0
+# An obstacle that carries the frog across the water (logs)
+KIND_PLATFORM = 1
+# An exit in the hedge that the frog is trying to reach
+KIND_EXIT     = 2
+# An opening in the hedge that the frog can pass through
+KIND_OPEN     = 3
+# The obstacle kind for each "kind" value in the object data file
+OBJECT_KINDS  = {'hazard':KIND_HAZARD, 'platform':KIND_PLATFORM,
+                 'exit':KIND_EXIT, 'open':KIND_OPEN}
+
+
 ### FONT CONSTANTS ###
 
 # The font choice for labels and messages
@@ -86,6 +112,10 @@ CROAK_SOUND = 'croak.wav'
 SPLAT_SOUND = 'splat.wav'
 # The succes sound
 TRILL_SOUND = 'trill.wav'
+# The sounds to load when the game starts
+GAME_SOUNDS = (CROAK_SOUND,SPLAT_SOUND,TRILL_SOUND)
+# The number of copies of each sound that can play at once
+SOUND_VOICES = 3
 
 
 ### JSON FILES ###
@@ -4,6 +4,11 @@ A module to support simple 2D game development.
 This module is a simple wrapper around Kivy interfaces to make 2D game development
 simpler for students in CS 1110.
 
+Every attribute of the game objects checks its new value when it is assigned.  That
+makes mistakes easy to find, but moving objects are assigned every frame.  Once a game
+works, run it in fast mode with the Python flag -O (or the environment variable
+PYTHONOPTIMIZE=1), which skips all of these checks.  Run without it when debugging.
+
 Author: Walker M. White (wmw2)
 Date:   August 1, 2017 (Python 3 version)
 """
@@ -11,7 +16,11 @@ from .gobject import GObject, GScene
 from .grectangle import GRectangle, GEllipse, GImage, GLabel
 from .gsprite import GSprite
 from .gtile import GTile
+from .gbatch import GBatch
+from .glayer import GLayer
+from .gtext import GText
+from .gprofile import GProfiler
 from .gpath import GPath, GTriangle, GPolygon
 from .gview import GInput, GView
-from .sound import Sound, SoundLibrary
+from .sound import Sound, SoundLibrary, SoundPool
 from .app import GameApp
\ No newline at end of file
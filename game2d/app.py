@@ -47,6 +47,10 @@ class GameApp(kivy.app.App):
     """
     # Class attribute for tracking textures (to reduce memory footprint)
     TEXTURE_CACHE = {}
+    # Class attribute for tracking the atlas regions of each image (to share textures)
+    ATLAS_CACHE = {}
+    # Class attribute for tracking the frames of each sprite sheet (to share regions)
+    FRAME_CACHE = {}
     
     
     # MUTABLE ATTRIBUTES
@@ -71,6 +75,50 @@ class GameApp(kivy.app.App):
         self._fps = value
         Clock.schedule_interval(self._refresh,1.0/self._fps)
     
+    @property
+    def timestep(self):
+        """
+        The fixed simulation step in seconds, or None to update once per frame
+        
+        By default (None) the method `update` is called once per animation frame with
+        whatever time Kivy measured since the last frame.  That makes the game depend 
+        on the speed of the machine.  If this is a number, then `update` is always given
+        exactly this much time, and is called as many times per frame as needed to keep 
+        up with the clock (but never more than ``maxsteps`` times).  The time left over 
+        is available in ``alpha`` for drawing.
+        
+        **Invariant**: Must be None or an int or float > 0.
+        """
+        return self._timestep
+    
+    @timestep.setter
+    def timestep(self,value):
+        assert value is None or type(value) in [int,float], 'value %s is not a number' % repr(value)
+        assert value is None or value > 0, 'value %s is not positive' % repr(value)
+        self._timestep = value
+        self._accumulator = 0
+        self._alpha = 1.0
+    
+    @property
+    def maxsteps(self):
+        """
+        The maximum number of fixed steps in a single animation frame
+        
+        This only matters if ``timestep`` is not None.  If a frame takes so long that 
+        the game would need more steps than this to catch up, the extra time is dropped 
+        and the game slows down instead.  This keeps a slow frame from causing even 
+        slower frames.
+        
+        **Invariant**: Must be an int > 0.
+        """
+        return self._maxsteps
+    
+    @maxsteps.setter
+    def maxsteps(self,value):
+        assert type(value) == int, 'value %s is not an int' % repr(value)
+        assert value > 0, 'value %s is not positive' % repr(value)
+        self._maxsteps = value
+    
     @property
     def width(self):
         """
@@ -129,6 +177,47 @@ class GameApp(kivy.app.App):
         """
         return self._input
     
+    @property
+    def alpha(self):
+        """
+        The fraction of a fixed step that has passed since the last call to `update`.
+        
+        When ``timestep`` is not None, the screen is usually drawn part way between 
+        two steps.  Drawing each moving object at ``alpha`` of the way from where it
+        was before the last step to where it is now keeps the motion smooth.  If 
+        ``timestep`` is None, this is always 1.
+        
+        **Invariant**: Must be a float in 0..1.
+        """
+        return self._alpha
+    
+    @property
+    def soundpool(self):
+        """
+        The sound effects loaded when the game started.
+        
+        This pool has the sounds named by the ``sounds`` keyword of the constructor,
+        each keyed by its file name.  Because they are all loaded before the game 
+        starts, playing them never reads a file.  See :class:`SoundPool`.
+        
+        **Invariant**: Must be instance of :class:`SoundPool`
+        """
+        return self._soundpool
+    
+    @property
+    def profiler(self):
+        """
+        The frame profiler, or None if the game is not profiled.
+        
+        This is only present if the game was given the keyword ``profile``.  It times
+        every phase of every frame, and draws a summary on top of the game.  To also
+        time the methods ``update`` and ``draw`` of a subcontroller, register it with
+        the profiler.  See :class:`GProfiler`.
+        
+        **Invariant**: Must be instance of :class:`GProfiler` or None
+        """
+        return self._profiler
+    
     # CLASS METHODS
     @classmethod
     def is_image(cls,name):
@@ -235,6 +324,112 @@ class GameApp(kivy.app.App):
         
         return texture
     
+    @classmethod
+    def load_region(cls,name):
+        """
+        Returns: The texture for the given file name, or None if it cannot be loaded
+        
+        If the image was packed into an atlas (see :meth:`load_atlas`), this returns
+        its region of the atlas texture, so every image in the atlas shares a single 
+        texture.  Otherwise it is the same as :meth:`load_texture`.
+        
+        Regions cannot repeat, so :class:`GTile` should always use :meth:`load_texture`.
+        
+        :param name: The file name
+        :type name:  ``str``
+        """
+        if name in cls.ATLAS_CACHE:
+            return cls.ATLAS_CACHE[name]
+        return cls.load_texture(name)
+    
+    @classmethod
+    def load_frames(cls,name,format):
+        """
+        Returns: The frames of the given sprite sheet, or None if it cannot be loaded
+        
+        The frames are the regions of the image (see :meth:`load_region`) for a grid of
+        the given format, left-to-right and top-to-bottom.  They are only computed once 
+        for each file name and format, so every sprite using the same sheet shares them.
+        
+        :param name: The file name
+        :type name:  ``str``
+        
+        :param format: The grid size (rows, columns) of the sprite sheet
+        :type format:  2-element tuple of ints > 0
+        """
+        key = (name,tuple(format))
+        if key in cls.FRAME_CACHE:
+            return cls.FRAME_CACHE[key]
+        
+        texture = cls.load_region(name)
+        if texture is None:
+            return None
+        
+        rows, cols = key[1]
+        width  = texture.width/cols
+        height = texture.height/rows
+        frames = []
+        for row in range(rows):
+            for col in range(cols):
+                frames.append(texture.get_region(int(col*width),texture.height-int(row*height)-int(height),
+                                                 int(width),int(height)))
+        cls.FRAME_CACHE[key] = tuple(frames)
+        return cls.FRAME_CACHE[key]
+    
+    @classmethod
+    def load_atlas(cls,name,size=1024):
+        """
+        Returns: True if the atlas for the given name is loaded, False otherwise
+        
+        The atlas packs every image in the **Images** folder (that fits) into one or more
+        textures of the given size.  It is stored in the **atlas** subfolder of 
+        **Images** as ``name.atlas`` and ``name-<number>.png``.  The atlas is rebuilt 
+        whenever an image is newer than it.  Building the atlas requires PIL; if it is
+        not installed (or the atlas cannot be built or loaded), every image keeps its
+        own texture.
+        
+        Once the atlas is loaded, :meth:`load_region` returns the atlas region for each
+        image in it.
+        
+        :param name: The atlas name
+        :type name:  ``str``
+        
+        :param size: The width and height of each atlas texture
+        :type size:  ``int`` > 0
+        """
+        from kivy.atlas import Atlas
+        folder = os.path.join(cls.images,'atlas')
+        path = os.path.join(folder,name+'.atlas')
+        
+        try:
+            files = [os.path.join(cls.images,file) for file in sorted(os.listdir(cls.images)) 
+                     if file[-4:].lower() == '.png']
+            newest = max(map(os.path.getmtime,files)) if files else 0
+            if not os.path.exists(path) or os.path.getmtime(path) < newest:
+                # Atlas.create needs PIL anyway; leave out images that cannot fit
+                from PIL import Image
+                fits = []
+                for file in files:
+                    with Image.open(file) as image:
+                        if image.width+4 <= size and image.height+4 <= size:
+                            fits.append(file)
+                if not os.path.isdir(folder):
+                    os.mkdir(folder)
+                Atlas.create(os.path.join(folder,name),fits,size)
+            
+            atlas = Atlas(path)
+            for (key,texture) in atlas.textures.items():
+                cls.ATLAS_CACHE[key+'.png'] = texture
+            # Frames cut from the old textures are no longer shared
+            cls.FRAME_CACHE.clear()
+        except:
+            Logger.info('GameApp: Could not build the atlas %s.' % repr(name))
+            exc_type, exc_value, exc_tb = sys.exc_info()
+            items = traceback.format_exception(exc_type, exc_value, exc_tb)
+            Logger.info(items[-1].strip())
+            return False
+        return True
+    
     @classmethod
     def unload_texture(cls,name):
         """
@@ -248,6 +443,8 @@ class GameApp(kivy.app.App):
         :type name:  ``str``
         """
         assert type(name) == str, '%s is not a valid texture name' % repr(name)
+        for key in [key for key in cls.FRAME_CACHE if key[0] == name]:
+            del cls.FRAME_CACHE[key]
         if name in cls.TEXTURE_CACHE:
             texture = cls.TEXTURE_CACHE[name]
             del cls.TEXTURE_CACHE[name]
@@ -300,6 +497,21 @@ class GameApp(kivy.app.App):
         The game window will not show until you start the game. To start the game, use 
         the method ``run()``.
         
+        To update the game in fixed steps (so that it plays the same on every machine),
+        also give it a ``timestep`` in seconds, and optionally ``maxsteps``::
+            
+            GameApp(width=400,height=400,timestep=1/60.0,maxsteps=5)
+        
+        Giving it ``retained=True`` puts the view in retained mode (see :class:`GView`).
+        Giving it ``atlas='name'`` packs the images into a shared atlas when the game
+        starts (see :meth:`load_atlas`).  Giving it ``sounds=['a.wav',...]`` loads 
+        those sounds into the attribute ``soundpool`` when the game starts, with 
+        ``voices`` copies of each (4 by default) so that they can overlap.
+        
+        Giving it ``profile=True`` times every frame (see the attribute ``profiler``).
+        Giving it ``profile='name.csv'`` (or ``'name.json'``) does the same, and saves
+        the last frames to that file when the game stops.
+        
         **You will never call the constructor or run yourself**.  That is handled for 
         you in the provided code.
         
@@ -309,10 +521,22 @@ class GameApp(kivy.app.App):
         w = keywords.pop('width', 0.0)
         h = keywords.pop('height', 0.0)
         f = keywords.pop('fps', 60.0)
+        t = keywords.pop('timestep', None)
+        m = keywords.pop('maxsteps', 5)
+        r = keywords.pop('retained', False)
+        a = keywords.pop('atlas', None)
+        s = keywords.pop('sounds', ())
+        v = keywords.pop('voices', 4)
+        p = keywords.pop('profile', None)
         
         assert type(w) in [int,float], 'width %s is not a number' % repr(w)
         assert type(h) in [int,float], 'height %s is not a number' % repr(h)
         assert type(f) in [int,float], 'fps %s is not a number' % repr(value)
+        assert type(r) == bool, 'retained %s is not a bool' % repr(r)
+        assert a is None or type(a) == str, 'atlas %s is not a string' % repr(a)
+        assert type(s) in [tuple,list], 'sounds %s is not a list' % repr(s)
+        assert type(v) == int and v > 0, 'voices %s is not a positive int' % repr(v)
+        assert p is None or type(p) in [bool,str], 'profile %s is not a bool or file name' % repr(p)
         assert f > 0, 'fps %s is not positive' % repr(value)
         
         self._gwidth = w
@@ -320,6 +544,17 @@ class GameApp(kivy.app.App):
         Window.size = (self.width,self.height)
         
         self._fps = f
+        self.timestep = t
+        self.maxsteps = m
+        self._retained = r
+        self._atlas = a
+        self._soundfiles = tuple(s)
+        self._voices = v
+        self._profiler = None
+        self._profilefile = p if type(p) == str else None
+        if p:
+            from .gprofile import GProfiler
+            self._profiler = GProfiler(budget=t if t else 1.0/f)
         
         x = keywords.pop('left', None)
         y = keywords.pop('top', None)
@@ -358,6 +593,13 @@ class GameApp(kivy.app.App):
         from .gview import GInput, GView
         self._view = GView()
         self._view.size_hint = (1,1)
+        self._view.retained = self._retained
+        if not self._atlas is None:
+            GameApp.load_atlas(self._atlas)
+        from .sound import SoundPool
+        self._soundpool = SoundPool(self._voices)
+        for file in self._soundfiles:
+            self._soundpool[file] = file
         self._input = GInput()
         self._input._register(self._view)
         return self.view
@@ -383,6 +625,16 @@ class GameApp(kivy.app.App):
         kivy.app.App.stop(self)
         sys.exit(0)
     
+    def on_stop(self):
+        """
+        Saves the profile of the last frames, if the game was asked to.
+        
+        This is a Kivy reserved method.  It is part of the Kivy application process.  
+        It should **never** be overridden.
+        """
+        if not self._profilefile is None:
+            self._profiler.dump(self._profilefile)
+    
     def start(self):
         """
         Initializes the game state, creating a new game.
@@ -441,15 +693,67 @@ class GameApp(kivy.app.App):
         Processes a single animation frame.
         
         This method a callback-proxy for the methods `update` and `draw`.  It handles
-        important issues behind the scenes, particularly with clearing the window.
+        important issues behind the scenes, particularly with clearing the window. If
+        ``timestep`` is not None, it also divides the time into fixed steps.
         
         :param dt: time in seconds since last update
         :type dt:  ``int`` or ``float``
         """
+        profiler = self._profiler
+        if not profiler is None:
+            profiler.begin()
         self.view.clear()
-        self.update(dt)
+        if not profiler is None:
+            profiler.mark('clear')
+        if self._timestep is None:
+            self.update(dt)
+            if not profiler is None:
+                profiler.mark('update')
+            self._draw(profiler)
+            self.input.refresh()
+            if not profiler is None:
+                profiler.mark('input')
+                profiler.end(self.view,1)
+            return
+        
+        # Fixed step: refresh the input after every step so presses are only seen once
+        self._accumulator += dt
+        steps = 0
+        while self._accumulator >= self._timestep and steps < self._maxsteps:
+            self._accumulator -= self._timestep
+            self.update(self._timestep)
+            if not profiler is None:
+                profiler.mark('update')
+            self.input.refresh()
+            if not profiler is None:
+                profiler.mark('input')
+            steps += 1
+        if self._accumulator >= self._timestep:
+            # Too far behind to catch up; drop the extra time
+            self._accumulator = self._accumulator % self._timestep
+        self._alpha = self._accumulator/self._timestep
+        self._draw(profiler)
+        if not profiler is None:
+            profiler.end(self.view,steps)
+    
+    def _draw(self,profiler):
+        """
+        Draws the frame and commits it to the window.
+        
+        If the game is profiled, this also draws the profiler summary, and marks the
+        phases ``draw``, ``overlay`` and ``commit``.
+        
+        :param profiler: the frame profiler
+        :type profiler:  :class:`GProfiler` or None
+        """
         self.draw()
-        self.input.refresh()
+        if not profiler is None:
+            profiler.mark('draw')
+            profiler.draw(self.view)
+            profiler.mark('overlay')
+        self.view._commit()
+        if not profiler is None:
+            profiler.mark('commit')
     
     def _setpaths(self):
         """
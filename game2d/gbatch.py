@@ -0,0 +1,197 @@
+"""
+A module to support batched drawing of many images.
+
+Every GImage has its own graphics commands (a transform, a color, and a rectangle).
+That is fine for a few objects, but a game with dozens of cars and logs spends most
+of its drawing time on those commands.  A batch draws many images as a single mesh
+(one mesh per texture, so use an atlas to get just one) and moves all of them at once
+from arrays of positions.
+"""
+from kivy.graphics import *
+from kivy.graphics.instructions import *
+from .gobject import GObject, MESH_QUADS
+from .app import GameApp
+import numpy
+
+
+class GBatch(GObject):
+    """
+    An class representing many images drawn together
+
+    A batch has one image (a quad) for each file name in the attribute ``sources``.
+    Each quad is the size of its image, and is centered at its own position with its
+    own angle.  Those are not attributes of the quad. Instead, the method :meth:`place`
+    moves every quad at once from lists (or numpy arrays) of positions and angles.
+
+    Quads that share a texture are drawn with a single mesh.  Images in the same atlas
+    (see :meth:`GameApp.load_atlas`) share a texture, so a batch of atlas images is
+    one mesh no matter how many quads it has.
+
+    The batch itself is a :class:`GObject`, so the attributes ``x``, ``y``, ``angle``
+    and ``scale`` transform the whole batch.  However, the batch has no width or
+    height, so it does not support collisions (and a :class:`GScene` never culls it).
+
+    Quads can be culled: :meth:`place` can leave out every quad that is entirely
+    outside of a box, such as the part of the view that is on screen.
+    """
+    # IMMUTABLE PROPERTIES
+    @property
+    def sources(self):
+        """
+        The source file of each quad in this batch.
+
+        **invariant**. Value is a tuple of strings refering to valid files.
+        """
+        return self._sources
+
+    @property
+    def count(self):
+        """
+        The number of quads in this batch.
+
+        **invariant**. Value is an int >= 0.
+        """
+        return len(self._sources)
+
+    @property
+    def shown(self):
+        """
+        The number of quads drawn (those not culled by the last :meth:`place`).
+
+        **invariant**. Value is an int >= 0.
+        """
+        return sum(int(mask.sum()) for mask in self._shown)
+
+    # BUILT-IN METHODS
+    def __init__(self,**keywords):
+        """
+        Creates a new batch of images.
+
+        To use the constructor for this class, you should provide it with a list of
+        keyword arguments that initialize various attributes. For example, to draw two
+        cars and a truck, use the constructor::
+
+            GBatch(sources=['car1.png','car1.png','truck1.png'])
+
+        and then place them with the method :meth:`place`.  Until then, every quad is
+        centered at the origin.
+
+        This class supports the all same keywords as :class:`GObject`. The only new
+        keyword is ``sources``.
+
+        :param keywords: dictionary of keyword arguments
+        :type keywords:  keys are attribute names
+        """
+        self._defined = False
+        sources = keywords['sources'] if 'sources' in keywords else []
+        assert all(map(GameApp.is_image,sources)), '%s has an invalid image file' % repr(sources)
+        self._sources = tuple(sources)
+        GObject.__init__(self,**keywords)
+        self._reset()
+        self._defined = True
+
+    # PUBLIC METHODS
+    def place(self,xs,ys,angles=0,bounds=None):
+        """
+        Moves every quad in this batch.
+
+        The arguments are in the same order as ``sources``.  Angles are in degrees, and
+        may be a single number for every quad.
+
+        If ``bounds`` is not None, any quad that is entirely outside of it is left out
+        of the drawing until a later call to this method puts it back inside.  The box
+        is in the same coordinates as the positions, which are those of the view if the
+        batch is not moved.  The test uses the distance from the center of each quad
+        to its farthest corner, so it is the same at every angle.
+
+        :param xs: the horizontal center of each quad
+        :type xs:  list or numpy array of ``count`` numbers
+
+        :param ys: the vertical center of each quad (or a single number for all)
+        :type ys:  list or numpy array of ``count`` numbers, or ``int`` or ``float``
+
+        :param angles: the angle of each quad (or a single number for all)
+        :type angles:  list or numpy array of ``count`` numbers, or ``int`` or ``float``
+
+        :param bounds: the box (left,bottom,right,top) to cull quads against, or None
+        :type bounds:  4-element tuple of numbers, or ``None``
+        """
+        xs = numpy.asarray(xs,dtype=float)
+        ys = numpy.broadcast_to(numpy.asarray(ys,dtype=float),xs.shape)
+        rads = numpy.radians(numpy.broadcast_to(numpy.asarray(angles,dtype=float),xs.shape))
+        assert len(xs) == self.count, '%s does not have %d positions' % (repr(xs),self.count)
+        cos = numpy.cos(rads)[:,None]
+        sin = numpy.sin(rads)[:,None]
+        for pos in range(len(self._meshes)):
+            (mesh,pick,corners,verts,radius) = self._meshes[pos]
+            dx = corners[:,:,0]
+            dy = corners[:,:,1]
+            verts[:,:,0] = xs[pick,None]+dx*cos[pick]-dy*sin[pick]
+            verts[:,:,1] = ys[pick,None]+dx*sin[pick]+dy*cos[pick]
+            mesh.vertices = verts.ravel()
+            if bounds is None:
+                mask = numpy.ones(len(pick),dtype=bool)
+            else:
+                left, bottom, right, top = bounds
+                mask = (xs[pick]+radius >= left) & (xs[pick]-radius <= right) & \
+                       (ys[pick]+radius >= bottom) & (ys[pick]-radius <= top)
+            if not numpy.array_equal(mask,self._shown[pos]):
+                self._shown[pos] = mask
+                mesh.indices = self._indices(mask)
+
+    # HIDDEN METHODS
+    def _reset(self):
+        """
+        Resets the drawing cache.
+        """
+        GObject._reset(self)
+        textures = [GameApp.load_region(source) for source in self._sources]
+        groups = {}
+        for pos in range(len(textures)):
+            groups.setdefault(textures[pos].id,[]).append(pos)
+
+        if not self._fillcolor is None:
+            self._cache.add(self._fillcolor)
+        else:
+            self._cache.add(Color(1,1,1))
+
+        self._meshes = []
+        self._shown = []
+        for positions in groups.values():
+            for start in range(0,len(positions),MESH_QUADS):
+                pick = numpy.array(positions[start:start+MESH_QUADS])
+                size = len(pick)
+                corners = numpy.empty((size,4,2))
+                verts = numpy.zeros((size,4,4),dtype=numpy.float32)
+                for (row,pos) in enumerate(pick):
+                    texture = textures[pos]
+                    w = texture.width/2.0
+                    h = texture.height/2.0
+                    corners[row] = ((-w,-h),(w,-h),(w,h),(-w,h))
+                    verts[row,:,2:] = numpy.reshape(texture.tex_coords,(4,2))
+                verts[:,:,:2] = corners
+                radius = numpy.hypot(corners[:,:,0],corners[:,:,1]).max(axis=1)
+                mask = numpy.ones(size,dtype=bool)
+                mesh = Mesh(vertices=verts.ravel(),indices=self._indices(mask),\
+                            mode='triangles',texture=textures[pick[0]])
+                self._meshes.append((mesh,pick,corners,verts,radius))
+                self._shown.append(mask)
+                self._cache.add(mesh)
+
+        self._cache.add(PopMatrix())
+
+    def _indices(self,mask):
+        """
+        Returns: The mesh indices that draw the quads of a mesh with a True mask
+
+        :param mask: whether to draw each quad of the mesh
+        :type mask:  numpy array of ``bool``
+        """
+        quad = numpy.array([0,1,2,2,3,0])
+        return (numpy.flatnonzero(mask)[:,None]*4+quad).ravel().tolist()
+
+    def _extent(self):
+        """
+        Returns: None, as the quads can be anywhere
+        """
+        return None
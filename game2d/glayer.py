@@ -0,0 +1,130 @@
+"""
+A module to support backgrounds that are drawn only once.
+
+A game redraws everything every frame, even the parts that never change, such as the
+terrain behind the moving objects.  A layer draws objects that do not change into a
+texture (with a Kivy ``Fbo``) once, and after that draws the texture as a single
+rectangle.
+"""
+from kivy.graphics import *
+from kivy.graphics.instructions import *
+from .gobject import GObject, is_gobject_list
+
+
+class GLayer(GObject):
+    """
+    An class representing objects baked into a single image.
+
+    A layer is like a small window of its own.  Its children are drawn in a box of
+    ``width`` by ``height`` pixels, with (0,0) at the bottom left corner of the box, and
+    anything outside of the box is cut off.  The box is then drawn centered at (x,y),
+    like a :class:`GImage`.
+
+    The children are only drawn when the layer is made, when the attribute ``children``
+    changes, or when :meth:`bake` is called.  Changing a child after that has no effect
+    until the layer is baked again, so only put objects that do not change in a layer.
+
+    A layer is a texture the size of the box.  If the box is larger than the biggest
+    texture the graphics card supports, the layer draws its children every frame
+    instead (like a :class:`GScene`), which looks the same but is not any faster.
+    """
+
+    # MUTABLE PROPERTIES
+    @property
+    def children(self):
+        """
+        The list of objects baked into this layer.
+
+        The objects are drawn as if the bottom left corner of the layer is the origin.
+
+        **invariant**: Value must be a list or tuple of :class:`GObject` (possibly empty)
+        """
+        return tuple(self._children)
+
+    @children.setter
+    def children(self,value):
+        assert is_gobject_list(value), '%s is not a list of valid objects' % repr(value)
+        self._children = list(value)
+        if self._defined:
+            self._reset()
+
+    @property
+    def baked(self):
+        """
+        Whether the children are baked into a texture.
+
+        This is False only if the layer is too large for a texture.
+
+        **invariant**: Value must be a ``bool``
+        """
+        return not self._fbo is None
+
+    # BUILT-IN METHODS
+    def __init__(self,**keywords):
+        """
+        Creates a new layer.
+
+        To use the constructor for this class, you should provide it with a list of
+        keyword arguments that initialize various attributes. For example, to bake the
+        terrain of a 640x480 window, use the constructor::
+
+            GLayer(x=320,y=240,width=640,height=480,children=[grass,road])
+
+        This class supports the same keywords as :class:`GObject`.  However, the
+        attributes `width` and `height` are **required** (so that the object knows how
+        large a texture to make).  Leaving out these values will cause a `ValueError`.
+
+        :param keywords: dictionary of keyword arguments
+        :type keywords:  keys are attribute names, including 'width' and 'height'
+        """
+        self._defined = False
+        if not 'width' in keywords:
+            raise ValueError("The 'width' argument must be specified.")
+        if not 'height' in keywords:
+            raise ValueError("The 'height' argument must be specified.")
+        self.children = keywords['children'] if 'children' in keywords else []
+        self._fbo = None
+        GObject.__init__(self,**keywords)
+        self._reset()
+        self._defined = True
+
+    # PUBLIC METHODS
+    def bake(self):
+        """
+        Draws the children into the texture of this layer again.
+
+        Call this method after changing a child.
+        """
+        if self._fbo is None:
+            return
+        self._fbo.clear()
+        with self._fbo:
+            ClearColor(0,0,0,0)
+            ClearBuffers()
+        for x in self._children:
+            self._fbo.add(x._cache)
+        self._fbo.draw()
+
+    # HIDDEN METHODS
+    def _reset(self):
+        """
+        Resets the drawing cache.
+        """
+        GObject._reset(self)
+        x = -self.width/2.0
+        y = -self.height/2.0
+        size = (int(round(self.width)),int(round(self.height)))
+
+        from kivy.graphics.opengl import glGetIntegerv, GL_MAX_TEXTURE_SIZE
+        if max(size) <= glGetIntegerv(GL_MAX_TEXTURE_SIZE)[0]:
+            self._fbo = Fbo(size=size)
+            self.bake()
+            self._cache.add(Color(1,1,1))
+            self._cache.add(Rectangle(pos=(x,y),size=(self.width,self.height),\
+                                      texture=self._fbo.texture))
+        else:
+            self._fbo = None
+            self._cache.add(Translate(x,y))
+            for child in self._children:
+                self._cache.add(child._cache)
+        self._cache.add(PopMatrix())
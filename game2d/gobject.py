@@ -11,6 +11,10 @@ Date:   November 1, 2020
 from kivy.graphics import *
 from kivy.graphics.instructions import *
 from introcs.geom import Point2, Matrix
+import math
+
+# The most quads in one mesh (mesh indices must fit in 16 bits)
+MESH_QUADS = 16383
 
 
 def is_color(c):
@@ -104,8 +108,9 @@ class GObject(object):
     @x.setter
     def x(self,value):
         assert type(value) in [int,float], '%s is not a number' % repr(value)
-        self._trans.x = float(value)
-        self._mtrue = False
+        if self._trans.x != value:
+            self._trans.x = float(value)
+            self._mtrue = False
 
     @property
     def y(self):
@@ -119,8 +124,9 @@ class GObject(object):
     @y.setter
     def y(self,value):
         assert type(value) in [int,float], '%s is not a number' % repr(value)
-        self._trans.y = float(value)
-        self._mtrue = False
+        if self._trans.y != value:
+            self._trans.y = float(value)
+            self._mtrue = False
 
     @property
     def width(self):
@@ -188,12 +194,13 @@ class GObject(object):
             self._hitbox = None
             return
 
-        try:
-            size = len(value)
-        except:
-            size = 0
-        assert size == 4, '%s is not a tuple or list of size 4' % repr(value)
-        assert all(map(lambda x : type(x) in [int,float], value)), '%s has non-numerical elements' % repr(value)
+        if __debug__:
+            try:
+                size = len(value)
+            except:
+                size = 0
+            assert size == 4, '%s is not a tuple or list of size 4' % repr(value)
+            assert all(map(lambda x : type(x) in [int,float], value)), '%s has non-numerical elements' % repr(value)
         self._hitbox = tuple(value)
 
     @property
@@ -219,12 +226,11 @@ class GObject(object):
         assert type(value) in [int,float] or is_num_tuple(value,2), \
                 '%s is not a valid scaling factor' % repr(value)
         if type(value) in [int,float]:
-            self._scale.x = float(value)
-            self._scale.y = float(value)
-        else:
+            value = (value,value)
+        if (self._scale.x,self._scale.y) != tuple(value):
             self._scale.x = float(value[0])
             self._scale.y = float(value[1])
-        self._mtrue = False
+            self._mtrue = False
 
     @property
     def angle(self):
@@ -239,11 +245,9 @@ class GObject(object):
 
     @angle.setter
     def angle(self,value):
-        import numpy as np
         assert type(value) in [int,float], '%s is not a number' % repr(value)
-        diff = np.allclose([self._rotate.angle],[value])
-        self._rotate.angle = float(value)
-        if not diff:
+        if self._rotate.angle != value:
+            self._rotate.angle = float(value)
             self._mtrue = False
 
     @property
@@ -365,11 +369,7 @@ class GObject(object):
         elif (self._rotate.angle % 360) == 270:
             return self.x-self.height/2.0+self._hitbox[1]
 
-        p0 = tuple(self.matrix._transform(-self.width/2.0+self._hitbox[0], -self.height/2.0+self._hitbox[3]))[0]
-        p1 = tuple(self.matrix._transform( self.width/2.0+self._hitbox[2], -self.height/2.0+self._hitbox[3]))[0]
-        p2 = tuple(self.matrix._transform( self.width/2.0+self._hitbox[2],  self.height/2.0+self._hitbox[1]))[0]
-        p3 = tuple(self.matrix._transform(-self.width/2.0+self._hitbox[0],  self.height/2.0+self._hitbox[1]))[0]
-        return min(p0,p1,p2,p3)
+        return min(self._edges()[0])
 
     @left.setter
     def left(self,value):
@@ -402,11 +402,7 @@ class GObject(object):
         elif (self._rotate.angle % 360) == 270:
             return self.x+self.height/2.0-self._hitbox[3]
 
-        p0 = tuple(self.matrix._transform(-self.width/2.0+self._hitbox[0], -self.height/2.0+self._hitbox[3]))[0]
-        p1 = tuple(self.matrix._transform( self.width/2.0+self._hitbox[2], -self.height/2.0+self._hitbox[3]))[0]
-        p2 = tuple(self.matrix._transform( self.width/2.0+self._hitbox[2],  self.height/2.0+self._hitbox[1]))[0]
-        p3 = tuple(self.matrix._transform(-self.width/2.0+self._hitbox[0],  self.height/2.0+self._hitbox[1]))[0]
-        return max(p0,p1,p2,p3)
+        return max(self._edges()[0])
 
     @right.setter
     def right(self,value):
@@ -439,11 +435,7 @@ class GObject(object):
         elif (self._rotate.angle % 360) == 270:
             return self.y+self.width/2.0-self._hitbox[2]
 
-        p0 = tuple(self.matrix._transform(-self.width/2.0+self._hitbox[0], -self.height/2.0+self._hitbox[3]))[1]
-        p1 = tuple(self.matrix._transform( self.width/2.0+self._hitbox[2], -self.height/2.0+self._hitbox[3]))[1]
-        p2 = tuple(self.matrix._transform( self.width/2.0+self._hitbox[2],  self.height/2.0+self._hitbox[1]))[1]
-        p3 = tuple(self.matrix._transform(-self.width/2.0+self._hitbox[0],  self.height/2.0+self._hitbox[1]))[1]
-        return max(p0,p1,p2,p3)
+        return max(self._edges()[1])
 
     @top.setter
     def top(self,value):
@@ -476,11 +468,7 @@ class GObject(object):
         elif (self._rotate.angle % 360) == 270:
             return self.y-self.width/2.0+self._hitbox[0]
 
-        p0 = tuple(self.matrix._transform(-self.width/2.0+self._hitbox[0], -self.height/2.0+self._hitbox[3]))[1]
-        p1 = tuple(self.matrix._transform( self.width/2.0+self._hitbox[2], -self.height/2.0+self._hitbox[3]))[1]
-        p2 = tuple(self.matrix._transform( self.width/2.0+self._hitbox[2],  self.height/2.0+self._hitbox[1]))[1]
-        p3 = tuple(self.matrix._transform(-self.width/2.0+self._hitbox[0],  self.height/2.0+self._hitbox[1]))[1]
-        return min(p0,p1,p2,p3)
+        return min(self._edges()[1])
 
 
     @bottom.setter
@@ -497,12 +485,13 @@ class GObject(object):
         The transformation matrix for this object
 
         This value is constructed dynamically as needed.  It should only be used
-        internally in this package
+        internally in this package.  The methods in this package use the faster
+        :meth:`_forward` and :meth:`_backward` instead.
 
         **invariant**: Either a :class:`Matrix` or ``None``
         """
         if not self._mtrue or self._matrix is None:
-            self._build_matrix()
+            self._build_matrices()
         return self._matrix
 
     @property
@@ -516,7 +505,7 @@ class GObject(object):
         **invariant**: Either a :class:`Matrix` or ``None``
         """
         if not self._mtrue or self._matrix is None:
-            self._build_matrix()
+            self._build_matrices()
         return self._invrse
 
 
@@ -546,6 +535,7 @@ class GObject(object):
 
         # Create the Kivy transforms for position and size
         self._mtrue  = False
+        self._matrix = None
         self._trans  = Translate(0,0,0)
         self._rotate = Rotate(angle=0,axis=(0,0,1))
         self._scale  = Scale(1,1,1)
@@ -633,13 +623,12 @@ class GObject(object):
             isy = b1 <= b0 <= t1 or b0 <= b1 <= t0
             return isx and isy
 
-        comp = obj.matrix*self.matrix.inverse()
         w = obj.width/2.0
         h = obj.height/2.0
-        p0 = tuple(comp._transform(-w+h2[0], h-h2[1]))
-        p1 = tuple(comp._transform( w-h2[2], h-h2[1]))
-        p2 = tuple(comp._transform( w-h2[2],-h+h2[3]))
-        p3 = tuple(comp._transform(-w+h2[0],-h+h2[3]))
+        p0 = self._backward(*obj._forward(-w+h2[0], h-h2[1]))
+        p1 = self._backward(*obj._forward( w-h2[2], h-h2[1]))
+        p2 = self._backward(*obj._forward( w-h2[2],-h+h2[3]))
+        p3 = self._backward(*obj._forward(-w+h2[0],-h+h2[3]))
 
         sides = ((p0,p1),(p1,p2),(p2,p3),(p3,p0))
         l1 = -self.width/2.0  + h1[0]
@@ -682,7 +671,7 @@ class GObject(object):
             return l <= point[0] <= r and b <= point[1] <= t
 
         # Transform this to the right space.
-        point = tuple(self.matrix.inverse()._transform(point[0],point[1]))
+        point = self._backward(point[0],point[1])
         w = self.width/2.0
         h = self.height/2.0
         isx = - w + self._hitbox[0] <= point[0] <= w - self._hitbox[2]
@@ -705,11 +694,10 @@ class GObject(object):
         :rtype:  :class:`Point2`
         """
         if isinstance(point,Point2):
-            return self.inverse.transform(point)
-        else:
-            assert is_num_tuple(point,2), "%s is not a valid point" % repr(point)
-            p = self.inverse._transform(point[0],point[2])
-            return Point2(p[0],p[1])
+            point = (point.x,point.y)
+        assert is_num_tuple(point,2), "%s is not a valid point" % repr(point)
+        p = self._backward(point[0],point[1])
+        return Point2(p[0],p[1])
 
     def draw(self, view):
         """
@@ -738,8 +726,30 @@ class GObject(object):
 
     def _build_matrix(self):
         """
-        Builds the transform matrices after a settings change.
+        Builds the transforms after a settings change.
+
+        Each transform is stored as six floats (a,b,c,d,e,f), which map the point
+        (x,y) to (a*x+b*y+c,d*x+e*y+f).  The :class:`Matrix` objects of the attributes
+        ``matrix`` and ``inverse`` are only made if they are used.
+        """
+        rads = math.radians(self._rotate.angle)
+        cos = math.cos(rads)
+        sin = math.sin(rads)
+        sx = self._scale.x
+        sy = self._scale.y
+        tx = self._trans.x
+        ty = self._trans.y
+        self._affine = (sx*cos,-sy*sin,tx,sx*sin,sy*cos,ty)
+        self._invaff = (cos/sx,sin/sx,-(cos*tx+sin*ty)/sx,-sin/sy,cos/sy,(sin*tx-cos*ty)/sy)
+        self._matrix = None
+        self._mtrue = True
+
+    def _build_matrices(self):
+        """
+        Builds the :class:`Matrix` objects for the attributes ``matrix`` and ``inverse``.
         """
+        if not self._mtrue:
+            self._build_matrix()
         self._matrix = Matrix()
         self._matrix.scale(self._scale.x,self._scale.y)
         self._matrix.rotate(self._rotate.angle)
@@ -748,7 +758,97 @@ class GObject(object):
         self._invrse.translate(-self._trans.x,-self._trans.y)
         self._invrse.rotate(-self._rotate.angle)
         self._invrse.scale(1.0/self._scale.x,1.0/self._scale.y)
-        self._mtrue = True
+
+    def _forward(self,x,y):
+        """
+        Returns: The point (x,y) transformed from this object's space to the view
+
+        The coordinates may be numbers or numpy arrays (to transform many points at
+        once).
+
+        :param x: the horizontal coordinate(s)
+        :type x:  ``int``, ``float`` or numpy array
+
+        :param y: the vertical coordinate(s)
+        :type y:  ``int``, ``float`` or numpy array
+        """
+        if not self._mtrue:
+            self._build_matrix()
+        m = self._affine
+        return (m[0]*x+m[1]*y+m[2],m[3]*x+m[4]*y+m[5])
+
+    def _backward(self,x,y):
+        """
+        Returns: The point (x,y) transformed from the view to this object's space
+
+        The coordinates may be numbers or numpy arrays (to transform many points at
+        once).
+
+        :param x: the horizontal coordinate(s)
+        :type x:  ``int``, ``float`` or numpy array
+
+        :param y: the vertical coordinate(s)
+        :type y:  ``int``, ``float`` or numpy array
+        """
+        if not self._mtrue:
+            self._build_matrix()
+        m = self._invaff
+        return (m[0]*x+m[1]*y+m[2],m[3]*x+m[4]*y+m[5])
+
+    def _edges(self):
+        """
+        Returns: The x and y coordinates of the corners used for the rotated edges
+
+        The result is a pair of 4-element tuples, for the attributes ``left``, ``right``,
+        ``top`` and ``bottom`` of a rotated object.
+        """
+        w = self.width/2.0
+        h = self.height/2.0
+        hit = self._hitbox
+        p0 = self._forward(-w+hit[0],-h+hit[3])
+        p1 = self._forward( w+hit[2],-h+hit[3])
+        p2 = self._forward( w+hit[2], h+hit[1])
+        p3 = self._forward(-w+hit[0], h+hit[1])
+        return ((p0[0],p1[0],p2[0],p3[0]),(p0[1],p1[1],p2[1],p3[1]))
+
+    def _extent(self):
+        """
+        Computes the box around everything this object draws
+
+        Unlike :meth:`_bbox`, this ignores the hitbox, and works at any angle.  The box
+        is in the coordinates that (x,y) are in: the view, or the scene holding this
+        object.  It is returned as a tuple (l,t,r,b), or None if it is not known.
+
+        :return: The box around the drawing
+        :rtype:  ``tuple`` of four ``float`` values, or ``None``
+        """
+        w = self.width/2.0
+        h = self.height/2.0
+        return self._around((-w,w,w,-w),(-h,-h,h,h))
+
+    def _around(self,xs,ys):
+        """
+        Computes the box around some points of this object
+
+        The points are in this object's space, and the box (l,t,r,b) is in the
+        coordinates that (x,y) are in.
+
+        :param xs: the horizontal coordinates
+        :type xs:  ``tuple`` of numbers
+
+        :param ys: the vertical coordinates
+        :type ys:  ``tuple`` of numbers
+
+        :return: The box around the transformed points
+        :rtype:  ``tuple`` of four ``float`` values
+        """
+        px = []
+        py = []
+        for (x,y) in zip(xs,ys):
+            p = self._forward(x,y)
+            px.append(p[0])
+            py.append(p[1])
+        return (min(px),max(py),max(px),min(py))
 
     def _bbox(self):
         """
@@ -785,13 +885,12 @@ class GObject(object):
             r = self.x - hit[1] + h
             l = self.x + hit[3] - h
         else:
-            comp = self.matrix
             w = self.width/2.0
             h = self.height/2.0
-            p0 = tuple(comp._transform(-w+hit[0], h-hit[1]))
-            p1 = tuple(comp._transform( w-hit[2], h-hit[1]))
-            p2 = tuple(comp._transform( w-hit[2],-h+hit[3]))
-            p3 = tuple(comp._transform(-w+hit[0],-h+hit[3]))
+            p0 = self._forward(-w+hit[0], h-hit[1])
+            p1 = self._forward( w-hit[2], h-hit[1])
+            p2 = self._forward( w-hit[2],-h+hit[3])
+            p3 = self._forward(-w+hit[0],-h+hit[3])
 
             l = min(p0[0],p1[0],p2[0],p3[0])
             r = max(p0[0],p1[0],p2[0],p3[0])
@@ -818,6 +917,10 @@ class GScene(GObject):
     read-only.  These values are computed from the list of objects stored in the scene.
 
     All objects stored in a ``GScene`` are drawn as if the point (x,y) is the origin.
+
+    A scene can leave out any child that is entirely outside of the view when it is
+    drawn (see the attribute ``cull``).  This is off by default.  Culled children are
+    still in the scene, and are drawn again as soon as they move back into the view.
     """
 
     # MUTABLE PROPERTIES
@@ -840,6 +943,27 @@ class GScene(GObject):
         if self._defined:
             self._reset()
 
+    @property
+    def cull(self):
+        """
+        Whether to leave out the children that are outside of the view.
+
+        Culling is checked when this scene is drawn to the view, so it only applies to
+        the scene at the top of a scene graph.  Scenes inside of it are culled as a
+        whole.  It is off by default, which draws every child.  Only turn it on if the
+        children are not transformed by anything but this scene.
+
+        **invariant**: Value must be a ``bool``
+        """
+        return self._cull
+
+    @cull.setter
+    def cull(self,value):
+        assert type(value) == bool, '%s is not a bool' % repr(value)
+        self._cull = value
+        if self._defined and not value:
+            self._show(self._children)
+
 
     # IMMUTABLE PROPERTIES
     @property
@@ -896,12 +1020,31 @@ class GScene(GObject):
         """
         self._defined = False
         self.children = keywords['children'] if 'children' in keywords else []
+        self.cull = keywords['cull'] if 'cull' in keywords else False
         GObject.__init__(self,**keywords)
         self._reset()
         self._defined = True
 
 
     # PUBLIC METHODS
+    def draw(self, view):
+        """
+        Draws this scene in the provided view.
+
+        If ``cull`` is True, the children that are entirely outside of the view are
+        left out.  The scene only changes its drawing when a child comes into or goes
+        out of view.
+
+        :param view: view to draw to
+        :type view:  :class:`GView`
+        """
+        if self._cull:
+            shown = [child for child in self._children if self._onscreen(child,view)]
+            if len(shown) != len(self._shown) or \
+            any(a is not b for (a,b) in zip(shown,self._shown)):
+                self._show(shown)
+        GObject.draw(self,view)
+
     def select(self,point):
         """
         Selects the child selected by the given point.
@@ -937,6 +1080,59 @@ class GScene(GObject):
         Resets the drawing cache
         """
         GObject._reset(self)
-        for x in self.children:
+        self._show(self._children)
+
+    def _show(self,children):
+        """
+        Fills the drawing cache with the given children
+
+        The cache stays the same object, so that a retained view does not see a new
+        command.
+
+        :param children: the children to draw
+        :type children:  ``list`` of :class:`GObject`
+        """
+        self._shown = list(children)
+        self._cache.clear()
+        self._cache.add(PushMatrix())
+        self._cache.add(self._trans)
+        self._cache.add(self._rotate)
+        self._cache.add(self._scale)
+        for x in self._shown:
             self._cache.add(x._cache)
         self._cache.add(PopMatrix())
+
+    def _extent(self):
+        """
+        Computes the box around everything this scene draws
+
+        This is the box around the boxes of every child, or None if one of them is not
+        known.
+
+        :return: The box around the drawing
+        :rtype:  ``tuple`` of four ``float`` values, or ``None``
+        """
+        boxes = [x._extent() for x in self._children]
+        if not boxes or None in boxes:
+            return None
+        l = min(box[0] for box in boxes)
+        t = max(box[1] for box in boxes)
+        r = max(box[2] for box in boxes)
+        b = min(box[3] for box in boxes)
+        return self._around((l,r,r,l),(b,b,t,t))
+
+    def _onscreen(self,child,view):
+        """
+        Returns: True if any of the child might be inside the view
+
+        :param child: the child to check
+        :type child:  :class:`GObject`
+
+        :param view: the view this scene is drawn to
+        :type view:  :class:`GView`
+        """
+        box = child._extent()
+        if box is None:
+            return True
+        l, t, r, b = self._around((box[0],box[2],box[2],box[0]),(box[3],box[3],box[1],box[1]))
+        return r >= 0 and l <= view.width and t >= 0 and b <= view.height
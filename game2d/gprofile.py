@@ -0,0 +1,294 @@
+"""
+A module to support timing the frames of a game.
+
+A :class:`GProfiler` records how long each part of every animation frame takes: the
+phases of :class:`GameApp` (clearing the view, updating, drawing, and so on) and the
+methods ``update`` and ``draw`` of any object registered with it.  It keeps the last
+few hundred frames, which can be shown on top of the game or saved to a file.
+
+A game does not make a profiler itself.  Give the game the keyword ``profile`` (see
+:class:`GameApp`) and use the attribute ``profiler``.
+"""
+from time import perf_counter
+import collections
+import json
+import csv
+
+
+class GProfiler(object):
+    """
+    A class recording the time spent in each part of the last few frames.
+
+    Each frame is a dictionary (a record) with these keys:
+
+        ``frame``: the number of the frame (starting from 0)
+        ``total``: the time of the whole frame
+        ``steps``: the number of times ``update`` was called
+        ``commands``: the number of graphics commands drawn to the view
+        ``instructions``: the number of Kivy instructions in those commands
+
+    and a key for each phase of the frame (``clear``, ``update``, ``input``, ``draw``,
+    ``overlay``, and ``commit``), and for each method of a registered object that ran
+    that frame (such as ``level.draw``).  Times are in milliseconds.  A method of a
+    registered object includes any registered objects that it calls, so its time
+    overlaps theirs.
+
+    Only the last ``size`` records are kept.  The profiler can draw a summary of them
+    on top of the game (see :meth:`draw`), and save them to a CSV or JSON file (see
+    :meth:`dump`).
+    """
+    # The phases of a frame, in the order they happen
+    PHASES = ('clear','update','input','draw','overlay','commit')
+
+    # MUTABLE PROPERTIES
+    @property
+    def visible(self):
+        """
+        Whether to draw the summary on top of the game.
+
+        **invariant**. Value is a ``bool``.
+        """
+        return self._visible
+
+    @visible.setter
+    def visible(self,value):
+        assert type(value) == bool, 'value %s is not a bool' % repr(value)
+        self._visible = value
+
+    @property
+    def budget(self):
+        """
+        The time in seconds a frame should take.
+
+        The summary is drawn in red when the average frame takes longer than this.
+
+        **invariant**. Value is an ``int`` or ``float`` > 0.
+        """
+        return self._budget
+
+    @budget.setter
+    def budget(self,value):
+        assert type(value) in [int,float] and value > 0, 'value %s is not a positive number' % repr(value)
+        self._budget = value
+
+    # IMMUTABLE PROPERTIES
+    @property
+    def size(self):
+        """
+        The number of frames kept.
+
+        **invariant**. Value is an ``int`` > 0.
+        """
+        return self._records.maxlen
+
+    @property
+    def records(self):
+        """
+        The records of the frames kept, oldest first.
+
+        **invariant**. Value is a list of dictionaries (see the class description).
+        """
+        return list(self._records)
+
+    # BUILT-IN METHODS
+    def __init__(self,size=600,budget=1/60.0):
+        """
+        Creates a new profiler with no records.
+
+        :param size: The number of frames to keep
+        :type size:  ``int`` > 0
+
+        :param budget: The time in seconds a frame should take
+        :type budget:  ``int`` or ``float`` > 0
+        """
+        assert type(size) == int and size > 0, 'size %s is not a positive int' % repr(size)
+        self._records = collections.deque(maxlen=size)
+        self._count = 0
+        self._record = None
+        self._start = 0
+        self._last = 0
+        self._text = None
+        self.budget = budget
+        self.visible = True
+
+    # PUBLIC METHODS
+    def register(self,obj,name):
+        """
+        Times the methods ``update`` and ``draw`` of the given object.
+
+        Each method is replaced, in this object only, by one that records its time
+        under ``name.update`` or ``name.draw``.  Registering an object again (or a new
+        object with the same name) is fine.
+
+        :param obj: The object to time
+        :type obj:  any object with a method ``update`` or ``draw``
+
+        :param name: The name of the object in the records
+        :type name:  ``str``
+        """
+        assert type(name) == str, 'name %s is not a string' % repr(name)
+        for method in ('update','draw'):
+            if hasattr(obj,method):
+                setattr(obj,method,self._timed(getattr(obj,method),name+'.'+method))
+
+    def begin(self):
+        """
+        Starts the record of a new frame.
+
+        This is called for you by :class:`GameApp` at the start of each frame.
+        """
+        self._start = self._last = perf_counter()
+        self._record = {'frame':self._count,'total':0.0,'steps':0,\
+                        'commands':0,'instructions':0}
+        self._count += 1
+
+    def mark(self,phase):
+        """
+        Adds the time since the last mark (or the start of the frame) to a phase.
+
+        This is called for you by :class:`GameApp` after each phase of a frame.  A
+        phase can be marked more than once in a frame (like ``update``, which happens
+        once for every step), and the times add up.
+
+        :param phase: The phase that just finished
+        :type phase:  ``str``
+        """
+        now = perf_counter()
+        self._add(phase,now-self._last)
+        self._last = now
+
+    def end(self,view,steps):
+        """
+        Finishes the record of the current frame.
+
+        This is called for you by :class:`GameApp` at the end of each frame.
+
+        :param view: The view the frame was drawn to
+        :type view:  :class:`GView`
+
+        :param steps: The number of times ``update`` was called this frame
+        :type steps:  ``int`` >= 0
+        """
+        record = self._record
+        record['total'] = (perf_counter()-self._start)*1000
+        record['steps'] = steps
+        record['commands'] = len(view._contents)
+        record['instructions'] = sum(len(getattr(cmd,'children',())) or 1 for cmd in view._contents)
+        self._records.append(record)
+        self._record = None
+
+    def draw(self,view,every=30):
+        """
+        Draws the average of the recent frames on top of the view.
+
+        The summary is the average time of a frame, its phases, and the slowest
+        methods of the registered objects.  It only changes every ``every`` frames, so
+        that it can be read (and so that it is cheap to draw).
+
+        :param view: The view to draw to
+        :type view:  :class:`GView`
+
+        :param every: The number of frames between changes to the summary
+        :type every:  ``int`` > 0
+        """
+        if not self._visible:
+            return
+        from .gtext import GText
+        if self._text is None:
+            self._text = GText(font_size=12)
+        if self._records and (self._text.text == '' or self._count % every == 0):
+            self._text.text = self._summary(list(self._records)[-every:])
+            slow = self._average(list(self._records)[-every:],'total') > self._budget*1000
+            self._text.linecolor = (1,0,0,1) if slow else (0,0,0,1)
+            self._text.left = 4
+            self._text.top = view.height-4
+        self._text.draw(view)
+
+    def dump(self,filename):
+        """
+        Saves the records to a file.
+
+        The file is CSV, with a column for each key, if the name ends in ``.csv``.
+        Otherwise it is a JSON list of the records.  A method of a registered object
+        that did not run in a frame is empty (CSV) or missing (JSON) in its record.
+
+        :param filename: The file to write
+        :type filename:  ``str``
+        """
+        records = list(self._records)
+        if filename[-4:].lower() != '.csv':
+            with open(filename,'w') as file:
+                json.dump(records,file,indent=1)
+            return
+
+        keys = []
+        for record in records:
+            keys.extend(key for key in record if not key in keys)
+        with open(filename,'w',newline='') as file:
+            writer = csv.DictWriter(file,fieldnames=keys)
+            writer.writeheader()
+            writer.writerows(records)
+
+    # HIDDEN METHODS
+    def _add(self,key,seconds):
+        """
+        Adds a time to the current record (if there is one).
+
+        :param key: The phase or method
+        :type key:  ``str``
+
+        :param seconds: The time to add
+        :type seconds:  ``float``
+        """
+        if not self._record is None:
+            self._record[key] = self._record.get(key,0.0)+seconds*1000
+
+    def _timed(self,method,key):
+        """
+        Returns: A function that calls method and records its time under key
+
+        :param method: The method to time
+        :type method:  bound method
+
+        :param key: The key of the method in the records
+        :type key:  ``str``
+        """
+        # Registering again would time the timer, so time the original method
+        method = getattr(method,'_untimed',method)
+        def timed(*args,**keywords):
+            start = perf_counter()
+            try:
+                return method(*args,**keywords)
+            finally:
+                self._add(key,perf_counter()-start)
+        timed._untimed = method
+        return timed
+
+    def _average(self,records,key):
+        """
+        Returns: The average of key over the records (0 if it is missing)
+
+        :param records: The records to average
+        :type records:  non-empty list of dictionaries
+
+        :param key: The key to average
+        :type key:  ``str``
+        """
+        return sum(record.get(key,0.0) for record in records)/len(records)
+
+    def _summary(self,records):
+        """
+        Returns: The text of the summary of the given records
+
+        :param records: The records to summarize
+        :type records:  non-empty list of dictionaries
+        """
+        lines = ['frame %6.2f ms  (%d commands, %d instructions)' % \
+                 (self._average(records,'total'),records[-1]['commands'],records[-1]['instructions'])]
+        lines.append('  '.join('%s %.2f' % (phase,self._average(records,phase)) \
+                     for phase in GProfiler.PHASES))
+        methods = set(key for record in records for key in record if '.' in key)
+        times = sorted(((self._average(records,key),key) for key in methods),reverse=True)
+        for (time,key) in times[:5]:
+            lines.append('%s %.2f' % (key,time))
+        return '\n'.join(lines)
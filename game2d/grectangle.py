@@ -12,7 +12,9 @@ from kivy.graphics import *
 from kivy.graphics.instructions import *
 from kivy.uix.label import Label
 from kivy.uix.image import Image
-from .gobject import GObject
+from introcs.geom import Point2
+from .gobject import GObject, is_num_tuple
+from .gtext import GText
 from .app import GameApp
 
 class GRectangle(GObject):
@@ -142,9 +144,9 @@ class GEllipse(GRectangle):
         **Warning**: Using this method on a rotated object may slow down your framerate.
         
         :param point: the point to check
-        :type point: :class:`GPoint`` or a pair of numbers
+        :type point: :class:`Point2`` or a pair of numbers
         """
-        if isinstance(point,GPoint):
+        if isinstance(point,Point2):
             point = (point.x,point.y)
         assert is_num_tuple(point,2), "%s is not a valid point" % repr(point)
         
@@ -154,7 +156,7 @@ class GEllipse(GRectangle):
             dx = (point[0]-self.x)*(point[0]-self.x)/(rx*rx)
             dy = (point[1]-self.y)*(point[1]-self.y)/(ry*ry)
         else:
-            p = self.matrix.inverse()._transform(point[0],point[1])
+            p = self._backward(point[0],point[1])
             dx = p[0]*p[0]/(rx*rx)
             dy = p[1]*p[1]/(ry*ry)
         
@@ -255,7 +257,7 @@ class GImage(GRectangle):
         """
         GObject._reset(self)
         
-        self._texture = GameApp.load_texture(self.source)
+        self._texture = GameApp.load_region(self.source)
         if not self._texture is None and (self.width == 0 or self.height == 0):
                 self.width  = self._texture.width
                 self.height = self._texture.height
@@ -300,7 +302,11 @@ class GLabel(GRectangle):
     to the font by filename, including the .ttf. If you give no name, it will use the 
     default Kivy font.  The `bold` attribute only works for the default Kivy font; for 
     other fonts you will need the .ttf file for the bold version of that font.  See the
-    provided `ComicSans.ttf` and `ComicSansBold.ttf` for an example."""
+    provided `ComicSans.ttf` and `ComicSansBold.ttf` for an example.
+    
+    Normally the whole text is rendered to a new texture whenever the text or the font
+    changes.  For text that changes often, like a score or a timer, set the attribute
+    `glyphs` to draw the text from a glyph atlas instead."""
     
     # MUTABLE PROPERTIES
     @property
@@ -315,8 +321,12 @@ class GLabel(GRectangle):
     def font_size(self,value):
         assert type(value) in [int,float], 'value %s is not a number' % repr(value)
         self._fsize = value
-        self._label.font_size = value
-        self._label.texture_update()
+        if self._glyph is None:
+            self._label.font_size = value
+            self._label.texture_update()
+        else:
+            self._glyph.font_size = value
+            self._reset()
     
     @property
     def font_name(self):
@@ -324,14 +334,19 @@ class GLabel(GRectangle):
         The file name for the .ttf file to use as a font
         
         **Invariant**: Must be a string referring to a .ttf file in folder Fonts"""
-        return self._label.font_name
+        return self._label.font_name if self._fname is None else self._fname
     
     @font_name.setter
     def font_name(self,value):
         from .app import GameApp
         assert GameApp.is_font(value), 'value %s is not a font name' % repr(value)
-        self._label.font_name = value
-        self._label.texture_update()
+        self._fname = value
+        if self._glyph is None:
+            self._label.font_name = value
+            self._label.texture_update()
+        else:
+            self._glyph.font_name = value
+            self._reset()
     
     @property
     def bold(self):
@@ -349,7 +364,35 @@ class GLabel(GRectangle):
     def bold(self,value):
         assert type(value) == bool, repr(value)+' is not a bool'
         self._label.bold = value
-        self._label.texture_update()
+        if self._defined:
+            self._switch()
+        if self._glyph is None:
+            self._label.texture_update()
+    
+    @property
+    def glyphs(self):
+        """
+        A boolean indicating whether to draw the text from a glyph atlas.
+        
+        A label normally renders its whole text to a texture every time the text or the
+        font changes.  With this attribute True, each character of a font and size is
+        rendered only once, into a :class:`GlyphAtlas` shared by every label using that
+        font, and the text is drawn as one quad per character (like :class:`GText`).
+        Changing the text then only moves the quads.
+        
+        The atlas has no bold characters, so bold text is always rendered to a texture.
+        Characters are placed one after the other, so fonts with kerning may look
+        slightly different.
+        
+        **Invariant**: Must be a boolean"""
+        return self._glyphs
+    
+    @glyphs.setter
+    def glyphs(self,value):
+        assert type(value) == bool, repr(value)+' is not a bool'
+        self._glyphs = value
+        if self._defined:
+            self._switch()
 
     @property
     def text(self):
@@ -361,13 +404,21 @@ class GLabel(GRectangle):
         this label will grow to ensure that the text will fit in the rectangle.
         
         **Invariant**: Must be a string"""
-        return self._label.text
+        return self._label.text if self._glyph is None else self._glyph.text
     
     @text.setter
     def text(self,value):
         assert type(value) == str, 'value %s is not a string' % repr(value)
-        self._label.text = value
-        self._label.texture_update()
+        if self._glyph is None:
+            self._label.text = value
+            self._label.texture_update()
+            return
+        
+        self._glyph.text = value
+        if self._glyph.width > self.width or self._glyph.height > self.height:
+            self._reset()
+        else:
+            self._align()
     
     @property
     def halign(self):
@@ -469,11 +520,7 @@ class GLabel(GRectangle):
         if self._rotate.angle == 0.0:
             return self.x-self.width/2.0
         
-        p0 = self.matrix._transform(self.x-self.width/2.0, self.y-self.height/2.0)[0]
-        p1 = self.matrix._transform(self.x+self.width/2.0, self.y-self.height/2.0)[0]
-        p2 = self.matrix._transform(self.x+self.width/2.0, self.y+self.height/2.0)[0]
-        p3 = self.matrix._transform(self.x-self.width/2.0, self.y+self.height/2.0)[0]
-        return min(p0,p1,p2,p3)
+        return self._extent()[0]
     
     @left.setter
     def left(self,value):
@@ -501,11 +548,7 @@ class GLabel(GRectangle):
         if self._rotate.angle == 0.0:
             return self.x+self.width/2.0
         
-        p0 = self.matrix._transform(self.x-self.width/2.0, self.y-self.height/2.0)[0]
-        p1 = self.matrix._transform(self.x+self.width/2.0, self.y-self.height/2.0)[0]
-        p2 = self.matrix._transform(self.x+self.width/2.0, self.y+self.height/2.0)[0]
-        p3 = self.matrix._transform(self.x-self.width/2.0, self.y+self.height/2.0)[0]
-        return max(p0,p1,p2,p3)
+        return self._extent()[2]
     
     @right.setter
     def right(self,value):
@@ -533,11 +576,7 @@ class GLabel(GRectangle):
         if self._rotate.angle == 0.0:
             return self.y+self.height/2.0
         
-        p0 = self.matrix._transform(self.x-self.width/2.0, self.y-self.height/2.0)[1]
-        p1 = self.matrix._transform(self.x+self.width/2.0, self.y-self.height/2.0)[1]
-        p2 = self.matrix._transform(self.x+self.width/2.0, self.y+self.height/2.0)[1]
-        p3 = self.matrix._transform(self.x-self.width/2.0, self.y+self.height/2.0)[1]
-        return max(p0,p1,p2,p3)
+        return self._extent()[1]
     
     @top.setter
     def top(self,value):
@@ -564,11 +603,7 @@ class GLabel(GRectangle):
         if self._rotate.angle == 0.0:
             return self.y-self.height/2.0
         
-        p0 = self.matrix._transform(self.x-self.width/2.0, self.y-self.height/2.0)[1]
-        p1 = self.matrix._transform(self.x+self.width/2.0, self.y-self.height/2.0)[1]
-        p2 = self.matrix._transform(self.x+self.width/2.0, self.y+self.height/2.0)[1]
-        p3 = self.matrix._transform(self.x-self.width/2.0, self.y+self.height/2.0)[1]
-        return min(p0,p1,p2,p3)
+        return self._extent()[3]
     
     
     @bottom.setter
@@ -592,20 +627,29 @@ class GLabel(GRectangle):
             GLabel(text='Hello')
         
         This class supports the all same keywords as :class:`GRectangle`, as well as 
-        additional attributes for the text properties (e.g. font size and name).
+        additional attributes for the text properties (e.g. font size and name) and
+        `glyphs`.
         """
         self._defined = False
         self._hanchor = 'center'
         self._vanchor = 'center'
+        self._glyph = None
+        self._glyphs = keywords['glyphs'] if 'glyphs' in keywords else False
         
+        # The glyph atlas draws the text, so the Kivy label does not need it
         sanitized = {}
-        excludes  = ['linewidth','linecolor','fillcolor','halign','valign','left','bottom']
+        excludes  = ['linewidth','linecolor','fillcolor','halign','valign','left','bottom','glyphs']
+        if self._glyphs:
+            excludes.append('text')
         for key in keywords:
             if not key in excludes:
                 sanitized[key] = keywords[key]
         
         self._label = Label(**sanitized)
         self._label.size_hint = (None,None)
+        self._fsize = self._label.font_size
+        self._fname = keywords['font_name'] if 'font_name' in keywords else None
+        self._switch(keywords['text'] if 'text' in keywords else '')
         
         self.linewidth = keywords['linewidth'] if 'linewidth' in keywords else 0.0
         self.halign = keywords['halign'] if 'halign' in keywords else 'center'
@@ -638,20 +682,70 @@ class GLabel(GRectangle):
         if self._defined:
             self._reset()
     
+    def _switch(self,text=None):
+        """
+        Moves the text to the glyph atlas or to the Kivy label, as ``glyphs`` and ``bold``
+        require.
+        
+        :param text: the text for a new glyph atlas text (None to take it from the label)
+        :type text:  ``str`` or ``None``
+        """
+        usable = self._glyphs and not self._label.bold
+        if usable and self._glyph is None:
+            text = self._label.text if text is None else text
+            self._glyph = GText(text=text,font_size=self._fsize,font_name=self._fname)
+            self._label.text = ''
+        elif not usable and not self._glyph is None:
+            text = self._glyph.text
+            self._glyph = None
+            self._label.font_size = self._fsize
+            if not self._fname is None:
+                self._label.font_name = self._fname
+            self._label.text = text
+            self._label.texture_update()
+        else:
+            return
+        if self._defined:
+            self._reset()
+    
+    def _align(self):
+        """
+        Moves the glyph atlas text to its place in the label rectangle.
+        """
+        if self.halign == 'left':
+            self._glyph.x = (self._glyph.width-self.width)/2.0
+        elif self.halign == 'right':
+            self._glyph.x = (self.width-self._glyph.width)/2.0
+        else:
+            self._glyph.x = 0
+        
+        if self.valign == 'top':
+            self._glyph.y = (self.height-self._glyph.height)/2.0
+        elif self.valign == 'bottom':
+            self._glyph.y = (self._glyph.height-self.height)/2.0
+        else:
+            self._glyph.y = 0
+    
     def _reset(self):
         """
         Resets the drawing cache.
         """
         # Set up the label at the center.
-        self._label.size = self._label.texture_size
-        self._label.center = (0,0)
-        if self.linecolor:
-            self._label.color = self.linecolor
+        if self._glyph is None:
+            self._label.size = self._label.texture_size
+            self._label.center = (0,0)
+            if self.linecolor:
+                self._label.color = self.linecolor
+            text = self._label
+        else:
+            if self.linecolor:
+                self._glyph.linecolor = self.linecolor
+            text = self._glyph
         
         # Resize the outside if necessary
         self._defined = False
-        self._width  = max(self.width, self._label.width)
-        self._height = max(self.height,self._label.height)
+        self._width  = max(self.width, text.width)
+        self._height = max(self.height,text.height)
         self._defined = True
         
         # Reset the absolute anchor
@@ -667,16 +761,18 @@ class GLabel(GRectangle):
             self._trans.y = self._hv+self.height/2.0
         
         # Reset the label anchor.
-        if self.halign == 'left':
-            self._label.x = -self.width/2.0
-        elif self.halign == 'right':
-            self._label.right = self.width/2.0
-        
-        # Reset the label anchor.
-        if self.valign == 'top':
-            self._label.top = self.height/2.0
-        elif self.valign == 'bottom':
-            self._label.bottom = -self.height/2.0
+        if not self._glyph is None:
+            self._align()
+        else:
+            if self.halign == 'left':
+                self._label.x = -self.width/2.0
+            elif self.halign == 'right':
+                self._label.right = self.width/2.0
+            
+            if self.valign == 'top':
+                self._label.top = self.height/2.0
+            elif self.valign == 'bottom':
+                self._label.bottom = -self.height/2.0
         
         GObject._reset(self)
         x = -self.width/2.0
@@ -687,7 +783,10 @@ class GLabel(GRectangle):
             self._cache.add(self._fillcolor)
             self._cache.add(fill)
         
-        self._cache.add(self._label.canvas)
+        if self._glyph is None:
+            self._cache.add(self._label.canvas)
+        else:
+            self._cache.add(self._glyph._cache)
         
         if self._linewidth > 0:
             line = Line(rectangle=(x,y,self.width,self.height),joint='miter',close=True,width=self.linewidth)
@@ -104,8 +104,9 @@ class GSprite(GRectangle):
         assert type(value) == int, '%s is not an int' % repr(value)
         assert value >= 0 and value < self.count, '%s is out of range' % repr(value)
         self._frame = value
-        if not self.hitboxes is None:
-            self.hitbox = self.hitboxes[value]
+        if not self._hitboxes is None:
+            # Already checked when the hitboxes were set
+            self._hitbox = self._hitboxes[value]
         if self._bounds:
             self._texture = self._images[self._frame]
             self._bounds.texture = self._texture
@@ -182,21 +183,13 @@ class GSprite(GRectangle):
         """
         GObject._reset(self)
         
-        texture = GameApp.load_texture(self.source)
-        if texture:
-            width  = texture.width/self._format[1]
-            height = texture.height/self._format[0]
+        frames = GameApp.load_frames(self.source,self._format)
+        if frames:
             if (self.width == 0 or self.height == 0):
-                self.width  = width
-                self.height = height
-            
-            ty = 0
-            for row in range(self._format[0]):
-                tx = 0
-                for col in range(self._format[1]):
-                    self._images[row*self._format[1]+col] = texture.get_region(int(tx),texture.height-int(ty)-int(height),int(width),int(height))
-                    tx += width
-                ty += width
+                texture = GameApp.load_region(self.source)
+                self.width  = texture.width/self._format[1]
+                self.height = texture.height/self._format[0]
+            self._images = frames
         else:
             print('Failed to load',repr(self.source))
         
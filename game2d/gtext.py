@@ -0,0 +1,322 @@
+"""
+A module to support text that changes every frame.
+
+A :class:`GLabel` draws its text with a Kivy label, which renders the whole string to
+a new texture every time the text (or the font) changes.  That is fine for titles and
+messages, but text that changes all the time, like a score or a timer, pays for it on
+every change.  This module renders each character of a font only once, into a glyph
+atlas, and draws text as one quad per character.  Changing the text only moves quads.
+A :class:`GLabel` with the attribute ``glyphs`` draws its text this way too.
+"""
+from kivy.graphics import *
+from kivy.graphics.instructions import *
+from kivy.core.text import Label as CoreLabel
+from .gobject import GObject
+
+
+class GlyphAtlas(object):
+    """
+    A class storing the rendered characters of one font at one size.
+
+    The printable ASCII characters are rendered when the atlas is made, a row of
+    characters to a texture.  Any other character is rendered the first time it is
+    used.  Use :meth:`load` to get an atlas, so that each font and size is only
+    rendered once.
+    """
+    # The number of characters rendered in each texture
+    ROW = 32
+    # The atlas for each (font name, font size)
+    CACHE = {}
+
+    # IMMUTABLE PROPERTIES
+    @property
+    def height(self):
+        """
+        The height of a line of text.
+
+        **invariant**. Value is a number >= 0.
+        """
+        return self._height
+
+    @property
+    def textures(self):
+        """
+        The textures holding the characters rendered so far.
+
+        **invariant**. Value is a tuple of Kivy textures.
+        """
+        return tuple(self._textures)
+
+    # CLASS METHODS
+    @classmethod
+    def load(cls,font_name,font_size):
+        """
+        Returns: The glyph atlas for the given font and size
+
+        :param font_name: The font file (or None for the default Kivy font)
+        :type font_name:  ``str`` or ``None``
+
+        :param font_size: The size of the font in points
+        :type font_size:  ``int`` or ``float`` > 0
+        """
+        key = (font_name,font_size)
+        if not key in cls.CACHE:
+            cls.CACHE[key] = GlyphAtlas(font_name,font_size)
+        return cls.CACHE[key]
+
+    # BUILT-IN METHODS
+    def __init__(self,font_name,font_size):
+        """
+        Creates the atlas, rendering the printable ASCII characters.
+
+        :param font_name: The font file (or None for the default Kivy font)
+        :type font_name:  ``str`` or ``None``
+
+        :param font_size: The size of the font in points
+        :type font_size:  ``int`` or ``float`` > 0
+        """
+        self._font = {'font_size':font_size}
+        if not font_name is None:
+            self._font['font_name'] = font_name
+        self._glyphs = {}
+        self._textures = []
+        self._height = 0
+        chars = ''.join(map(chr,range(32,127)))
+        for pos in range(0,len(chars),GlyphAtlas.ROW):
+            self._render(chars[pos:pos+GlyphAtlas.ROW])
+
+    # PUBLIC METHODS
+    def glyph(self,char):
+        """
+        Returns: The texture region for the given character, and its texture
+
+        The width of the region is how far the character moves the text.  The texture
+        is one of the attribute ``textures``.  (Label textures have no OpenGL id until
+        they are drawn, so the id cannot tell them apart.)
+
+        :param char: The character
+        :type char:  ``str`` of length 1
+        """
+        if not char in self._glyphs:
+            self._render(char)
+        return self._glyphs[char]
+
+    # HIDDEN METHODS
+    def _render(self,chars):
+        """
+        Renders the given characters to a new texture.
+
+        :param chars: The characters to render
+        :type chars:  ``str``
+        """
+        label = CoreLabel(text=chars,**self._font)
+        label.refresh()
+        texture = label.texture
+        if texture is None:
+            # Nothing to draw (such as a control character), so use a space
+            for char in chars:
+                self._glyphs[char] = self.glyph(' ')
+            return
+
+        self._textures.append(texture)
+        self._height = max(self._height,texture.height)
+        left = 0
+        for pos in range(len(chars)):
+            right = min(label.get_extents(chars[:pos+1])[0],texture.width)
+            region = texture.get_region(left,0,right-left,texture.height)
+            self._glyphs[chars[pos]] = (region,texture)
+            left = right
+
+
+class GText(GObject):
+    """
+    An class representing text that can change quickly.
+
+    This is a lighter :class:`GLabel` (with ``glyphs`` set) for text that changes often,
+    with no box, fill or alignment.  The text is drawn from a :class:`GlyphAtlas`, so
+    changing the attribute ``text`` never renders any text.  Changing the font
+    (``font_name`` or ``font_size``) does, but only the first time that font is used.
+
+    The text is centered on (x,y), and each line of text is centered.  The text is
+    colored by ``linecolor``, just like :class:`GLabel`.  Characters are placed one
+    after the other, so fonts with kerning may look slightly different from a
+    :class:`GLabel` with the same text.
+
+    The attributes ``width`` and ``height`` are present in this object, but they are
+    read-only.  These values are the size of the text.
+    """
+
+    # MUTABLE PROPERTIES
+    @property
+    def text(self):
+        """
+        The text of this object.
+
+        Lines are separated by the escape character `'\\n'`.
+
+        **invariant**. Value is a string.
+        """
+        return self._text
+
+    @text.setter
+    def text(self,value):
+        assert type(value) == str, 'value %s is not a string' % repr(value)
+        if self._defined and value == self._text:
+            return
+        self._text = value
+        if self._defined:
+            self._layout()
+
+    @property
+    def font_size(self):
+        """
+        The size of the text font in points.
+
+        **invariant**. Value is a positive number (int or float).
+        """
+        return self._fsize
+
+    @font_size.setter
+    def font_size(self,value):
+        assert type(value) in [int,float] and value > 0, 'value %s is not a positive number' % repr(value)
+        self._fsize = value
+        if self._defined:
+            self._reset()
+
+    @property
+    def font_name(self):
+        """
+        The file name for the .ttf file to use as a font (or None for the default).
+
+        **invariant**. Value is None or a string referring to a .ttf file in folder Fonts.
+        """
+        return self._fname
+
+    @font_name.setter
+    def font_name(self,value):
+        from .app import GameApp
+        assert value is None or GameApp.is_font(value), 'value %s is not a font name' % repr(value)
+        self._fname = value
+        if self._defined:
+            self._reset()
+
+    # IMMUTABLE PROPERTIES
+    @property
+    def width(self):
+        """
+        The horizontal width of this text.
+
+        This is the width of the longest line.
+
+        **invariant**. Value is an ``int`` or ``float`` >= 0.
+        """
+        return self._width
+
+    @property
+    def height(self):
+        """
+        The vertical height of this text.
+
+        This is the height of a line times the number of lines.
+
+        **invariant**. Value is an ``int`` or ``float`` >= 0.
+        """
+        return self._height
+
+    # BUILT-IN METHODS
+    def __init__(self,**keywords):
+        """
+        Creates a new text object.
+
+        To use the constructor for this class, you should provide it with a list of
+        keyword arguments that initialize various attributes. For example, to show a
+        score, use the constructor::
+
+            GText(text='0',x=100,y=100,font_size=48,font_name='RetroGame.ttf')
+
+        and then change the attribute ``text`` whenever the score changes.
+
+        This class supports the same keywords as :class:`GObject` (except ``width`` and
+        ``height``), as well as ``text``, ``font_size`` and ``font_name``.
+
+        :param keywords: dictionary of keyword arguments
+        :type keywords:  keys are attribute names
+        """
+        self._defined = False
+        self.text = keywords['text'] if 'text' in keywords else ''
+        self.font_size = keywords['font_size'] if 'font_size' in keywords else 15
+        self.font_name = keywords['font_name'] if 'font_name' in keywords else None
+        GObject.__init__(self,**keywords)
+        if not self.linecolor:
+            self.linecolor = (0,0,0,1)
+        self._reset()
+        self._defined = True
+
+    def __str__(self):
+        """
+        :return: A readable string representation of this object.
+        :rtype:  ``str``
+        """
+        if self.name is None:
+            s = '['
+        else:
+            s = '[name=%s,' % self.name
+        return '%s,text=%s,center=(%s,%s),angle=%s]' \
+                % (s,repr(self.text),repr(self.x),repr(self.y),repr(self.angle))
+
+    # HIDDEN METHODS
+    def _layout(self):
+        """
+        Moves the quads to spell out the current text.
+
+        If the text has a character in a texture without a mesh, this resets the
+        drawing cache instead (which calls this method again).
+        """
+        lines = self._text.split('\n')
+        glyphs = [[self._atlas.glyph(char) for char in line] for line in lines]
+        if any(not id(owner) in self._meshes for line in glyphs for (glyph,owner) in line):
+            self._reset()
+            return
+
+        lineheight = self._atlas.height
+        widths = [sum(glyph.width for (glyph,owner) in line) for line in glyphs]
+        self._width  = max(widths)
+        self._height = lineheight*len(lines)
+
+        vertices = dict((key,[]) for key in self._meshes)
+        top = self._height/2.0
+        for row in range(len(lines)):
+            x = -widths[row]/2.0
+            y = top-lineheight*(row+1)
+            for (glyph,owner) in glyphs[row]:
+                u = glyph.tex_coords
+                w = glyph.width
+                h = glyph.height
+                vertices[id(owner)].extend((x,y,u[0],u[1], x+w,y,u[2],u[3],
+                                           x+w,y+h,u[4],u[5], x,y+h,u[6],u[7]))
+                x += w
+
+        for (key,mesh) in self._meshes.items():
+            count = len(vertices[key])//16
+            mesh.vertices = vertices[key]
+            mesh.indices = [4*quad+pos for quad in range(count) for pos in (0,1,2,2,3,0)]
+
+    def _reset(self):
+        """
+        Resets the drawing cache.
+        """
+        GObject._reset(self)
+        self._atlas = GlyphAtlas.load(self._fname,self._fsize)
+        for char in self._text:
+            if char != '\n':
+                self._atlas.glyph(char)
+
+        self._cache.add(self._linecolor)
+        self._meshes = {}
+        for texture in self._atlas.textures:
+            mesh = Mesh(vertices=[],indices=[],mode='triangles',texture=texture)
+            self._meshes[id(texture)] = mesh
+            self._cache.add(mesh)
+
+        self._cache.add(PopMatrix())
+        self._layout()
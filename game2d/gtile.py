@@ -11,7 +11,9 @@ Date:   November 1, 2020
 from kivy.graphics import *
 from kivy.graphics.instructions import *
 from .grectangle import GRectangle, GObject
+from .gobject import MESH_QUADS
 from .app import GameApp
+import numpy
 
 
 class GTile(GObject):
@@ -108,6 +110,37 @@ class GTile(GObject):
         if not self._texture is None and self.height == 0:
             self.height = self._texture.height
         
+        if not self._fillcolor is None:
+            self._cache.add(self._fillcolor)
+        else:
+            self._cache.add(Color(1,1,1))
+        
+        # Mesh indices are 16 bits, so large tiles need more than one mesh
+        quads = self._quads(x,y)
+        quad = numpy.array([0,1,2,2,3,0])
+        for start in range(0,len(quads),MESH_QUADS):
+            verts = quads[start:start+MESH_QUADS]
+            indx = (numpy.arange(len(verts))[:,None]*4+quad).ravel()
+            mesh = Mesh(vertices=verts.ravel(),indices=indx.tolist(),mode='triangles',
+                        texture=self._texture)
+            self._cache.add(mesh)
+        
+        self._cache.add(PopMatrix())
+    
+    def _quads(self,x,y):
+        """
+        Returns: The vertices of every copy of the image, as a numpy array
+        
+        The result has one row for each copy (a quad), with the four corners of the
+        quad as (x,y,u,v).  The copies are ordered by column, and then by row.  The
+        last column and row are cut short if the image does not fit evenly.
+        
+        :param x: the left edge of the tile
+        :type x:  ``float``
+        
+        :param y: the bottom edge of the tile
+        :type y:  ``float``
+        """
         grid_x = self._texture.width
         grid_y = self._texture.height
         size_x = int(self.width//grid_x)
@@ -118,25 +151,23 @@ class GTile(GObject):
         rng_x = size_x+1 if rem_x > 0 else size_x
         rng_y = size_y+1 if rem_y > 0 else size_y
         
-        vert = []
-        indx = []
-        pos = 0
-        for ii in range(rng_x):
-            for jj in range(rng_y):
-                ni = 1 if ii < size_x else rem_x/grid_x
-                nj = 1 if jj < size_y else rem_y/grid_y
-                vert.extend([x+ii*grid_x,      y+jj*grid_y,         0, 1])
-                vert.extend([x+(ii+ni)*grid_x, y+jj*grid_y,        ni, 1])
-                vert.extend([x+(ii+ni)*grid_x, y+(jj+nj)*grid_y,   ni, 1-nj])
-                vert.extend([x+ii*grid_x,      y+(jj+nj)*grid_y,    0, 1-nj])
-                indx.extend([pos,pos+1,pos+2,pos+2,pos+3,pos])
-                pos += 4
-        
-        mesh = Mesh(vertices=vert, indices=indx,mode='triangles',texture=self._texture)
-        if not self._fillcolor is None:
-            self._cache.add(self._fillcolor)
-        else:
-            self._cache.add(Color(1,1,1))
-        self._cache.add(mesh)
+        # The share of the image in each column and row
+        ni = numpy.ones(rng_x)
+        nj = numpy.ones(rng_y)
+        ni[size_x:] = rem_x/grid_x
+        nj[size_y:] = rem_y/grid_y
         
-        self._cache.add(PopMatrix())
\ No newline at end of file
+        ii = numpy.arange(rng_x)[:,None]
+        jj = numpy.arange(rng_y)[None,:]
+        ni = ni[:,None]
+        nj = nj[None,:]
+        quads = numpy.empty((rng_x,rng_y,4,4),dtype=numpy.float32)
+        quads[:,:,(0,3),0] = (x+ii*grid_x)[...,None]
+        quads[:,:,(1,2),0] = (x+(ii+ni)*grid_x)[...,None]
+        quads[:,:,(0,1),1] = (y+jj*grid_y)[...,None]
+        quads[:,:,(2,3),1] = (y+(jj+nj)*grid_y)[...,None]
+        quads[:,:,(0,3),2] = 0
+        quads[:,:,(1,2),2] = numpy.broadcast_to(ni,(rng_x,rng_y))[...,None]
+        quads[:,:,(0,1),3] = 1
+        quads[:,:,(2,3),3] = numpy.broadcast_to(1-nj,(rng_x,rng_y))[...,None]
+        return quads.reshape(rng_x*rng_y,4,4)
\ No newline at end of file
@@ -411,12 +411,42 @@ class GView(FloatLayout):
     :class:`GObject` instances to the :meth:`draw` method.  You must do this every
     animation frame, as the game is constantly clearing the window.
 
+    By default the view is in immediate mode: clearing the window throws away every
+    graphics command, and drawing adds them back.  In retained mode (see the attribute
+    ``retained``) the commands stay in the window between frames.  The view compares
+    what was drawn this frame to what was drawn last frame, and only changes the window
+    from the first place where they differ.  Objects that are drawn every frame in the
+    same order (and only move or change in place) then cost almost nothing to redraw.
+    An object leaves the window on the first frame it is not drawn, or when it is
+    passed to :meth:`remove`.
+
     **You should never construct an object of this class**.  Creating a new instance
     of this class will not properly display it on the screen.  Instead, you should
     only use the one provided in the `view` attribute of :class:`GameApp`.
     See the documentation of that class for more information.
     """
 
+    # MUTABLE ATTRIBUTES
+    @property
+    def retained(self):
+        """
+        Whether this view keeps its graphics commands between frames.
+
+        Changing this value empties the window.
+
+        **Invariant**: Must be a ``bool``.
+        """
+        return self._retained
+
+    @retained.setter
+    def retained(self,value):
+        assert type(value) == bool, 'value %s is not a bool' % repr(value)
+        self._retained = value
+        self._frame.clear()
+        self._contents.clear()
+        self._drawn = []
+        self._shown = []
+
     # BUILT-IN METHODS
     def __init__(self):
         """
@@ -433,6 +463,9 @@ class GView(FloatLayout):
         self.bind(size=self._reset)
         self._reset()
         self._contents = set()
+        self._retained = False
+        self._drawn = []
+        self._shown = []
 
 
     # PUBLIC METHODS
@@ -447,20 +480,73 @@ class GView(FloatLayout):
         :type cmd:  A Kivy graphics command
         """
         if not cmd in self._contents:
-            self._frame.add(cmd)
             self._contents.add(cmd)
+            if self._retained:
+                self._drawn.append(cmd)
+            else:
+                self._frame.add(cmd)
+
+    def remove(self,cmd):
+        """
+        Removes the given Kivy graphics command from this view.
+
+        This only matters in retained mode, where it takes the command out of the
+        window immediately instead of at the end of the frame.
+
+        :param cmd: the command to remove
+        :type cmd:  A Kivy graphics command
+        """
+        if cmd in self._shown:
+            self._shown.remove(cmd)
+            self._frame.remove(cmd)
+        if cmd in self._contents:
+            self._contents.discard(cmd)
+            if cmd in self._drawn:
+                self._drawn.remove(cmd)
 
     def clear(self):
         """
         Clears the contents of the view.
 
         This method is called for you automatically at the start of the animation
-        frame.  That way, you are not drawing images on top of one another.
+        frame.  That way, you are not drawing images on top of one another.  In
+        retained mode, the window is not changed until the end of the frame.
         """
-        self._frame.clear()
         self._contents.clear()
+        if self._retained:
+            self._drawn = []
+        else:
+            self._frame.clear()
 
     # HIDDEN METHODS
+    def _commit(self):
+        """
+        Updates the window to show the commands drawn this frame (retained mode only)
+
+        Everything up to the first difference from the last frame is left alone.  If
+        that difference is early on, it is faster to rebuild the window outright than
+        to remove the old commands one at a time.
+        """
+        if not self._retained:
+            return
+        old = self._shown
+        new = self._drawn
+        same = 0
+        size = min(len(old),len(new))
+        while same < size and old[same] is new[same]:
+            same += 1
+        if same == len(old) == len(new):
+            return
+        if 2*same < len(old):
+            self._frame.clear()
+            same = 0
+        else:
+            for cmd in old[same:]:
+                self._frame.remove(cmd)
+        for cmd in new[same:]:
+            self._frame.add(cmd)
+        self._shown = new
+
     def _reset(self,obj=None,value=None):
         """
         Resets the view canvas in response to a resizing event
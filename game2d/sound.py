@@ -180,3 +180,109 @@ class SoundLibrary(object):
         :rtype:  ``iterable``
         """
         return self._data.keys()
+
+
+# #mark -
+class SoundPool(SoundLibrary):
+    """
+    A sound library that can play each sound several times at once.
+    
+    A :class:`Sound` cannot overlap with itself, so a sound effect that is played 
+    again before it finishes is lost.  This library loads each sound as several
+    :class:`Sound` objects (called voices), and the method :meth:`play` plays the 
+    first voice that is free.  If every voice is busy, it restarts the voice that
+    was started the longest time ago.  Sounds are loaded as usual::
+        
+        pool['croak'] = 'croak.wav'
+    
+    and played by key::
+        
+        pool.play('croak')
+    
+    All of the loading happens when a sound is added, so load every sound before the
+    game starts (see the ``sounds`` keyword of :class:`GameApp`).  Accessing a sound 
+    by key gives the tuple of its voices.
+    """
+    
+    # IMMUTABLE PROPERTIES
+    @property
+    def voices(self):
+        """
+        The number of voices for each sound.
+        
+        **Immutable**: This value cannot be changed after the pool is created.
+        
+        **Invariant**: Must be an int > 0.
+        """ 
+        return self._voices
+    
+    def __init__(self,voices=4):
+        """
+        Creates a new, empty sound pool.
+        
+        :param voices: The number of voices for each sound
+        :type voices:  ``int`` > 0
+        """
+        assert type(voices) == int and voices > 0, 'voices %s is not a positive int' % repr(voices)
+        SoundLibrary.__init__(self)
+        self._voices = voices
+        self._next = {}
+    
+    def __setitem__(self, key, filename):
+        """
+        Creates the voices from the file filename and assigns them the given name.
+        
+        :param key: The key identifying a sound
+        :type key:  ``str``
+        
+        :param filename: The name of the file containing the sound source
+        :type filename:  ``str``
+        """
+        self._data[key] = tuple(Sound(filename) for _ in range(self._voices))
+        self._next[key] = 0
+    
+    def __delitem__(self, key):
+        """
+        Deletes the voices for the given sound name.
+        
+        :param key: The key identifying a sound
+        :type key:  ``str``
+        """
+        del self._data[key]
+        del self._next[key]
+    
+    def play(self,key):
+        """
+        Plays the sound for the given name.
+        
+        The sound plays on the next free voice, or on the oldest voice if every voice
+        is playing.
+        
+        :param key: The key identifying a sound
+        :type key:  ``str``
+        """
+        voices = self._data[key]
+        start = self._next[key]
+        pick = start
+        for pos in range(len(voices)):
+            if not voices[(start+pos) % len(voices)].playing:
+                pick = (start+pos) % len(voices)
+                break
+        else:
+            voices[pick].stop()
+        voices[pick].play()
+        self._next[key] = (pick+1) % len(voices)
+    
+    def stop(self,key=None):
+        """
+        Stops every voice of the sound for the given name.
+        
+        If key is None, this stops every sound in the pool.
+        
+        :param key: The key identifying a sound
+        :type key:  ``str`` or ``None``
+        """
+        keys = self._data.keys() if key is None else [key]
+        for k in keys:
+            for voice in self._data[k]:
+                voice.stop()
@@ -29,6 +29,7 @@ extra classes and are now sure where they would go, ask on Piazza and we will an
 from game2d import *
 from consts import *
 from models import *
+import numpy as np
 
 # PRIMARY RULE: Lanes are not allowed to access anything in any level.py or app.py.
 # They can only access models.py and const.py. If you need extra information from the
@@ -45,131 +46,71 @@ class Lane(object):         # You are permitted to change the parent class if yo
     while the other classes will contain specialized code.
 
     Lanes should use the GTile class and to draw their background.  Each lane should be
-    GRID_SIZE high and the length of the window wide.  You COULD make this class a
-    subclass of GTile if you want.  This will make collisions easier.  However, it can
-    make drawing really confusing because the Lane not only includes the tile but also
-    all of the objects in the lane (cars, logs, etc.)
+    GRID_SIZE high and the length of the window wide.
+
+    A lane is only the view of a lane in the simulation (see world.py).  The simulation
+    decides where the objects are and what they do to the frog; this class owns the
+    images and draws them where the simulation says they are.
     """
     # LIST ALL HIDDEN ATTRIBUTES HERE
-    # Attribute _objs: The objects on the lanes
-    # Invariant: _objs is a list that contains only GImage objects
+    # Attribute _state: The simulation of this lane
+    # Invariant: _state is a LaneState object
 
-    # Attribute _tile: The lanes of each level
+    # Attribute _tile: The background of the lane
     # Invariant: _tile is a GTile object
 
-    # Attribute _exitcount: The number of exits in the level
-    # Invariant: _exitcount is a number (int)
-
-    # Attribute _offscreen: The offscreen buffer for each moving object in the level
-    # Invariant: _offscreen is a number (int)
-
-    # Attribute _objs: The objects in the level
-    # Invariant: _objs is a list (may be empty)
+    # Attribute _objs: The images of the objects in the lane, in level file order
+    # Invariant: _objs is a GBatch object
 
-    # Attribute _objspeed: The speed of the moving objects
-    # Invariant: _objspeed is a number (float)
-
-    # Attribute _width: The width of the window screen
+    # Attribute _width: The width of the window
     # Invariant: _width is a number (int)
 
     # GETTERS AND SETTERS (ONLY ADD IF YOU NEED THEM)
-    def getexits(self):
+    def getTile(self):
         """
-        Gets the exit count of each level
+        Gets the background of the lane
         """
-        return self._exitcount
+        return self._tile
+
     # INITIALIZER TO SET LANE POSITION, BACKGROUND,AND OBJECTS
-    def __init__(self,count,type,size,objtype,dict,objects):
+    def __init__(self,state,width):
         """
-        Initializes the lanes and objects.
-
-        Initalizes the grass, road, water, and hedges.
-        Initalizes the log and car objects onto the lanes.
-        Initalizes the hitboxes of each object.
+        Initializes the lane background and object images.
 
-        Parameter count: Number of lanes
-        Precondition: count is a number (float)
+        Parameter state: The simulation of this lane
+        Precondition: state is a LaneState object
 
-        Parameter type: The background surface of each lane
-        Precondtion: type is a string ("grass","road","water","hedge")
-
-        Parameter size: The window's scaling when playing the game
-        Precondition: size is a number (int)
-
-        Parameter objtype: The object being rendered onto the lanes
-        Precondition: objtype is a string i.e. "log1","car3"
-
-        Parameter dict: The dictionary with all the information pretaining to each level
-        Precondition: dict is a dictionary
-
-        Parameter objects: The objects and their information for each level
-        Preconiditon: objects is a dictionary
+        Parameter width: The width of the window
+        Precondition: width is a number (int)
         """
-        hardhitbox, objangle = None, 0
-        self._exitcount = 0
-        self._offscreen = dict['offscreen']
-        self._objs = []
-        self._objspeed = 0
-        self._width = size[0]*GRID_SIZE
-        self._tile = GTile(x=0,y=count*GRID_SIZE,width=2*size[0] *GRID_SIZE,\
-        height=GRID_SIZE,source=str(type)+'.png')
-        for i in objtype.values():
-            if isinstance(i,int):
-                objspeed = i
-                self._objspeed = i
-                if objspeed < 0: objangle= 180
-            if not isinstance(i,list): continue
-            for j in i:
-                for k in j.values():
-                    if isinstance(k,str): objecttype=k
-                    if isinstance(k,float) or isinstance(k,int): objectpos = k
-                for i in objects.values():
-                    if (list(i.items())[0][1])==(objecttype+'.png'):
-                        hardhitbox=tuple(list(i.items())[2][1])
-                self._objs.append(GImage(x=(objectpos+0.5)*GRID_SIZE,\
-                y=count*GRID_SIZE,source=objecttype+'.png',angle=objangle))
-                self._objs[len(self._objs)-1].blocked = 0
-                if hardhitbox!=None:
-                    self._objs[len(self._objs)-1].hitbox = hardhitbox
-                self._objs[len(self._objs)-1].onlog = 0
-                if objecttype == 'exit': self._exitcount += 1
-
-    def update(self,dt,frog):
+        self._state = state
+        self._width = width
+        self._tile = GTile(x=0,y=state.getY(),width=2*width,height=GRID_SIZE,\
+        source=state.getType()+'.png')
+        self._objs = GBatch(sources=state.getSources())
+
+    def draw(self,view,alpha=1.0):
         """
-        Updates the game objects each frame.
+        Draw the objects in the lane.
 
-        Parameter dt: The time in seconds since last update
-        Precondition: dt is a number (int or float)
+        The background is not drawn here.  It never moves, so the level bakes the
+        backgrounds of every lane into one layer (see getTile).
 
-        Parameter frog: The frog in each level (your playable character)
-        Precondition: frog is a GImage object
-        """
-        for obj in self._objs:
-            obj.x += dt*self._objspeed
-            if obj.onlog==1:
-                frog.x += dt*self._objspeed
-                if (frog.x<=0 or frog.x>=self._width):
-                    frog.dead=1
-                obj.onlog = 0
-            if self._objspeed < 0:
-                if obj.right <= -self._offscreen*GRID_SIZE:
-                    obj.right = self._width + self._offscreen*GRID_SIZE
-            else:
-                if obj.left >= self._width + self._offscreen*GRID_SIZE:
-                    obj.left = -self._offscreen*GRID_SIZE
-
-
-    def draw(self,view):
-        """
-        Draw the lane and frog objects.
+        Objects in the offscreen buffer (past either edge of the window) are not
+        drawn.  They still move, since that is up to the simulation.
 
         Parameter view: The view to draw to
         Precondition: view is a GView object
+
+        Parameter alpha: How far through the last simulation step to draw the objects
+        Precondition: alpha is a number in 0..1
         """
-        self._tile.draw(view)
-        for obj in self._objs:
-            obj.draw(view)
-    # ADDITIONAL METHODS (DRAWING, COLLISIONS, MOVEMENT, ETC)
+        xs = np.empty(self._objs.count)
+        xs[self._state.getIds()] = self._state.getXs(alpha)
+        # Only cull horizontally, as the lane itself is always on screen
+        y = self._state.getY()
+        self._objs.place(xs,y,self._state.getAngle(),(0,y,self._width,y))
+        self._objs.draw(view)
 
 
 class Grass(Lane):                           # We recommend AGAINST changing this one
@@ -189,62 +130,30 @@ class Road(Lane):                           # We recommend AGAINST changing this
     """
     A class representing a roadway with cars.
 
-    If you implement Lane correctly, you do really need many methods here (not even an
-    initializer) as this class will inherit everything.  However, roads are different
-    than other lanes as they have cars that can kill the frog. Therefore, this class
-    does need a method to tell whether or not the frog is safe.
+    Cars kill the frog, but that is decided by RoadState in world.py.  This class
+    only draws the road.
     """
     pass
 
-    # DEFINE ANY NEW METHODS HERE
-
 
 class Water(Lane):
     """
     A class representing a waterway with logs.
 
-    If you implement Lane correctly, you do really need many methods here (not even an
-    initializer) as this class will inherit everything.  However, water is very different
-    because it is quite hazardous. The frog will die in water unless the (x,y) position
-    of the frog (its center) is contained inside of a log. Therefore, this class needs a
-    method to tell whether or not the frog is safe.
-
-    In addition, the logs move the frog. If the frog is currently in this lane, then the
-    frog moves at the same rate as all of the logs.
+    The frog drowns unless it is riding a log, but that is decided by WaterState in
+    world.py.  This class only draws the water.
     """
     pass
 
-    # DEFINE ANY NEW METHODS HERE
-
 
 class Hedge(Lane):
     """
     A class representing the exit hedge.
 
-    This class is a subclass of lane because it does want to use a lot of the features
-    of that class. But there is a lot more going on with this class, and so it needs
-    several more methods.  First of all, hedges are the win condition. They contain exit
-    objects (which the frog is trying to reach). When a frog reaches the exit, it needs
-    to be replaced by the blue frog image and that exit is now "taken", never to be used
-    again.
-
-    That means this class needs methods to determine whether or not an exit is taken.
-    It also need to take the (x,y) position of the frog and use that to determine which
-    exit (if any) the frog has reached. Finally, it needs a method to determine if there
-    are any available exits at all; once they are taken the game is over.
-
-    These exit methods will require several additional attributes. That means this class
-    (unlike Road and Water) will need an initializer. Remember to user super() to combine
-    it with the initializer for the Lane.
+    The exits (and which of them are taken) are tracked by HedgeState in world.py.
+    This class only draws the hedge.
     """
     pass
-    # LIST ALL HIDDEN ATTRIBUTES HERE
-
-    # GETTERS AND SETTERS (ONLY ADD IF YOU NEED THEM)
-
-    # INITIALIZER TO SET ADDITIONAL EXIT INFORMATION
-
-    # ANY ADDITIONAL METHODS
 
 
 # IF YOU NEED ADDITIONAL LANE CLASSES, THEY GO HERE
@@ -19,6 +19,7 @@ from game2d import *
 from consts import *
 from lanes  import *
 from models import *
+from world import *
 
 # PRIMARY RULE: Level can only access attributes in models.py or lanes.py using getters
 # and setters. Level is NOT allowed to access anything in app.py (Subcontrollers are not
@@ -34,6 +35,11 @@ class Level(object):
     cars, logs, or other items in each lane). That information is stored inside of the
     individual lane objects.
 
+    The rules of the game are not in this class either.  They are in the World object
+    (see world.py), which moves the frog and the obstacles without drawing anything.
+    This class passes the player input to the World, plays its sounds, and draws the
+    frog and lanes wherever the World says they are.
+
     If you want to pause the game, tell this controller to draw, but do not update.  See
     subcontrollers.py from Lesson 27 for an example.  This class will be similar to that
     one in many ways.
@@ -52,11 +58,17 @@ class Level(object):
     """
 
     # LIST ALL HIDDEN ATTRIBUTES HERE
+    # Attribute _world: The simulation of the level (the frog, lanes, lives and exits)
+    # Invariant: _world is a World object
+
     # Attribute _frog: The frog in each level (your playable character)
-    # Invariant: _frog is a GImage object
+    # Invariant: _frog is a Frog object
 
     # Attribute _lanes: The lanes that appear in each level
-    # Invariant: _lanes is a GTile object
+    # Invariant: _lanes is a list of Lane objects
+
+    # Attribute _background: The backgrounds of every lane, baked into one image
+    # Invariant: _background is a GLayer object
 
     # Attribute _width: The width of the window size
     # Invariant: _width is a number (int)
@@ -64,20 +76,8 @@ class Level(object):
     # Attribute _height: The height of the window
     # Invariant: _height is a number (int)
 
-    # Attribute _cooldown: The time in between each of the frog's movements
-    # Invariant: _cooldown is a number (float)
-
-    # Attribute _lives: The amount of lives the player has left before losing
-    # Invariant: _lives is a GImage object
-
-    # Attribute _exitcount: The number of exits in the level
-    # Invariant: _exitcount is a number (int)
-
-    # Attribute _animating: Whether the frog's animation is active or not
-    # Invariant: _animating is a boolean (True,False)
-
-    # Attribute _updateDeath: Status of frog upon death (win,loss,death)
-    # Invariant: _updateDeath is a number (int), can be 0, 1, -1
+    # Attribute _lives: The heads of the lives meter, followed by its label
+    # Invariant: _lives is a list of FROG_LIVES GImage objects and a GLabel
 
     # Attribute _safefrog: Contains the safe frog images on the exits
     # Invariant: _safefrog is a list of GImages
@@ -85,41 +85,14 @@ class Level(object):
     # Attribute _input: The input handler to access keyboard information
     # Invariant: _input is a GInput object
 
-    # Attribute _dead: Status of the frog (alive,dead)
-    # Invariant: _dead is a number (int), 0 or 1
-
     # Attribute _death: The death sprite of the frog
-    # Invariant: _death is a GSprite object
-
-    # Attribute _startfrogx: The starting position of the frog
-    # Invariant: _startfrogx is number (float)
+    # Invariant: _death is a Death object
 
     # Attribute _froghitbox: The frog's hitbox
     # Invariant: A tuple of tuples
 
-    # Attribute _undead: An indication of when the death animation is complete
-    # Invariant: _undead is a number (int), 0 or 1
-
-    # Attribute _jumpSound: The jumpsound of the frog
-    # Invariant: _jumpSound is a sound object
-
-    # Attribute _winSound: The sound of getting to an exit
-    # Invariant: _winSound is a sound object
-
-    # Attribute _deathSound: The sound of the frog dying
-    # Invariant: _deathSound is a sound object
-
-    # Attribute _lastleafx: The x position of the last exit the frog was on
-    # Invariant: _lastleafx is a number (float)
-
-    # Attribute _lastleafy: The y position of the last exit the frog was on
-    # Invariant: _lastleafy is a number (float)
-
-    # Attribute _collidestatus: The status of the frog's collision
-    # Invariant: _collidestatus is a number (int)
-
-    # Attribute _animator: Handles the coroutine of animations
-    # Invariant: _animator is the animation function
+    # Attribute _sounds: The sound effects of the simulation, keyed by file name
+    # Invariant: _sounds is a SoundPool object
 
     # GETTERS AND SETTERS (ONLY ADD IF YOU NEED THEM)
     def getWidth(self):
@@ -135,458 +108,163 @@ class Level(object):
         return self._height
 
     # INITIALIZER (standard form) TO CREATE THE FROG AND LANES
-    def start(self,dict,width,height,input,hitbox):
+    def start(self,spec,input,sounds):
         """
         Initializes the level.
 
         Initalizes the lanes, frog, and frog lives in the level.
 
-        Parameter dict: The dictionary with each level's information
-        Precondition: dict is a dictionary
-
-        Parameter width: The width of the window size
-        Precondtion: width is a number (int)
-
-        Parameter height: The height of the window size
-        Precondtion: height is a number (int)
+        Parameter spec: The level to play
+        Precondition: spec is a LevelSpec object (see load_level)
 
         Parameter input: The input handler to access keyboard information
         Precondition: input is a GInput object
 
-        Parameter hitbox: The dictionary containing the hitbox sizes of each object
-        Precondition: hitbox is a dictionary
+        Parameter sounds: The sound effects, already loaded
+        Precondition: sounds is a SoundPool with CROAK_SOUND, SPLAT_SOUND and
+        TRILL_SOUND
         """
-        self._exitcount = 0
-        self._animating = False
-        self._updateDeath = 0
         self._safefrog = []
-        self._width = width
-        self._height = height
-        self._cooldown = 0
+        self._sounds = sounds
+        self._width = spec.getWidth()
+        self._height = spec.getHeight()
         self._input = input
-        lanes = dict['lanes']
-        size = dict['size']
-        objects = hitbox['images']
+        self._world = World(spec)
+        classes = {'grass':Grass,'road':Road,'water':Water,'hedge':Hedge}
         self._lanes = []
-        count=0.5
-        for type in lanes:
-            for value in type.values():
-                if value == 'grass' or value == 'road' \
-                or value == 'hedge' or value == 'water':
-                    self._lanes.append(Lane(count,value,\
-                    size,type,dict,objects))
-            count = count + 1
-        for lane in self._lanes:
-            self._exitcount += lane.getexits()
-        self.__starthelper__(dict,count,hitbox)
+        for lane in self._world.getLanes():
+            self._lanes.append(classes[lane.getType()](lane,self._width))
+        rows = len(spec.getLanes())*GRID_SIZE
+        self._background = GLayer(x=self._width/2,y=rows/2,width=self._width,\
+        height=rows,children=[lane.getTile() for lane in self._lanes])
+        self.__starthelper__(len(spec.getLanes())+0.5,spec.getFrogHitboxes())
+
+    def profile(self,profiler):
+        """
+        Registers the level and its lanes with the frame profiler.
+
+        The level is timed as 'level', and each lane (from the bottom) as 'lane0-grass',
+        'lane1-road' and so on.  The update time of a lane is its simulation, and
+        the draw time is its view.
+
+        Parameter profiler: The frame profiler
+        Precondition: profiler is a GProfiler object
+        """
+        profiler.register(self,'level')
+        states = self._world.getLanes()
+        for pos in range(len(self._lanes)):
+            name = 'lane%d-%s' % (pos,states[pos].getType())
+            profiler.register(states[pos],name)
+            profiler.register(self._lanes[pos],name)
 
     # UPDATE METHOD TO MOVE THE FROG AND UPDATE ALL OF THE LANES
     def update(self,dt):
         """
         Updates the game objects each frame.
 
+        Returns the result of the frame from World.step: 1 if the level is won, -1 if
+        it is lost, 0 if the game should pause, or None to keep playing.
+
         Parameter dt: The time in seconds since last update
         Precondition: dt is a number (int or float)
         """
-        lanes = self._lanes
-        for lane in lanes:
-            lane.update(dt,self._frog)
-        onlogcount=0
-        if not self._animator is None:
-            try:
-                self._animator.send(dt)
-            except:
-                self._animator = None
-                self._dead=0
-        elif(isinstance(self.__updateDeath__(),int)):
-            return self._updateDeath
-        elif self._frog != None:
-            if(self.__updatecontinue__(lanes,onlogcount)==1):
-                return
-            elif(self.__inputcheck__(lanes)==1):
-                return
+        action = None
+        for direction in ('right','left','up','down'):
+            if self._input.is_key_down(direction):
+                action = direction
+                break
+        result = self._world.step(dt,action)
+        for sound in self._world.getEvents():
+            self._sounds.play(sound)
+        return result
 
     # DRAW METHOD TO DRAW THE FROG AND THE INDIVIDUAL LANES
-    def draw(self,view):
+    def draw(self,view,alpha=1.0):
         """
         Draw the lane and frog objects into view.
 
         Parameter view: The view to draw to
         Precondition: view is a GView object
+
+        Parameter alpha: How far through the last simulation step to draw everything
+        Precondition: alpha is a number in 0..1
         """
+        self._background.draw(view)
         for lane in self._lanes: #style points?
-            lane.draw(view)
-        if self._frog != None:
+            lane.draw(view,alpha)
+        frog = self._world.getFrog()
+        if frog != None:
+            self.__copysprite__(frog,self._frog,alpha)
             self._frog.draw(view)
-        for lives in self._lives:
+        for lives in self._lives[FROG_LIVES-self._world.getLives():]:
             lives.draw(view)
+        for x,y in self._world.getSafe()[len(self._safefrog):]:
+            self._safefrog.append(GImage(x=x,y=y,width=GRID_SIZE,height=GRID_SIZE,\
+            source=FROG_SAFE))
         for frogs in self._safefrog:
             frogs.draw(view)
-        if self._dead==1:
+        if self._world.isDying():
+            self.__copysprite__(self._world.getDeath(),self._death,alpha)
             self._death.draw(view)
 
     # ANY NECESSARY HELPERS (SHOULD BE HIDDEN)
-    def __starthelper__(self,dict,count,hitbox):
+    def __starthelper__(self,count,hitbox):
         """
         Helps the start method initialize the level.
 
         Helps the start method to initalize the frog and the remaining lives.
 
-        Parameter dict: The dictionary with each level's information
-        Precondition: dict is a dictionary
-
         Parameter count: Number of lanes
         Precondition: count is a number (float)
 
-        Parameter hitbox: The dictionary containing the hitbox sizes of each object
-        Precondition: hitbox is a dictionary
+        Parameter hitbox: The hitbox of each frame of the frog
+        Precondition: hitbox is a tuple of 4-element tuples
         """
-        self._startfrogx = (count+1.5)*GRID_SIZE/2
-        self._froghitbox = hitbox['sprites'].get('frog').get('hitboxes')
-        self._frog = Frog(x=(count+1.5)*GRID_SIZE/2,y=GRID_SIZE/2,\
-        hitboxes=self._froghitbox)
+        self._froghitbox = hitbox
         self._lives = [GImage(x=self.getWidth()-(0.5*GRID_SIZE),\
         y=count*GRID_SIZE,width=GRID_SIZE,height=GRID_SIZE,source=FROG_HEAD),\
         GImage(x=self.getWidth()-(1.5*GRID_SIZE),y=count*GRID_SIZE,\
         width=GRID_SIZE,height=GRID_SIZE,source=FROG_HEAD),\
         GImage(x=self.getWidth()-(2.5*GRID_SIZE),y=count*GRID_SIZE,\
         width=GRID_SIZE,height=GRID_SIZE,source=FROG_HEAD),\
-        GLabel(text='LIVES:')]
-        self._frog.dead=0
-        self._undead=1
-        self._lives[3].font_size = ALLOY_SMALL
-        self._lives[3].font_name = ALLOY_FONT
-        self._lives[3].linecolor = 'dark green'
+        GLabel(text='LIVES:',font_size=ALLOY_SMALL,font_name=ALLOY_FONT,\
+        linecolor='dark green',glyphs=True)]
         self._lives[3].x = self.getWidth()-(4.2*GRID_SIZE)
         self._lives[3].y = count*GRID_SIZE
-        self._animator = None
-        self._death=GSprite(x=-GRID_SIZE,y=0,source=DEATH_SPRITE+'.png',\
-        angle=FROG_SOUTH,format=(2,4))
-        self._dead=0
-        self._jumpSound = Sound(CROAK_SOUND)
-        self._deathSound = Sound(SPLAT_SOUND)
-        self._winSound = Sound(TRILL_SOUND)
-        self._lastleafx=0
-        self._lastleafy=0
-        self._collidestatus=0
+        self.__makesprites__()
 
     def __frogrejack__(self):
         """
         Draws frog in starting position.
-        """
-        self._frog = Frog(x=self._startfrogx,y=GRID_SIZE/2,\
-        hitboxes=self._froghitbox)
-        self._frog.dead=0
-        self._undead=1
-        self._death=GSprite(x=-GRID_SIZE,y=0,source=DEATH_SPRITE+'.png',\
-        angle=FROG_SOUTH,format=(2,4))
-
-    def __checkcollide__(self,lanes,direction):
-        """
-        Helper method of update.
-
-        Checks for collisions of the frog object.
-
-        Parameter lanes: The lanes in the level
-        Precondtion: A list of objects
 
-        Parameter direction: The direction to slide.
-        Precondition: direction is a string
+        The frog and death sprites are reset in place, not made again.
         """
-        x = self._frog.x
-        y = self._frog.y
-        self.__directionmodifier__(direction)
-        for lane in lanes:
-            if self._frog.collides(lane._tile) == True:
-                if lane._tile.source.find('hedge') != -1:
-                    for i in range(len(lane._objs)+1):
-                        if i == len(lane._objs):
-                            self._frog.x = x
-                            self._frog.y = y
-                            return 2
-                        if lane._objs[i].source.find('open') != -1 and \
-                        self._frog.collides(lane._objs[i]) == True:
-                            break
-                        if lane._objs[i].source.find('exit') != -1 and \
-                        self._frog.contains((lane._objs[i].x,\
-                        lane._objs[i].y))\
-                        == True and y <= lane._objs[i].y and \
-                        lane._objs[i].blocked == 0:
-                            lane._objs[i].blocked = 1
-                            self._lastleafx=lane._objs[i].x
-                            self._lastleafy=lane._objs[i].y
-                            self._frog.x = x
-                            self._frog.y = y
-                            return 3
-        self._frog.x = x
-        self._frog.y = y
-
-    def __directionmodifier__(self,direction):
-        """
-        Helper method of update.
-
-        Modifies the direction of the frog.
-
-        Parameter direction: The direction to slide.
-        Precondition: direction is a string
-        """
-        if direction == 'up':
-            self._frog.y+=GRID_SIZE
-        if direction == 'down':
-            self._frog.y-=GRID_SIZE
-        if direction == 'left':
-            self._frog.x-=GRID_SIZE
-        if direction == 'right':
-            self._frog.x+=GRID_SIZE
-
-    def __inputcheck__(self,lanes):
-        """
-        Helper method of update.
-
-        Checks for input of the arrow keys for frog movement.
-
-        Parameter lanes: The lanes in the level
-        Precondtion: A list of objects
-        """
-        if self._input.is_key_down('right'):
-            self._frog.angle = FROG_EAST
-            if(self.__checkcollide__(lanes,'right')==2): return 1
-            self._animator = self.__animateslide__('right',self._frog)
-            next(self._animator)
-            self._jumpSound.play()
-        elif self._input.is_key_down('left'):
-            self._frog.angle = FROG_WEST
-            if(self.__checkcollide__(lanes,'left')==2): return 1
-            self._animator = self.__animateslide__('left',self._frog)
-            next(self._animator)
-            self._jumpSound.play()
-        elif self._input.is_key_down('up'):
-            self._frog.angle = FROG_NORTH
-            self._collidestatus =self.__checkcollide__(lanes,'up')
-            if(self._collidestatus==2): return 1
-            self._animator = self.__animateslide__('up',self._frog)
-            next(self._animator)
-            self._jumpSound.play()
-        elif self._input.is_key_down('down'):
-            self._frog.angle = FROG_SOUTH
-            if(self.__checkcollide__(lanes,'down')==2): return 1
-            self._animator = self.__animateslide__('down',self._frog)
-            next(self._animator)
-            self._jumpSound.play()
-
-    def __updatecontinue__(self,lanes,onlogcount):
-        """
-        A helper of the update method.
-
-        Handles car collisions and log riding.
-
-        Parameter lanes: The lanes in the level
-        Precondtion: A list of objects
-
-        Parameter onlogcount: The status of if the frog is on a log or not
-        Precondtion: onlogcount is a number (int)
-        """
-        for lane in lanes:
-            if self._frog.collides(lane._tile) == True:
-                if lane._tile.source.find('water') != -1:
-                    for i in range(len(lane._objs)):
-                        if lane._objs[i].source.find('log') != -1:
-                            for j in range(int(round(lane._objs[i].right))-\
-                            int(round(lane._objs[i].left))-\
-                            int(round(1.5*GRID_SIZE))):
-                                tmp=GRID_SIZE/1.5+\
-                                int(round(lane._objs[i].left+j+1))
-                                angle = self._frog.angle
-                                self._frog.angle=0
-                                if self._frog.contains((tmp,lane._objs[i].y))\
-                                ==True:
-                                    lane._objs[i].onlog = 1
-                                self._frog.angle=angle
-                        onlogcount+=lane._objs[i].onlog
-                    if(onlogcount==0):
-                        self._dead=1
-                        return 1
-                if lane._tile.source.find('road') != -1:
-                    for i in range(len(lane._objs)):
-                        if (lane._objs[i].source.find('car') != -1 or \
-                        lane._objs[i].source.find('truck') != -1 or \
-                        lane._objs[i].source.find('trailer') != -1 or \
-                        lane._objs[i].source.find('flatbed') != -1)and\
-                        self._frog.collides(lane._objs[i]) == True:
-                            self._dead=1
-                            return 1
-
-    def __updateDeath__(self):
-        """
-        Helper method of update.
+        self._world.respawn()
+        frog = self._world.getFrog()
+        self._frog.reset(frog.x,frog.y)
+        self._death.reset()
 
-        Handles the frog's death status. Updates the frog's death status.
+    def __makesprites__(self):
         """
-        if(self._collidestatus==3):
-            self._collidestatus=0
-            self._winSound.play()
-            self._frog = None
-            self._safefrog.append(GImage(x=self._lastleafx,y=self._lastleafy,\
-            width=GRID_SIZE,height=GRID_SIZE,source=FROG_SAFE))
-            if len(self._safefrog) == self._exitcount:
-                self._updateDeath = 1
-                return 1
-            self._updateDeath = 0
-            return 0
-        elif self._dead==1:
-            self._death.x=self._frog.x
-            self._death.y=self._frog.y
-            self._frog = None
-            self._deathSound.play()
-            self._animator=self.__animateslide__('dead',self._death)
-            next(self._animator)
-            self._undead=0
-        elif self._undead==0:
-            if len(self._lives) == 1:
-                self._updateDeath = -1
-                return -1
-            self._lives.pop(0)
-            self._updateDeath = 0
-            return 0
-        else:
-            return 'none'
-
-    def __animateslide__(self,direction,obj):
+        Creates the frog and death sprites.
         """
-        Helper method of update.
+        frog = self._world.getFrog()
+        self._frog = Frog(x=frog.x,y=frog.y,hitboxes=self._froghitbox)
+        self._death = Death()
 
-        Animates a  vertical up or down of the image over ANIMATION_SPEED seconds
-
-        This method is a coroutine that takes a break (so that the game
-        can redraw the image) every time it moves it. The coroutine takes
-        the dt as periodic input so it knows how many (parts of) seconds
-        to animate.
-
-        Parameter dt: The time since the last animation frame.
-        Precondition: dt is a float.
-
-        Parameter direction: The direction to slide.
-        Precondition: direction is a string
-
-        Parameter obj: The frog's data
-        Precondtion: obj is a list
-        """
-        self._animating,dtsum,notdeep=True,0,0
-        if direction != 'dead':
-            numberlist=self.__animationdirection__(direction,obj)
-            curpos,nexpos,steps = numberlist[0],numberlist[1],numberlist[2]
-            deeper = FROG_SPEED/8
-            while self._animating:
-                dt = (yield)
-                dtsum+=dt
-                if round(dtsum,5)>deeper:
-                    dtsum=0
-                    if(notdeep==0): obj.frame+=1
-                    if(obj.frame==4): notdeep=1
-                    if(notdeep==1):
-                        obj.frame-=1
-                        if(obj.frame==0): notdeep=0
-                if self.__endanimation__(obj,direction,steps,dt,\
-                curpos,nexpos)==2: continue
-        else:
-            deeper = DEATH_SPEED/8
-            while self._animating:
-                dt = (yield)
-                dtsum+=dt
-                if round(dtsum,5)>deeper:
-                    dtsum=0
-                    if(notdeep==0): obj.frame+=1
-                    if(obj.frame==7): notdeep=1
-                    if(notdeep==1):
-                        obj.frame=0
-                        self._animating=False
-
-    def __animationdirection__(self,direction,obj):
-        """
-        Helper method of update.
-
-        Updates the direction of the objects of the level.
-
-        Parameter direction: The direction to slide.
-        Precondition: direction is a string
-
-        Parameter obj: The frog's data
-        Precondtion: obj is a list
+    def __copysprite__(self,state,sprite,alpha):
         """
-        curpos=0
-        nexpos=0
-        steps=0
-        if direction == 'up':
-            curpos = obj.y
-            nexpos = sorted([GRID_SIZE/2, obj.y+GRID_SIZE,self.getHeight()-\
-            GRID_SIZE*1.5])[1]
-            steps = abs((nexpos-curpos)/FROG_SPEED)
-        if direction == 'down':
-            curpos = obj.y
-            nexpos = sorted([GRID_SIZE/2,obj.y-GRID_SIZE, self.getHeight()-\
-            GRID_SIZE/2])[1]
-            steps = abs((nexpos-curpos)/FROG_SPEED)
-        if direction == 'left':
-            curpos = obj.x
-            nexpos = sorted([GRID_SIZE/2, obj.x-GRID_SIZE, self.getWidth()-\
-            GRID_SIZE/2])[1]
-            steps = abs((nexpos-curpos)/FROG_SPEED)
-        if direction == 'right':
-            curpos = obj.x
-            nexpos = sorted([GRID_SIZE/2, obj.x+GRID_SIZE, self.getWidth()-\
-            GRID_SIZE/2])[1]
-            steps = abs((nexpos-curpos)/FROG_SPEED)
-        return [curpos,nexpos,steps]
-
-    def __endanimation__(self,obj,direction,steps,dt,curpos,nexpos):
-        """
-        Helper method of update.
-
-        Concludes the animation of the frog's motion
-
-        Parameter obj: The frog's data
-        Precondtion: obj is a list
-
-        Parameter direction: The direction to slide.
-        Precondition: direction is a string
-
-        Parameter steps: The velocity of the frog
-        Precondtion: steps is a number (float)
+        Moves a sprite to the position, angle and frame of its simulation.
 
-        Parameter dt: The time since the last animation frame.
-        Precondition: dt is a float.
+        Parameter state: The simulated sprite
+        Precondition: state is a SpriteState object
 
-        Parameter curpos: The current position of the frog
-        Precondtion: curpos is a number (float)
+        Parameter sprite: The sprite to draw
+        Precondition: sprite is a GSprite object
 
-        Parameter nexpos: The next position of the frog
-        Precondtion: nexpos is a number (float)
+        Parameter alpha: How far through the last simulation step to draw the sprite
+        Precondition: alpha is a number in 0..1
         """
-        amount = steps*dt
-        if steps==0:
-            self._animating = False
-            return 2
-        if direction == 'up':
-            obj.y +=amount
-            if abs(obj.y-curpos) >= GRID_SIZE:
-                obj.y = nexpos
-                obj.frame=0
-                self._animating = False
-        if direction == 'down':
-            obj.y -=amount
-            if abs(obj.y-curpos) >= GRID_SIZE:
-                obj.y = nexpos
-                obj.frame=0
-                self._animating = False
-        if direction == 'left':
-            obj.x -=amount
-            if abs(obj.x-curpos) >= GRID_SIZE:
-                obj.x = nexpos
-                obj.frame=0
-                self._animating = False
-        if direction == 'right':
-            obj.x +=amount
-            if abs(obj.x-curpos) >= GRID_SIZE:
-                obj.x = nexpos
-                obj.frame=0
-                self._animating = False
+        sprite.x, sprite.y = (state.x,state.y) if alpha >= 1 else state.lerp(alpha)
+        sprite.angle = state.angle
+        sprite.frame = state.frame
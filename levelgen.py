@@ -0,0 +1,171 @@
+"""
+Level generator for Froggit
+
+This module makes new levels, in the same format as the level files in the JSON
+folder.  The levels are random, but the same seed always makes the same level, so a
+generated level can be used to measure how the game scales to large grids with
+thousands of obstacles (see bench/frames.py).
+
+A level is made of lanes.  The bottom lane is always grass (where the frog starts),
+and the top lane is always a hedge with an exit in every third square.  Every lane in
+between is picked from a mix of lane types, and filled with obstacles:
+
+    python levelgen.py --size 100 100 --mix road=3,water=2,grass=1 --density 0.4
+                       --speed 40 160 --seed 1 --output JSON/big.json
+
+Without --output the level is printed.  From Python, use the function generate.
+
+# Christopher Ambrus caa66
+# DATE COMPLETED HERE
+"""
+from consts import *
+from world import load_catalogue
+import random
+import json
+import argparse
+
+# PRIMARY RULE: The generator cannot access game2d, app.py, level.py, lanes.py or
+# models.py.  It only makes level files, so it never needs Kivy.
+
+# The obstacles to pick from for each lane type (the giant ones cover several lanes)
+LANE_OBJECTS = {'road' :('car1','car2','car3','car4','car5','car6','truck1','truck2',
+                         'truck3','trailer1','trailer2','flatbed'),
+                'water':('log1','log2','log3','log4','log5'),
+                'grass':()}
+
+# The default mix of lane types (each is picked in proportion to its weight)
+LANE_MIX = {'road':3,'water':2,'grass':1}
+
+
+def generate(width,height,mix=LANE_MIX,density=0.4,speed=(60,120),offscreen=2,\
+seed=None,objects=OBJECT_DATA):
+    """
+    Returns: A new level, as the contents of a level file (a dictionary)
+
+    This raises a ValueError if the arguments cannot make a level.
+
+    Parameter width: The width of the level in grid squares
+    Precondition: width is an int > 0
+
+    Parameter height: The number of lanes
+    Precondition: height is an int >= 2
+
+    Parameter mix: The weight of each lane type between the first and last lane
+    Precondition: mix is a dictionary of numbers >= 0 keyed by 'grass', 'road' or
+    'water', with at least one weight > 0
+
+    Parameter density: The share of each road or water lane covered by obstacles
+    Precondition: density is a number in 0..1
+
+    Parameter speed: The slowest and fastest speed of a lane (in pixels per second)
+    Precondition: speed is a pair of numbers 0 <= speed[0] <= speed[1]
+
+    Parameter offscreen: The offscreen buffer for each moving obstacle
+    Precondition: offscreen is a number >= 0
+
+    Parameter seed: The seed of the random numbers (None for a different level each time)
+    Precondition: seed is None or an int
+
+    Parameter objects: The object data file with the size of each obstacle
+    Precondition: objects is a string naming a file in the JSON folder
+    """
+    if type(width) != int or width <= 0 or type(height) != int or height < 2:
+        raise ValueError('%s is not a valid size' % repr((width,height)))
+    if any(not kind in LANE_OBJECTS for kind in mix) or \
+    any(weight < 0 for weight in mix.values()) or sum(mix.values()) <= 0:
+        raise ValueError('%s is not a valid lane mix' % repr(mix))
+    if not 0 <= density <= 1:
+        raise ValueError('%s is not a valid density' % repr(density))
+    if not 0 <= speed[0] <= speed[1]:
+        raise ValueError('%s is not a valid speed range' % repr(speed))
+
+    catalogue = load_catalogue(objects)
+    rng = random.Random(seed)
+    kinds = sorted(mix)
+    weights = [mix[kind] for kind in kinds]
+    lanes = [{'type':'grass'}]
+    for row in range(1,height-1):
+        kind = rng.choices(kinds,weights)[0]
+        if kind == 'grass':
+            lanes.append({'type':'grass'})
+            continue
+        velocity = round(rng.uniform(speed[0],speed[1]))*(1 if row % 2 else -1)
+        lanes.append({'type':kind,'speed':velocity,\
+        'objects':_fill(rng,catalogue,LANE_OBJECTS[kind],width,density)})
+    exits = [{'type':'exit','position':col} for col in range(1,width,3)]
+    lanes.append({'type':'hedge','objects':exits})
+    return {'version':1.0,'size':[width,height],'start':[width//2,0],\
+    'offscreen':offscreen,'lanes':lanes}
+
+
+def _fill(rng,catalogue,names,width,density):
+    """
+    Returns: The obstacles of one lane, as a list of level file objects
+
+    Obstacles are placed from left to right, with random gaps that average out to
+    the given density.
+
+    Parameter rng: The random numbers
+    Precondition: rng is a random.Random object
+
+    Parameter catalogue: The size of each obstacle
+    Precondition: catalogue is a Catalogue object with every name in names
+
+    Parameter names: The obstacles to pick from
+    Precondition: names is a non-empty tuple of strings
+
+    Parameter width: The width of the lane in grid squares
+    Precondition: width is an int > 0
+
+    Parameter density: The share of the lane covered by obstacles
+    Precondition: density is a number in 0..1
+    """
+    result = []
+    if density == 0:
+        return result
+    left = rng.uniform(0,2)
+    while True:
+        name = rng.choice(names)
+        size = catalogue.lookup(name+'.png').getSize()[0]/GRID_SIZE
+        if left+size > width:
+            return result
+        # A position is the grid square the center of the obstacle is in
+        result.append({'type':name,'position':round(left+size/2-0.5,2)})
+        left += size+size*(1-density)/density*rng.uniform(0.5,1.5)
+
+
+def main():
+    """
+    Makes a level from the command line arguments and prints or saves it.
+    """
+    parser = argparse.ArgumentParser(description='Makes a random Froggit level.')
+    parser.add_argument('--size',type=int,nargs=2,default=[16,13],metavar=('WIDTH','HEIGHT'),\
+    help='the grid squares across and the number of lanes (default: 16 13)')
+    parser.add_argument('--mix',default='road=3,water=2,grass=1',\
+    help='the weight of each lane type (default: road=3,water=2,grass=1)')
+    parser.add_argument('--density',type=float,default=0.4,\
+    help='the share of each lane covered by obstacles (default: 0.4)')
+    parser.add_argument('--speed',type=float,nargs=2,default=[60,120],metavar=('LOW','HIGH'),\
+    help='the range of lane speeds (default: 60 120)')
+    parser.add_argument('--offscreen',type=int,default=2,help='the offscreen buffer')
+    parser.add_argument('--seed',type=int,help='the seed of the random numbers')
+    parser.add_argument('--output',help='the level file to write (default: print it)')
+    args = parser.parse_args()
+
+    try:
+        mix = dict((kind,float(weight)) for (kind,weight) in \
+        (pair.split('=') for pair in args.mix.split(',')))
+        level = generate(args.size[0],args.size[1],mix,args.density,tuple(args.speed),\
+        args.offscreen,args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+    text = json.dumps(level,indent=1)
+    if args.output is None:
+        print(text)
+    else:
+        with open(args.output,'w') as file:
+            file.write(text+'\n')
+
+
+if __name__ == '__main__':
+    main()
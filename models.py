@@ -74,6 +74,58 @@ class Frog(GSprite):         # You will need to change this by Task 3
         super().__init__(x=x,y=y,source=FROG_SPRITE+'.png',\
         angle=FROG_NORTH,format=(1,5))
         self.hitboxes=hitboxes
+
     # ADDITIONAL METHODS (DRAWING, COLLISIONS, MOVEMENT, ETC)
+    def reset(self,x,y):
+        """
+        Restores the frog to a new starting position.
+
+        The frog faces north on its first frame, just like a new frog.  This reuses
+        the sprite frames, so it is much faster than making a new Frog.
+
+        Parameter x: The x (horizontal) postion of the frog
+        Precondition: x is a number (float)
+
+        Parameter y: The y (vertical) postion of the frog
+        Precondition: y is a number (float)
+        """
+        self._x = x
+        self._y = y
+        self.x = x
+        self.y = y
+        self.angle = FROG_NORTH
+        self.frame = 0
+
 
 # IF YOU NEED ADDITIONAL LANE CLASSES, THEY GO HERE
+class Death(GSprite):
+    """
+    A class representing the death animation of the frog
+
+    The animation is played wherever the frog dies.  Until then (and after a respawn)
+    it waits offscreen, so that the same sprite can be used for every death.
+    """
+
+    # INITIALIZER TO SET THE SPRITE OFFSCREEN
+    def __init__(self):
+        """
+        Initializes the death sprite offscreen.
+        """
+        super().__init__(x=-GRID_SIZE,y=0,source=DEATH_SPRITE+'.png',\
+        angle=FROG_SOUTH,format=(2,4))
+
+    # ADDITIONAL METHODS (DRAWING, COLLISIONS, MOVEMENT, ETC)
+    def reset(self,x=-GRID_SIZE,y=0):
+        """
+        Restores the death sprite to the start of its animation.
+
+        Parameter x: The x (horizontal) postion of the sprite (offscreen by default)
+        Precondition: x is a number (float)
+
+        Parameter y: The y (vertical) postion of the sprite
+        Precondition: y is a number (float)
+        """
+        self.x = x
+        self.y = y
+        self.angle = FROG_SOUTH
+        self.frame = 0
@@ -0,0 +1,101 @@
+"""
+Tests for game2d.grectangle
+
+A GLabel has its own edge properties, which should agree with those of a GRectangle
+with the same position, size and angle.  A GLabel that uses a glyph atlas should never
+render text when only its text changes.
+
+    python -m pytest tests
+"""
+import os
+import sys
+import unittest
+from unittest import mock
+
+os.environ['KIVY_NO_ARGS'] = '1'
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game2d import GLabel, GRectangle
+from game2d.gtext import GlyphAtlas
+
+
+class RotatedEdgesTest(unittest.TestCase):
+    """
+    Compares the edges of a rotated, translated GLabel and GRectangle.
+    """
+
+    def check(self,x,y,width,height,angle):
+        """
+        Checks the four edges of a label and a rectangle with the given geometry.
+
+        Parameter x: The horizontal center
+        Precondition: x is a number
+
+        Parameter y: The vertical center
+        Precondition: y is a number
+
+        Parameter width: The width of both shapes
+        Precondition: width is a number > 0
+
+        Parameter height: The height of both shapes
+        Precondition: height is a number > 0
+
+        Parameter angle: The angle of both shapes
+        Precondition: angle is a number
+        """
+        label = GLabel(x=x,y=y,width=width,height=height,text='edges')
+        label.angle = angle     # GLabel passes its keywords on to Kivy, which has no angle
+        rect = GRectangle(x=x,y=y,width=width,height=height,angle=angle)
+        for edge in ('left','right','top','bottom'):
+            self.assertAlmostEqual(getattr(label,edge),getattr(rect,edge),places=4,\
+            msg='%s at angle %s' % (edge,angle))
+
+    def test_quarter_turn(self):
+        self.check(300,200,100,40,90)
+        self.assertAlmostEqual(GRectangle(x=300,y=200,width=100,height=40,angle=90).left,280)
+
+    def test_diagonal(self):
+        self.check(300,200,100,40,45)
+
+    def test_any_angle(self):
+        for angle in (30,135,200,-60):
+            self.check(-120,75.5,64,32,angle)
+
+
+class GlyphLabelTest(unittest.TestCase):
+    """
+    Checks that a GLabel with glyphs draws changing text without rendering it.
+    """
+
+    def test_text_does_not_render(self):
+        label = GLabel(text='Score: 0',glyphs=True)
+        render = mock.patch.object(GlyphAtlas,'_render',autospec=True,\
+        side_effect=GlyphAtlas._render)
+        update = mock.patch.object(label._label,'texture_update')
+        with render as rendered, update as updated:
+            for score in range(1,200):
+                label.text = 'Score: %d' % score
+        self.assertEqual(rendered.call_count,0)
+        self.assertEqual(updated.call_count,0)
+        self.assertEqual(label.text,'Score: 199')
+        self.assertEqual(label._label.text,'')
+
+    def test_label_grows_to_fit(self):
+        label = GLabel(text='0',glyphs=True)
+        width = label.width
+        label.text = '0000000000'
+        self.assertGreater(label.width,width)
+        label.text = '0'
+        self.assertEqual(label.text,'0')
+
+    def test_bold_uses_texture(self):
+        label = GLabel(text='Bold',glyphs=True)
+        label.bold = True
+        self.assertEqual(label._label.text,'Bold')
+        label.bold = False
+        self.assertEqual(label._label.text,'')
+        self.assertEqual(label.text,'Bold')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+"""
+Tests for the headless game rules in world.py
+
+Each test plays a World one frame at a time, the way the game does, but with no
+window.  The levels are either shipped with the game or made here, with the frog
+starting in the middle column of a level 5 squares wide.
+
+    python -m pytest tests
+"""
+import os
+import sys
+import unittest
+
+# consts.py reads the level and frog speed from the arguments, so hide the test runner's
+sys.argv = sys.argv[:1]
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from consts import *
+from world import *
+
+# The center of the column the frog starts in, and of the lane above the start
+START_X = 2.5*GRID_SIZE
+LANE_ONE = 1.5*GRID_SIZE
+
+
+def make_level(lanes,width=5):
+    """
+    Returns: A LevelSpec with the given lanes (and an offscreen buffer of 2)
+
+    Parameter lanes: The lanes of the level, from the bottom
+    Precondition: lanes is a list of lanes as in a level file
+
+    Parameter width: The width of the level in grid squares
+    Precondition: width is an int > 0
+    """
+    level = {'version':1.0,'size':[width,len(lanes)],'start':[width//2,0],\
+    'offscreen':2,'lanes':lanes}
+    return LevelSpec(level,load_catalogue(),'test')
+
+
+def play(world,action=None,frames=600):
+    """
+    Returns: The first result of step that is not None, or None if there is none
+
+    The action is only given on the first frame, like a single key press.
+
+    Parameter world: The world to play
+    Precondition: world is a World object
+
+    Parameter action: The direction the frog moves on the first frame
+    Precondition: action is None or one of 'right','left','up','down'
+
+    Parameter frames: The most frames to play
+    Precondition: frames is an int > 0
+    """
+    for frame in range(frames):
+        result = world.step(GAME_STEP,action if frame == 0 else None)
+        if not result is None:
+            return result
+    return None
+
+
+class WorldTest(unittest.TestCase):
+    """
+    Plays the rules of each kind of lane.
+    """
+
+    def test_car_kills_frog(self):
+        world = World(load_level('easy1.json'))
+        self.assertEqual(world.getLives(),FROG_LIVES)
+        world.step(GAME_STEP,'up')
+        self.assertEqual(world.getEvents(),[CROAK_SOUND])
+
+        splat = False
+        for frame in range(2000):
+            result = world.step(GAME_STEP)
+            splat = splat or SPLAT_SOUND in world.getEvents()
+            if not result is None:
+                break
+        self.assertEqual(result,0)
+        self.assertTrue(splat)
+        self.assertIsNone(world.getFrog())
+        self.assertEqual(world.getLives(),FROG_LIVES-1)
+
+    def test_log_carries_frog_then_drowns(self):
+        world = World(make_level([{'type':'grass'},\
+        {'type':'water','speed':60,'objects':[{'type':'log4','position':2}]},\
+        {'type':'grass'}]))
+        for frame in range(20):
+            self.assertIsNone(world.step(GAME_STEP,'up' if frame == 0 else None))
+        self.assertEqual(world.getFrog().y,LANE_ONE)
+
+        x = world.getFrog().x
+        for frame in range(30):
+            self.assertIsNone(world.step(GAME_STEP))
+        self.assertAlmostEqual(world.getFrog().x-x,30*GAME_STEP*60)
+
+        # The log carries the frog off the edge of the level, where it drowns
+        self.assertEqual(play(world,frames=2000),0)
+        self.assertEqual(world.getLives(),FROG_LIVES-1)
+
+    def test_water_without_log_drowns(self):
+        world = World(make_level([{'type':'grass'},{'type':'water','speed':60},\
+        {'type':'grass'}]))
+        self.assertEqual(play(world,'up'),0)
+        self.assertEqual(world.getLives(),FROG_LIVES-1)
+
+    def test_hedge_exits(self):
+        world = World(make_level([{'type':'grass'},{'type':'grass'},{'type':'hedge',\
+        'objects':[{'type':'exit','position':2},{'type':'exit','position':3}]}]))
+        self.assertIsNone(play(world,'up'))
+        self.assertEqual(play(world,'up'),0)
+        self.assertEqual(world.getSafe(),[(START_X,2.5*GRID_SIZE)])
+        self.assertEqual(world.getEvents(),[TRILL_SOUND])
+        self.assertIsNone(world.getFrog())
+
+        # The exit is taken, so the hedge blocks the next frog
+        world.respawn()
+        self.assertIsNone(play(world,'up'))
+        self.assertIsNone(play(world,'up',60))
+        self.assertEqual(world.getFrog().y,LANE_ONE)
+        self.assertEqual(world.getEvents(),[])
+
+        # Taking the last exit wins the level
+        self.assertIsNone(play(world,'right'))
+        self.assertEqual(play(world,'up'),1)
+        self.assertEqual(len(world.getSafe()),2)
+
+    def test_hedge_blocks_between_exits(self):
+        world = World(make_level([{'type':'grass'},{'type':'grass'},{'type':'hedge',\
+        'objects':[{'type':'exit','position':0}]}]))
+        self.assertIsNone(play(world,'up'))
+        self.assertIsNone(play(world,'up',60))
+        self.assertEqual(world.getFrog().y,LANE_ONE)
+
+    def test_lives_and_respawn(self):
+        world = World(make_level([{'type':'grass'},{'type':'water','speed':60},\
+        {'type':'grass'}]))
+        for lives in range(FROG_LIVES-1,-1,-1):
+            self.assertEqual(play(world,'up'),0)
+            self.assertEqual(world.getLives(),lives)
+            world.respawn()
+            self.assertEqual((world.getFrog().x,world.getFrog().y),(START_X,GRID_SIZE/2))
+            self.assertFalse(world.isDying())
+
+        # Dying with no lives left loses the level
+        self.assertEqual(play(world,'up'),-1)
+        self.assertEqual(world.getLives(),0)
+
+
+if __name__ == '__main__':
+    unittest.main()
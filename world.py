@@ -0,0 +1,1511 @@
+"""
+Simulation module for Froggit
+
+This module contains the rules of a Froggit level, separated from the drawing.  The
+classes here know where the frog and every obstacle is, how they move, and when the
+frog is safe, dead, or home.  They do not know anything about Kivy, so a level can be
+played without a window: make a World from a level (see load_level), and call the
+method step once per frame.  That is what the benchmarks and any automated play
+should use.
+
+The classes in level.py and lanes.py are views of this module.  They own the images,
+labels, and sounds, and copy the positions out of the World when they draw.
+
+# Christopher Ambrus caa66
+# DATE COMPLETED HERE
+"""
+from consts import *
+import numpy as np
+import json
+import os
+
+# PRIMARY RULE: The simulation cannot access game2d, app.py, level.py, lanes.py or
+# models.py.  It can only access consts.py, so that it never needs Kivy.
+
+
+def load_json(name):
+    """
+    Returns: The contents of the JSON file name in the JSON folder
+
+    This is the headless version of GameApp.load_json, for when there is no
+    application to load the file.
+
+    Parameter name: The file name
+    Precondition: name is a string naming a file in the JSON folder
+    """
+    with open(json_path(name)) as file:
+        return json.load(file)
+
+
+def json_path(name):
+    """
+    Returns: The path to the file name in the JSON folder
+
+    Parameter name: The file name
+    Precondition: name is a string
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)),'JSON',name)
+
+
+# The LevelSpec for each (level file, object file) pair, with the file times it was
+# read at.  Loading the same level again only checks the file times.
+LEVEL_CACHE = {}
+
+# The Catalogue for each object file, with the file time it was read at
+CATALOGUE_CACHE = {}
+
+
+def load_catalogue(name=OBJECT_DATA):
+    """
+    Returns: The Catalogue for the object data file name
+
+    Like load_level, the file is only read again if it has changed since the last
+    time it was loaded.
+
+    This raises a ValueError if the file is not a valid object data file (and
+    OSError if the file cannot be read).
+
+    Parameter name: The object data file name
+    Precondition: name is a string naming a file in the JSON folder
+    """
+    path = json_path(name)
+    time = os.path.getmtime(path)
+    if path in CATALOGUE_CACHE and CATALOGUE_CACHE[path][0] == time:
+        return CATALOGUE_CACHE[path][1]
+    catalogue = Catalogue(_readjson(name),name)
+    CATALOGUE_CACHE[path] = (time,catalogue)
+    return catalogue
+
+
+def load_level(name,objects=OBJECT_DATA):
+    """
+    Returns: The LevelSpec for the level file name
+
+    The level is only read (and checked) the first time it is loaded, or if the level
+    file or the object file has changed since then.  Otherwise this returns the same
+    LevelSpec as last time, which is safe because a LevelSpec cannot be changed.
+
+    This raises a ValueError if the level is not a valid level (and OSError if the
+    file cannot be read).
+
+    Parameter name: The level file name
+    Precondition: name is a string naming a file in the JSON folder
+
+    Parameter objects: The object data file name
+    Precondition: objects is a string naming a file in the JSON folder
+    """
+    key = (json_path(name),json_path(objects))
+    times = (os.path.getmtime(key[0]),os.path.getmtime(key[1]))
+    if key in LEVEL_CACHE and LEVEL_CACHE[key][0] == times:
+        return LEVEL_CACHE[key][1]
+    spec = LevelSpec(_readjson(name),load_catalogue(objects),name)
+    LEVEL_CACHE[key] = (times,spec)
+    return spec
+
+
+def _readjson(name):
+    """
+    Returns: The contents of the JSON file name, raising a ValueError if it is not JSON
+
+    Parameter name: The file name
+    Precondition: name is a string naming a file in the JSON folder
+    """
+    try:
+        return load_json(name)
+    except json.JSONDecodeError as e:
+        raise ValueError('%s is not properly formatted: %s' % (name,e))
+
+
+def _isnum(value):
+    """
+    Returns: True if value is an int or float (but not a bool)
+
+    Parameter value: The value to check
+    Precondition: None
+    """
+    return type(value) in [int,float]
+
+
+class ObjectSpec(object):
+    """
+    A class representing one image (or sprite sheet) in the object data file.
+
+    Like a LevelSpec, an ObjectSpec cannot be changed.  Images have a single hitbox;
+    sprite sheets have a format and a hitbox for each frame instead.
+    """
+    # LIST ALL HIDDEN ATTRIBUTES HERE
+    # Attribute _file: The image file
+    # Invariant: _file is a string
+
+    # Attribute _size: The size (width,height) of the image (or one frame)
+    # Invariant: _size is a pair of numbers > 0
+
+    # Attribute _hitbox: The hitbox of the image (inset from left, top, right, bottom)
+    # Invariant: _hitbox is a 4-element tuple of numbers
+
+    # Attribute _format: The (rows,columns) of a sprite sheet
+    # Invariant: _format is a pair of ints > 0, or None if this is not a sprite
+
+    # Attribute _hitboxes: The hitbox of each frame of a sprite sheet
+    # Invariant: _hitboxes is a tuple of 4-element tuples of numbers (empty if this
+    # is not a sprite, or its frames have no hitboxes)
+
+    # Attribute _kind: What the object does to the frog
+    # Invariant: _kind is KIND_HAZARD, KIND_PLATFORM, KIND_EXIT, or KIND_OPEN
+
+    # GETTERS AND SETTERS (ONLY ADD IF YOU NEED THEM)
+    def getFile(self):
+        """
+        Gets the image file
+        """
+        return self._file
+
+    def getSize(self):
+        """
+        Gets the size (width,height) of the image (or one frame)
+        """
+        return self._size
+
+    def getHitbox(self):
+        """
+        Gets the hitbox of the image
+        """
+        return self._hitbox
+
+    def getFormat(self):
+        """
+        Gets the (rows,columns) of a sprite sheet, or None if this is not a sprite
+        """
+        return self._format
+
+    def getHitboxes(self):
+        """
+        Gets the hitbox of each frame of a sprite sheet
+        """
+        return self._hitboxes
+
+    def getKind(self):
+        """
+        Gets what the object does to the frog
+        """
+        return self._kind
+
+    # INITIALIZER TO CHECK THE ENTRY
+    def __init__(self,entry,where):
+        """
+        Initializes the object, raising a ValueError if it is invalid.
+
+        Parameter entry: The entry in the object data file
+        Precondition: None (it should be a dictionary with a file and a size)
+
+        Parameter where: A description of the entry for error messages
+        Precondition: where is a string
+        """
+        if type(entry) != dict or type(entry.get('file')) != str:
+            raise ValueError('%s has no file' % where)
+        size = entry.get('size')
+        if type(size) != list or len(size) != 2 or not all(map(_isnum,size)):
+            raise ValueError('%s has an invalid size' % where)
+        format = entry.get('format')
+        if not format is None and (type(format) != list or len(format) != 2):
+            raise ValueError('%s has an invalid format' % where)
+        self._file = entry['file']
+        self._size = tuple(size)
+        self._hitbox = _checkbox(entry.get('hitbox',[0,0,0,0]),where)
+        self._format = None if format is None else tuple(format)
+        self._hitboxes = tuple(_checkbox(box,where) for box in entry.get('hitboxes',[]))
+        self._kind = OBJECT_KINDS.get(entry.get('kind'),KIND_HAZARD)
+
+
+def _checkbox(box,where):
+    """
+    Returns: The hitbox box as a tuple, raising a ValueError if it is invalid
+
+    Parameter box: The hitbox from the object data file
+    Precondition: None (it should be a list of four numbers)
+
+    Parameter where: A description of the entry for error messages
+    Precondition: where is a string
+    """
+    if type(box) != list or len(box) != 4 or not all(map(_isnum,box)):
+        raise ValueError('%s has an invalid hitbox %s' % (where,repr(box)))
+    return tuple(box)
+
+
+class Catalogue(object):
+    """
+    A class representing the object data file, keyed by image file.
+
+    The object data file is organized by object name, but levels name their objects
+    by image.  This class looks up an object by its image file in one step, instead
+    of searching through every entry.  Use load_catalogue to get one.
+    """
+    # LIST ALL HIDDEN ATTRIBUTES HERE
+    # Attribute _name: The object data file name
+    # Invariant: _name is a string
+
+    # Attribute _entries: The object for each image file
+    # Invariant: _entries is a dictionary of ObjectSpec objects keyed by file name
+
+    # GETTERS AND SETTERS (ONLY ADD IF YOU NEED THEM)
+    def lookup(self,source):
+        """
+        Returns: The object for the image file source, or None if there is none
+
+        Parameter source: The image file
+        Precondition: source is a string
+        """
+        return self._entries.get(source)
+
+    # INITIALIZER TO INDEX THE OBJECTS
+    def __init__(self,data,name='objects'):
+        """
+        Initializes the catalogue, raising a ValueError if it is invalid.
+
+        If two entries have the same file, the last one is used.
+
+        Parameter data: The contents of the object data file
+        Precondition: None (it should be a dictionary with images and sprites)
+
+        Parameter name: The object data file name (for error messages)
+        Precondition: name is a string
+        """
+        if type(data) != dict or not all(type(data.get(section,{})) == dict \
+        for section in ('images','sprites')):
+            raise ValueError('%s is not an object data file' % name)
+        self._name = name
+        self._entries = {}
+        for section in ('images','sprites'):
+            for key, entry in data.get(section,{}).items():
+                obj = ObjectSpec(entry,'%s %s' % (name,repr(key)))
+                self._entries[obj.getFile()] = obj
+
+
+class LaneSpec(object):
+    """
+    A class representing one lane of a level file, after it is checked.
+
+    Every obstacle is already matched to its entry in the object data, so the size,
+    hitbox and kind of each obstacle are ready to use.  A LaneSpec cannot be changed
+    (all of its lists are tuples), so it can be shared by every World of the level.
+    """
+    # LIST ALL HIDDEN ATTRIBUTES HERE
+    # Attribute _type: The background surface of the lane
+    # Invariant: _type is a string
+
+    # Attribute _speed: The speed of the obstacles (negative to move left)
+    # Invariant: _speed is a number (int or float)
+
+    # Attribute _sources: The image file of each obstacle
+    # Invariant: _sources is a tuple of strings
+
+    # Attribute _positions: The position of each obstacle, in grid squares
+    # Invariant: _positions is a tuple of numbers
+
+    # Attribute _sizes: The size (width,height) of each obstacle
+    # Invariant: _sizes is a tuple of pairs of numbers
+
+    # Attribute _hitboxes: The hitbox of each obstacle
+    # Invariant: _hitboxes is a tuple of 4-element tuples of numbers
+
+    # Attribute _kinds: The kind of each obstacle
+    # Invariant: _kinds is a tuple of KIND_HAZARD, KIND_PLATFORM, KIND_EXIT, or
+    # KIND_OPEN
+
+    # GETTERS AND SETTERS (ONLY ADD IF YOU NEED THEM)
+    def getType(self):
+        """
+        Gets the background surface of the lane
+        """
+        return self._type
+
+    def getSpeed(self):
+        """
+        Gets the speed of the obstacles
+        """
+        return self._speed
+
+    def getSources(self):
+        """
+        Gets the image file of each obstacle
+        """
+        return self._sources
+
+    def getPositions(self):
+        """
+        Gets the position of each obstacle, in grid squares
+        """
+        return self._positions
+
+    def getSizes(self):
+        """
+        Gets the size (width,height) of each obstacle
+        """
+        return self._sizes
+
+    def getHitboxes(self):
+        """
+        Gets the hitbox of each obstacle
+        """
+        return self._hitboxes
+
+    def getKinds(self):
+        """
+        Gets the kind of each obstacle
+        """
+        return self._kinds
+
+    # INITIALIZER TO CHECK THE LANE
+    def __init__(self,lane,objects,where):
+        """
+        Initializes the lane from the level file, raising a ValueError if it is invalid.
+
+        Every obstacle must be a single image.  A sprite sheet (such as a turtle) is
+        invalid, as the lanes draw an obstacle as one image with one hitbox.
+
+        Parameter lane: The lane from the level file
+        Precondition: None (it should be a dictionary with a type, and optionally a
+        speed and a list of objects, each with a type and a position)
+
+        Parameter objects: The image of each obstacle
+        Precondition: objects is a Catalogue object
+
+        Parameter where: A description of the lane for error messages
+        Precondition: where is a string
+        """
+        if type(lane) != dict or type(lane.get('type')) != str:
+            raise ValueError('%s has no type' % where)
+        if not _isnum(lane.get('speed',0)):
+            raise ValueError('%s has an invalid speed' % where)
+        if type(lane.get('objects',[])) != list:
+            raise ValueError('%s has an invalid list of objects' % where)
+        self._type = lane['type']
+        self._speed = lane.get('speed',0)
+        sources, positions, sizes, hitboxes, kinds = [], [], [], [], []
+        for obj in lane.get('objects',[]):
+            if type(obj) != dict or type(obj.get('type')) != str or \
+            not _isnum(obj.get('position')):
+                raise ValueError('%s has an invalid object %s' % (where,repr(obj)))
+            source = obj['type']+'.png'
+            entry = objects.lookup(source)
+            if entry is None:
+                raise ValueError('%s has an unknown object %s' % (where,repr(obj['type'])))
+            if not entry.getFormat() is None:
+                raise ValueError('%s has a sprite sheet %s as an object' % (where,repr(obj['type'])))
+            sources.append(source)
+            positions.append(obj['position'])
+            sizes.append(entry.getSize())
+            hitboxes.append(entry.getHitbox())
+            kinds.append(entry.getKind())
+        self._sources = tuple(sources)
+        self._positions = tuple(positions)
+        self._sizes = tuple(sizes)
+        self._hitboxes = tuple(hitboxes)
+        self._kinds = tuple(kinds)
+
+
+class LevelSpec(object):
+    """
+    A class representing a level file, after it is checked.
+
+    This is everything a World needs to start the level: the size of the level, the
+    lanes (as LaneSpec objects) and the frog sprite data.  A LevelSpec cannot be
+    changed, so the same one is used every time the level is loaded (see load_level).
+    """
+    # LIST ALL HIDDEN ATTRIBUTES HERE
+    # Attribute _name: The level file name
+    # Invariant: _name is a string
+
+    # Attribute _size: The size of the level in grid squares (not counting lives)
+    # Invariant: _size is a pair of ints > 0
+
+    # Attribute _offscreen: The offscreen buffer for each moving obstacle
+    # Invariant: _offscreen is a number (int or float) >= 0
+
+    # Attribute _lanes: The lanes, starting from the bottom of the window
+    # Invariant: _lanes is a tuple of LaneSpec objects
+
+    # Attribute _frogsize: The size of one frame of the frog sprite
+    # Invariant: _frogsize is a pair of numbers > 0
+
+    # Attribute _froghitbox: The hitbox of each frame of the frog sprite
+    # Invariant: _froghitbox is a tuple of 4-element tuples of numbers
+
+    # GETTERS AND SETTERS (ONLY ADD IF YOU NEED THEM)
+    def getName(self):
+        """
+        Gets the level file name
+        """
+        return self._name
+
+    def getWidth(self):
+        """
+        Gets the width of the level in pixels
+        """
+        return self._size[0]*GRID_SIZE
+
+    def getHeight(self):
+        """
+        Gets the height of the level in pixels (including the lives row)
+        """
+        return self._size[1]*GRID_SIZE+GRID_SIZE
+
+    def getOffscreen(self):
+        """
+        Gets the offscreen buffer for each moving obstacle
+        """
+        return self._offscreen
+
+    def getLanes(self):
+        """
+        Gets the lanes, starting from the bottom of the window
+        """
+        return self._lanes
+
+    def getFrogSize(self):
+        """
+        Gets the size of one frame of the frog sprite
+        """
+        return self._frogsize
+
+    def getFrogHitboxes(self):
+        """
+        Gets the hitbox of each frame of the frog sprite
+        """
+        return self._froghitbox
+
+    # INITIALIZER TO CHECK THE LEVEL
+    def __init__(self,dict,objects,name='level'):
+        """
+        Initializes the level, raising a ValueError if it is invalid.
+
+        Parameter dict: The dictionary with the level's information
+        Precondition: None (it should be the contents of a level file)
+
+        Parameter objects: The sizes and hitboxes of each object
+        Precondition: objects is a Catalogue object
+
+        Parameter name: The level file name (for error messages)
+        Precondition: name is a string
+        """
+        if type(dict) != type({}):
+            raise ValueError('%s is not a level' % name)
+        size = dict.get('size')
+        if type(size) != list or len(size) != 2 or \
+        not all(type(x) == int and x > 0 for x in size):
+            raise ValueError('%s has an invalid size' % name)
+        if not _isnum(dict.get('offscreen')) or dict['offscreen'] < 0:
+            raise ValueError('%s has an invalid offscreen buffer' % name)
+        if type(dict.get('lanes')) != list or len(dict['lanes']) != size[1]:
+            raise ValueError('%s does not have %d lanes' % (name,size[1]))
+        self._name = name
+        self._size = tuple(size)
+        self._offscreen = dict['offscreen']
+        self._lanes = tuple(LaneSpec(dict['lanes'][pos],objects,\
+        '%s lane %d' % (name,pos)) for pos in range(len(dict['lanes'])))
+        frog = objects.lookup(FROG_SPRITE+'.png')
+        if frog is None or len(frog.getHitboxes()) == 0:
+            raise ValueError('%s has no frog sprite' % name)
+        self._frogsize = frog.getSize()
+        self._froghitbox = frog.getHitboxes()
+
+
+class SpriteState(object):
+    """
+    A class representing the position and animation frame of a sprite.
+
+    The death animation only needs this much.  The frog needs hitboxes as well, so
+    it is a subclass.
+
+    Attribute x: The x (horizontal) position of the sprite
+    Invariant: x is a number (float)
+
+    Attribute y: The y (vertical) position of the sprite
+    Invariant: y is a number (float)
+
+    Attribute angle: The angle of the sprite in degrees
+    Invariant: angle is a number (int or float)
+
+    Attribute frame: The current animation frame
+    Invariant: frame is an int 0..count-1
+
+    Attribute px: The x position of the sprite before the last step
+    Invariant: px is a number (float)
+
+    Attribute py: The y position of the sprite before the last step
+    Invariant: py is a number (float)
+    """
+
+    def __init__(self,x,y,angle=0):
+        """
+        Initializes the sprite at frame 0.
+
+        Parameter x: The x (horizontal) position of the sprite
+        Precondition: x is a number (float)
+
+        Parameter y: The y (vertical) position of the sprite
+        Precondition: y is a number (float)
+
+        Parameter angle: The angle of the sprite in degrees
+        Precondition: angle is a number (int or float)
+        """
+        self.x = x
+        self.y = y
+        self.px = x
+        self.py = y
+        self.angle = angle
+        self.frame = 0
+
+    def lerp(self,alpha):
+        """
+        Returns: The position (x,y) alpha of the way through the last step
+
+        Parameter alpha: The fraction of the step
+        Precondition: alpha is a number in 0..1
+        """
+        return (self.px+(self.x-self.px)*alpha,self.py+(self.y-self.py)*alpha)
+
+
+class FrogState(SpriteState):
+    """
+    A class representing the frog in the simulation.
+
+    The bounds of the frog follow GObject exactly, so that collisions are the same
+    whether or not there is a window.  The hitbox changes with the animation frame,
+    just like a GSprite.
+
+    Attribute width: The width of one frame of the frog sprite
+    Invariant: width is a number (int or float) > 0
+
+    Attribute height: The height of one frame of the frog sprite
+    Invariant: height is a number (int or float) > 0
+
+    Attribute hitboxes: The hitbox of each animation frame
+    Invariant: hitboxes is a tuple of 4-element tuples, or None for no hitbox
+    """
+
+    def __init__(self,x,y,width,height,hitboxes):
+        """
+        Initializes the frog facing north.
+
+        Parameter x: The x (horizontal) position of the frog
+        Precondition: x is a number (float)
+
+        Parameter y: The y (vertical) position of the frog
+        Precondition: y is a number (float)
+
+        Parameter width: The width of one frame of the frog sprite
+        Precondition: width is a number (int or float) > 0
+
+        Parameter height: The height of one frame of the frog sprite
+        Precondition: height is a number (int or float) > 0
+
+        Parameter hitboxes: The hitbox of each animation frame
+        Precondition: hitboxes is a list of 4-element lists, or None
+        """
+        super().__init__(x,y,FROG_NORTH)
+        self.width = width
+        self.height = height
+        self.hitboxes = None if hitboxes is None else tuple(map(tuple,hitboxes))
+
+    @property
+    def hitbox(self):
+        """
+        The hitbox of the current animation frame.
+        """
+        if self.hitboxes is None:
+            return (0,0,0,0)
+        return self.hitboxes[self.frame]
+
+    def bbox(self):
+        """
+        Returns: The bounding box (l,t,r,b) of the frog at its current angle
+
+        This is the same box that GObject uses in collides and contains.  Note that
+        when the frog faces east or west, t is below b (so the frog contains no point).
+        """
+        oangle = self.angle % 360
+        hit = self.hitbox
+        w = self.width/2
+        h = self.height/2
+        if oangle == 90:
+            return (self.x+hit[1]-h,self.y+hit[2]-w,self.x-hit[3]+h,self.y-hit[0]+w)
+        elif oangle == 180:
+            return (self.x+hit[2]-w,self.y-hit[3]+h,self.x-hit[0]+w,self.y+hit[1]-h)
+        elif oangle == 270:
+            return (self.x+hit[3]-h,self.y+hit[0]-w,self.x-hit[1]+h,self.y-hit[2]+w)
+        return (self.x+hit[0]-w,self.y-hit[1]+h,self.x-hit[2]+w,self.y+hit[3]-h)
+
+    def rawbox(self):
+        """
+        Returns: The bounding box (l,t,r,b) of the frog as if it were not rotated
+        """
+        hit = self.hitbox
+        return (self.x+hit[0]-self.width/2,self.y-hit[1]+self.height/2,\
+        self.x-hit[2]+self.width/2,self.y+hit[3]-self.height/2)
+
+
+class LaneState(object):
+    """
+    A class representing the obstacles in a single lane.
+
+    The obstacles are stored as parallel arrays (one entry per obstacle) kept sorted
+    by the left edge of their hitbox.  Obstacles in a lane all move at the same
+    speed, so the order only changes when an obstacle wraps around the screen.
+
+    This class is a safe lane (grass).  The other lanes override issafe.
+    """
+    # LIST ALL HIDDEN ATTRIBUTES HERE
+    # Attribute _type: The background surface of the lane
+    # Invariant: _type is a string ("grass","road","water","hedge")
+
+    # Attribute _y: The vertical position of the lane (and every obstacle in it)
+    # Invariant: _y is a number (float)
+
+    # Attribute _width: The width of the level
+    # Invariant: _width is a number (int)
+
+    # Attribute _offscreen: The offscreen buffer for each moving obstacle
+    # Invariant: _offscreen is a number (int)
+
+    # Attribute _objspeed: The speed of the moving obstacles
+    # Invariant: _objspeed is a number (int or float)
+
+    # Attribute _angle: The angle of every obstacle (180 if they move left)
+    # Invariant: _angle is 0 or 180
+
+    # Attribute _sources: The image file of each obstacle, in level file order
+    # Invariant: _sources is a tuple of strings
+
+    # Attribute _ids: The level file position of each obstacle
+    # Invariant: _ids is a numpy array of ints (an index into _sources)
+
+    # Attribute _xs: The horizontal center of each obstacle
+    # Invariant: _xs is a numpy array of floats
+
+    # Attribute _prevxs: The horizontal center of each obstacle before the last step
+    # Invariant: _prevxs is a numpy array of floats
+
+    # Attribute _half: Half the width of each obstacle
+    # Invariant: _half is a numpy array of floats
+
+    # Attribute _lpad: The hitbox offset of the left edge of each obstacle
+    # Invariant: _lpad is a numpy array of floats (depends on the obstacle angle)
+
+    # Attribute _rpad: The hitbox offset of the right edge of each obstacle
+    # Invariant: _rpad is a numpy array of floats (depends on the obstacle angle)
+
+    # Attribute _tops: The top edge of the hitbox of each obstacle
+    # Invariant: _tops is a numpy array of floats
+
+    # Attribute _bottoms: The bottom edge of the hitbox of each obstacle
+    # Invariant: _bottoms is a numpy array of floats
+
+    # Attribute _kinds: The kind of each obstacle
+    # Invariant: _kinds is a numpy array of KIND_HAZARD, KIND_PLATFORM, KIND_EXIT, or
+    # KIND_OPEN (taken from the object data file)
+
+    # Attribute _blocked: Whether a frog has taken each exit
+    # Invariant: _blocked is a numpy array of ints, 0 or 1
+
+    # Attribute _onlog: Whether the frog is riding each obstacle
+    # Invariant: _onlog is a numpy array of ints, 0 or 1
+
+    # Attribute _lefts: The left edge of the hitbox of each obstacle
+    # Invariant: _lefts is a sorted numpy array of floats
+
+    # Attribute _reach: The widest horizontal extent of any obstacle in the lane
+    # Invariant: _reach is a number (float) >= 0
+
+    # GETTERS AND SETTERS (ONLY ADD IF YOU NEED THEM)
+    def getType(self):
+        """
+        Gets the background surface of the lane
+        """
+        return self._type
+
+    def getY(self):
+        """
+        Gets the vertical position of the lane
+        """
+        return self._y
+
+    def getAngle(self):
+        """
+        Gets the angle of the obstacles in the lane
+        """
+        return self._angle
+
+    def getSources(self):
+        """
+        Gets the image file of each obstacle, in level file order
+        """
+        return self._sources
+
+    def getIds(self):
+        """
+        Gets the level file position of each obstacle, in drawing order
+        """
+        return self._ids
+
+    def getXs(self,alpha=1.0):
+        """
+        Gets the horizontal center of each obstacle, in drawing order
+
+        Parameter alpha: How far through the last step to take the positions
+        Precondition: alpha is a number in 0..1
+        """
+        if alpha >= 1:
+            return self._xs
+        return self._prevxs+(self._xs-self._prevxs)*alpha
+
+    def getexits(self):
+        """
+        Gets the exit count of the lane
+        """
+        return int(np.count_nonzero(self._kinds == KIND_EXIT))
+
+    # INITIALIZER TO SET LANE POSITION AND OBSTACLES
+    def __init__(self,y,lane,width,offscreen):
+        """
+        Initializes the lane and its obstacles.
+
+        Parameter y: The vertical position of the lane
+        Precondition: y is a number (int or float)
+
+        Parameter lane: The lane from the level file
+        Precondition: lane is a LaneSpec object
+
+        Parameter width: The width of the level
+        Precondition: width is a number (int)
+
+        Parameter offscreen: The offscreen buffer for each moving obstacle
+        Precondition: offscreen is a number (int)
+        """
+        self._type = lane.getType()
+        self._y = y
+        self._width = width
+        self._offscreen = offscreen
+        self._objspeed = lane.getSpeed()
+        self._angle = 180 if self._objspeed < 0 else 0
+        self._sources = lane.getSources()
+        xs = [(pos+0.5)*GRID_SIZE for pos in lane.getPositions()]
+        half = [size[0]/2.0 for size in lane.getSizes()]
+        hitboxes = [lane.getHitboxes()[pos]+(lane.getSizes()[pos][1],) \
+        for pos in range(len(xs))]
+        self.__buildarrays__(xs,half,hitboxes,lane.getKinds())
+
+    def update(self,dt,frog):
+        """
+        Moves the obstacles (and any frog riding them) each frame.
+
+        Parameter dt: The time in seconds since last update
+        Precondition: dt is a number (int or float)
+
+        Parameter frog: The frog in the level
+        Precondition: frog is a FrogState object (or None if there is no frog)
+        """
+        self._prevxs[:] = self._xs
+        self._xs += dt*self._objspeed
+        for pos in range(np.count_nonzero(self._onlog)):
+            frog.x += dt*self._objspeed
+        self._onlog[:] = 0
+        edge = self._offscreen*GRID_SIZE
+        if self._objspeed < 0:
+            wrapped = self._xs+self._half-self._rpad <= -edge
+            if wrapped.any():
+                rights = self._xs[wrapped]+self._half[wrapped]-self._rpad[wrapped]
+                self._xs[wrapped] += (self._width+edge)-rights
+                self._prevxs[wrapped] = self._xs[wrapped]-dt*self._objspeed
+        else:
+            wrapped = self._xs-self._half+self._lpad >= self._width+edge
+            if wrapped.any():
+                lefts = self._xs[wrapped]-self._half[wrapped]+self._lpad[wrapped]
+                self._xs[wrapped] += -edge-lefts
+                self._prevxs[wrapped] = self._xs[wrapped]-dt*self._objspeed
+        self._lefts = self._xs-self._half+self._lpad
+        if wrapped.any():
+            self.__sortobjs__()
+
+    # ADDITIONAL METHODS (COLLISIONS, MOVEMENT, ETC)
+    def issafe(self,frog):
+        """
+        Returns: True if the frog can stay in this lane, False if it dies
+
+        Most lanes are safe. Lanes with hazards override this method.
+
+        Parameter frog: The frog in the level
+        Precondition: frog is a FrogState object
+        """
+        return True
+
+    def findrange(self,left,right):
+        """
+        Returns: The positions of the obstacles whose hitbox overlaps the span [left,right]
+
+        The obstacles are kept sorted by their left edge, so this is a binary search
+        followed by a scan of the (few) obstacles that could reach the span.
+
+        Parameter left: The left edge of the span
+        Precondition: left is a number (int or float)
+
+        Parameter right: The right edge of the span
+        Precondition: right is a number (int or float) >= left
+        """
+        start = np.searchsorted(self._lefts,left-self._reach,'left')
+        stop = np.searchsorted(self._lefts,right,'right')
+        rights = self._xs[start:stop]+self._half[start:stop]-self._rpad[start:stop]
+        return start+np.flatnonzero(rights >= left)
+
+    def __buildarrays__(self,xs,half,hitboxes,kinds):
+        """
+        Helper method to copy the obstacle positions and hitboxes into arrays.
+
+        Parameter xs: The horizontal center of each obstacle
+        Precondition: xs is a list of numbers
+
+        Parameter half: Half the width of each obstacle
+        Precondition: half is a list of numbers
+
+        Parameter hitboxes: The hitbox of each obstacle, followed by its height
+        Precondition: hitboxes is a list of 5-element tuples of numbers
+
+        Parameter kinds: The kind of each obstacle
+        Precondition: kinds is a list of KIND_HAZARD, KIND_PLATFORM, KIND_EXIT or
+        KIND_OPEN
+        """
+        hit = np.array(hitboxes,dtype=float).reshape(len(hitboxes),5)
+        flip = self._angle == 180
+        self._ids = np.arange(len(xs))
+        self._xs = np.array(xs,dtype=float)
+        self._prevxs = self._xs.copy()
+        self._half = np.array(half,dtype=float)
+        self._lpad = hit[:,2] if flip else hit[:,0]
+        self._rpad = hit[:,0] if flip else hit[:,2]
+        self._tops = self._y+hit[:,4]/2.0-(hit[:,3] if flip else hit[:,1])
+        self._bottoms = self._y-hit[:,4]/2.0+(hit[:,1] if flip else hit[:,3])
+        self._kinds = np.array(kinds,dtype=int)
+        self._blocked = np.zeros(len(xs),dtype=int)
+        self._onlog = np.zeros(len(xs),dtype=int)
+        self._lefts = self._xs-self._half+self._lpad
+        rights = self._xs+self._half-self._rpad
+        self._reach = float((rights-self._lefts).max()) if len(xs) else 0.0
+        self.__sortobjs__()
+
+    def __sortobjs__(self):
+        """
+        Helper method to restore the left edge ordering of the obstacles.
+        """
+        order = np.argsort(self._lefts,kind='stable')
+        self._ids = self._ids[order]
+        self._xs = self._xs[order]
+        self._prevxs = self._prevxs[order]
+        self._half = self._half[order]
+        self._lpad = self._lpad[order]
+        self._rpad = self._rpad[order]
+        self._tops = self._tops[order]
+        self._bottoms = self._bottoms[order]
+        self._kinds = self._kinds[order]
+        self._blocked = self._blocked[order]
+        self._onlog = self._onlog[order]
+        self._lefts = self._lefts[order]
+
+
+class RoadState(LaneState):
+    """
+    A class representing a roadway with cars.
+
+    The frog dies if it touches any hazard in the lane.
+    """
+
+    def issafe(self,frog):
+        """
+        Returns: True if the frog is not touching any hazard in this lane
+
+        This is the same test as GObject.collides, done on every nearby car at once.
+
+        Parameter frog: The frog in the level
+        Precondition: frog is a FrogState object
+        """
+        l1, t1, r1, b1 = frog.bbox()
+        hits = self.findrange(min(l1,r1),max(l1,r1))
+        hits = hits[self._kinds[hits] == KIND_HAZARD]
+        l0 = self._lefts[hits]
+        r0 = self._xs[hits]+self._half[hits]-self._rpad[hits]
+        t0 = self._tops[hits]
+        b0 = self._bottoms[hits]
+        isx = ((l1 <= l0) & (l0 <= r1)) | ((l0 <= l1) & (l1 <= r0))
+        isy = ((b1 <= b0) & (b0 <= t1)) | ((b0 <= b1) & (b1 <= t0))
+        return not (isx & isy).any()
+
+
+class WaterState(LaneState):
+    """
+    A class representing a waterway with logs.
+
+    The frog dies in water unless it is riding a log, and the logs carry the frog
+    along with them.
+    """
+
+    def checkonlog(self,frog):
+        """
+        Returns: The number of logs the frog is riding in this lane
+
+        Marks every log under the frog (in the attribute _onlog) so that update
+        carries the frog along with it.
+
+        A log carries the frog if its riding span, which starts GRID_SIZE/1.5 pixels
+        past the left end of the log and stops 1.5*GRID_SIZE-GRID_SIZE/1.5 pixels
+        short of the right end, overlaps the frog's unrotated hitbox at the height
+        of the log.  This is an interval overlap test, so the cost only depends on
+        the number of logs and not on their length.
+
+        Parameter frog: The frog in the level
+        Precondition: frog is a FrogState object
+        """
+        left, top, right, bottom = frog.rawbox()
+        if not bottom <= self._y <= top:
+            return 0
+        logs = self.findrange(left-1,right+1)
+        logs = logs[self._kinds[logs] == KIND_PLATFORM]
+        start = np.rint(self._lefts[logs])
+        span = np.rint(self._xs[logs]+self._half[logs]-self._rpad[logs])-start-\
+        int(round(1.5*GRID_SIZE))
+        first = np.maximum(0,np.ceil(left-GRID_SIZE/1.5-start-1))
+        last = np.minimum(span-1,np.floor(right-GRID_SIZE/1.5-start-1))
+        logs = logs[first <= last]
+        self._onlog[logs] = 1
+        return len(logs)
+
+    def issafe(self,frog):
+        """
+        Returns: True if the frog is riding a log in this lane
+
+        Parameter frog: The frog in the level
+        Precondition: frog is a FrogState object
+        """
+        return self.checkonlog(frog) > 0
+
+
+class HedgeState(LaneState):
+    """
+    A class representing the exit hedge.
+
+    The frog can only enter the hedge through an opening or a free exit.  Once a frog
+    reaches an exit, that exit is taken for the rest of the level.
+    """
+
+    def findentrance(self,frog,y):
+        """
+        Returns: The position of the opening or exit the frog moved onto, or None if
+        the hedge blocks it
+
+        The frog can only pass through openings and free exits.  The frog reaches an
+        exit if the center of the exit is inside the frog and the frog came from below
+        it.  That exit is then marked as taken.
+
+        Parameter frog: The frog after moving into the hedge
+        Precondition: frog is a FrogState object
+
+        Parameter y: The vertical position of the frog before it moved
+        Precondition: y is a number (int or float)
+        """
+        l1, t1, r1, b1 = frog.bbox()
+        for pos in self.findrange(min(l1,r1),max(l1,r1)):
+            if self._kinds[pos] == KIND_OPEN:
+                b0 = self._bottoms[pos]
+                t0 = self._tops[pos]
+                if b1 <= b0 <= t1 or b0 <= b1 <= t0:
+                    return pos
+            if self._kinds[pos] == KIND_EXIT and l1 <= self._xs[pos] <= r1 and \
+            b1 <= self._y <= t1 and y <= self._y and self._blocked[pos] == 0:
+                self._blocked[pos] = 1
+                return pos
+        return None
+
+    def iskind(self,pos,kind):
+        """
+        Returns: True if the obstacle at position pos is of the given kind
+
+        Parameter pos: The position of an obstacle (as returned by findentrance)
+        Precondition: pos is a valid position in this lane
+
+        Parameter kind: The obstacle kind
+        Precondition: kind is KIND_HAZARD, KIND_PLATFORM, KIND_EXIT, or KIND_OPEN
+        """
+        return self._kinds[pos] == kind
+
+
+class World(object):
+    """
+    This class plays a single level of Froggit without drawing it.
+
+    A World is made from a LevelSpec (see load_level), and advanced one frame at a
+    time with step.  The only input is the direction the player wants the
+    frog to go that frame.  Anything the views need (positions, lives, safe frogs,
+    sounds to play) is available through getters.
+    """
+    # LIST ALL HIDDEN ATTRIBUTES HERE
+    # Attribute _width: The width of the level in pixels
+    # Invariant: _width is a number (int)
+
+    # Attribute _height: The height of the level in pixels (including the lives row)
+    # Invariant: _height is a number (int)
+
+    # Attribute _lanes: The lanes of the level with a known type
+    # Invariant: _lanes is a list of LaneState objects
+
+    # Attribute _rows: The lane in each grid row, indexed from the bottom row
+    # Invariant: _rows is a list of LaneState objects (or None for an unknown type)
+
+    # Attribute _exitcount: The number of exits in the level
+    # Invariant: _exitcount is a number (int)
+
+    # Attribute _startfrogx: The starting position of the frog
+    # Invariant: _startfrogx is number (float)
+
+    # Attribute _froghitbox: The hitbox of each frame of the frog
+    # Invariant: _froghitbox is a tuple of 4-element tuples
+
+    # Attribute _frogsize: The size of one frame of the frog sprite
+    # Invariant: _frogsize is a pair (width, height)
+
+    # Attribute _frog: The frog in the level
+    # Invariant: _frog is a FrogState object, or None if there is no frog
+
+    # Attribute _death: The death animation of the frog
+    # Invariant: _death is a SpriteState object
+
+    # Attribute _lives: The number of lives left before losing
+    # Invariant: _lives is a number (int) >= 0
+
+    # Attribute _safefrog: The positions of the frogs that reached an exit
+    # Invariant: _safefrog is a list of (x,y) tuples
+
+    # Attribute _animator: Handles the coroutine of animations
+    # Invariant: _animator is a generator, or None if nothing is animating
+
+    # Attribute _animating: Whether the current animation is still active
+    # Invariant: _animating is a boolean (True,False)
+
+    # Attribute _updateDeath: Status of frog upon death (win,loss,death)
+    # Invariant: _updateDeath is a number (int), can be 0, 1, -1
+
+    # Attribute _dead: Whether the death animation is playing
+    # Invariant: _dead is a number (int), 0 or 1
+
+    # Attribute _undead: An indication of when the death animation is complete
+    # Invariant: _undead is a number (int), 0 or 1
+
+    # Attribute _lastleafx: The x position of the last exit the frog was on
+    # Invariant: _lastleafx is a number (float)
+
+    # Attribute _lastleafy: The y position of the last exit the frog was on
+    # Invariant: _lastleafy is a number (float)
+
+    # Attribute _collidestatus: The status of the frog's collision
+    # Invariant: _collidestatus is a number (int)
+
+    # Attribute _events: The sounds to play for the last step
+    # Invariant: _events is a list of sound file names (taken from consts.py)
+
+    # GETTERS AND SETTERS (ONLY ADD IF YOU NEED THEM)
+    def getWidth(self):
+        """
+        Gets the width of the level
+        """
+        return self._width
+
+    def getHeight(self):
+        """
+        Gets the height of the level (including the lives row)
+        """
+        return self._height
+
+    def getLanes(self):
+        """
+        Gets the lanes of the level with a known type
+        """
+        return self._lanes
+
+    def getFrog(self):
+        """
+        Gets the frog (or None if there is no frog on screen)
+        """
+        return self._frog
+
+    def getDeath(self):
+        """
+        Gets the death animation of the frog
+        """
+        return self._death
+
+    def isDying(self):
+        """
+        Returns: True if the death animation is playing
+        """
+        return self._dead == 1
+
+    def getLives(self):
+        """
+        Gets the number of lives left before losing
+        """
+        return self._lives
+
+    def getSafe(self):
+        """
+        Gets the positions of the frogs that reached an exit
+        """
+        return self._safefrog
+
+    def getEvents(self):
+        """
+        Gets the sounds to play for the last step
+        """
+        return self._events
+
+    def lane_at(self,y):
+        """
+        Returns: The lane containing the vertical position y, or None if there is none
+
+        Lanes are GRID_SIZE high and stacked from the bottom of the window, so the
+        row is just y divided by GRID_SIZE.
+
+        Parameter y: The vertical position to look up
+        Precondition: y is a number (int or float)
+        """
+        row = int(y//GRID_SIZE)
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    # INITIALIZER TO CREATE THE FROG AND LANES
+    def __init__(self,spec):
+        """
+        Initializes the level.
+
+        Parameter spec: The level to play
+        Precondition: spec is a LevelSpec object
+        """
+        classes = {'grass':LaneState,'road':RoadState,'water':WaterState,\
+        'hedge':HedgeState}
+        self._width = spec.getWidth()
+        self._height = spec.getHeight()
+        self._lanes = []
+        self._rows = []
+        count = 0.5
+        for lane in spec.getLanes():
+            self._rows.append(None)
+            if lane.getType() in classes:
+                self._lanes.append(classes[lane.getType()](count*GRID_SIZE,lane,\
+                self._width,spec.getOffscreen()))
+                self._rows[-1] = self._lanes[-1]
+            count = count + 1
+        self._exitcount = sum(lane.getexits() for lane in self._lanes)
+        self._startfrogx = (count+1.5)*GRID_SIZE/2
+        self._froghitbox = spec.getFrogHitboxes()
+        self._frogsize = spec.getFrogSize()
+        self._lives = FROG_LIVES
+        self._safefrog = []
+        self._animator = None
+        self._animating = False
+        self._updateDeath = 0
+        self._dead = 0
+        self._lastleafx = 0
+        self._lastleafy = 0
+        self._collidestatus = 0
+        self._events = []
+        self.respawn()
+
+    def respawn(self):
+        """
+        Puts a new frog in the starting position.
+        """
+        self._frog = FrogState(self._startfrogx,GRID_SIZE/2,self._frogsize[0],\
+        self._frogsize[1],self._froghitbox)
+        self._undead = 1
+        self._death = SpriteState(-GRID_SIZE,0,FROG_SOUTH)
+
+    # STEP METHOD TO MOVE THE FROG AND ALL OF THE LANES
+    def step(self,dt,action=None):
+        """
+        Returns: The result of this frame: 1 if the level is won, -1 if it is lost,
+        0 if the frog died or reached an exit (so the game should pause), or None
+
+        Parameter dt: The time in seconds since last update
+        Precondition: dt is a number (int or float)
+
+        Parameter action: The direction the player wants the frog to go
+        Precondition: action is None or one of 'right','left','up','down'
+        """
+        self._events = []
+        for sprite in (self._frog,self._death):
+            if sprite != None:
+                sprite.px = sprite.x
+                sprite.py = sprite.y
+        for lane in self._lanes:
+            lane.update(dt,self._frog)
+        if not self._animator is None:
+            try:
+                self._animator.send(dt)
+            except StopIteration:
+                self._animator = None
+                self._dead=0
+        elif(isinstance(self.__updateDeath__(),int)):
+            return self._updateDeath
+        elif self._frog != None:
+            if(self.__updatecontinue__()==1):
+                return
+            elif(self.__inputcheck__(action)==1):
+                return
+
+    # ANY NECESSARY HELPERS (SHOULD BE HIDDEN)
+    def __checkcollide__(self,direction):
+        """
+        Helper method of step.
+
+        Checks whether the frog may move in the given direction.  Returns 2 if the
+        hedge blocks the move and 3 if the move reaches an exit.
+
+        Parameter direction: The direction to slide.
+        Precondition: direction is a string
+        """
+        x = self._frog.x
+        y = self._frog.y
+        self.__directionmodifier__(direction)
+        lane = self.lane_at(self._frog.y)
+        result = None
+        if isinstance(lane,HedgeState):
+            entrance = lane.findentrance(self._frog,y)
+            if entrance is None:
+                result = 2
+            elif lane.iskind(entrance,KIND_EXIT):
+                self._lastleafx=float(lane.getXs()[entrance])
+                self._lastleafy=lane.getY()
+                result = 3
+        self._frog.x = x
+        self._frog.y = y
+        return result
+
+    def __directionmodifier__(self,direction):
+        """
+        Helper method of step.
+
+        Moves the frog one grid square in the given direction.
+
+        Parameter direction: The direction to slide.
+        Precondition: direction is a string
+        """
+        if direction == 'up':
+            self._frog.y+=GRID_SIZE
+        if direction == 'down':
+            self._frog.y-=GRID_SIZE
+        if direction == 'left':
+            self._frog.x-=GRID_SIZE
+        if direction == 'right':
+            self._frog.x+=GRID_SIZE
+
+    def __inputcheck__(self,action):
+        """
+        Helper method of step.
+
+        Starts the frog moving in the direction the player asked for.
+
+        Parameter action: The direction the player wants the frog to go
+        Precondition: action is None or one of 'right','left','up','down'
+        """
+        angles = {'right':FROG_EAST,'left':FROG_WEST,'up':FROG_NORTH,\
+        'down':FROG_SOUTH}
+        if action not in angles:
+            return
+        self._frog.angle = angles[action]
+        status = self.__checkcollide__(action)
+        if action == 'up':
+            self._collidestatus = status
+        if(status==2): return 1
+        self._animator = self.__animateslide__(action,self._frog)
+        next(self._animator)
+        self._events.append(CROAK_SOUND)
+
+    def __updatecontinue__(self):
+        """
+        A helper of the step method.
+
+        Handles car collisions and log riding.
+        """
+        lane = self.lane_at(self._frog.y)
+        if lane != None and not lane.issafe(self._frog):
+            self._dead=1
+            return 1
+
+    def __updateDeath__(self):
+        """
+        Helper method of step.
+
+        Handles the frog reaching an exit or dying.
+        """
+        if(self._collidestatus==3):
+            self._collidestatus=0
+            self._events.append(TRILL_SOUND)
+            self._frog = None
+            self._safefrog.append((self._lastleafx,self._lastleafy))
+            if len(self._safefrog) == self._exitcount:
+                self._updateDeath = 1
+                return 1
+            self._updateDeath = 0
+            return 0
+        elif self._dead==1:
+            self._death.x=self._death.px=self._frog.x
+            self._death.y=self._death.py=self._frog.y
+            self._frog = None
+            self._events.append(SPLAT_SOUND)
+            self._animator=self.__animateslide__('dead',self._death)
+            next(self._animator)
+            self._undead=0
+        elif self._undead==0:
+            if self._lives == 0:
+                self._updateDeath = -1
+                return -1
+            self._lives -= 1
+            self._updateDeath = 0
+            return 0
+        else:
+            return 'none'
+
+    def __animateslide__(self,direction,obj):
+        """
+        Helper method of step.
+
+        Animates a slide of the frog (or the death animation) over FROG_SPEED seconds
+        (DEATH_SPEED for the death animation)
+
+        This method is a coroutine that takes a break (so that the game can redraw
+        the frog) every time it moves it. The coroutine takes the dt as periodic input
+        so it knows how many (parts of) seconds to animate.
+
+        Parameter direction: The direction to slide ('dead' for the death animation)
+        Precondition: direction is a string
+
+        Parameter obj: The sprite to animate
+        Precondtion: obj is a SpriteState object
+        """
+        self._animating,dtsum,notdeep=True,0,0
+        if direction != 'dead':
+            numberlist=self.__animationdirection__(direction,obj)
+            curpos,nexpos,steps = numberlist[0],numberlist[1],numberlist[2]
+            deeper = FROG_SPEED/8
+            while self._animating:
+                dt = (yield)
+                dtsum+=dt
+                if round(dtsum,5)>deeper:
+                    dtsum=0
+                    if(notdeep==0): obj.frame+=1
+                    if(obj.frame==4): notdeep=1
+                    if(notdeep==1):
+                        obj.frame-=1
+                        if(obj.frame==0): notdeep=0
+                if self.__endanimation__(obj,direction,steps,dt,\
+                curpos,nexpos)==2: continue
+        else:
+            deeper = DEATH_SPEED/8
+            while self._animating:
+                dt = (yield)
+                dtsum+=dt
+                if round(dtsum,5)>deeper:
+                    dtsum=0
+                    if(notdeep==0): obj.frame+=1
+                    if(obj.frame==7): notdeep=1
+                    if(notdeep==1):
+                        obj.frame=0
+                        self._animating=False
+
+    def __animationdirection__(self,direction,obj):
+        """
+        Helper method of step.
+
+        Returns: The start position, end position and speed of a slide
+
+        Parameter direction: The direction to slide.
+        Precondition: direction is a string
+
+        Parameter obj: The sprite to animate
+        Precondtion: obj is a SpriteState object
+        """
+        curpos=0
+        nexpos=0
+        steps=0
+        if direction == 'up':
+            curpos = obj.y
+            nexpos = sorted([GRID_SIZE/2, obj.y+GRID_SIZE,self.getHeight()-\
+            GRID_SIZE*1.5])[1]
+            steps = abs((nexpos-curpos)/FROG_SPEED)
+        if direction == 'down':
+            curpos = obj.y
+            nexpos = sorted([GRID_SIZE/2,obj.y-GRID_SIZE, self.getHeight()-\
+            GRID_SIZE/2])[1]
+            steps = abs((nexpos-curpos)/FROG_SPEED)
+        if direction == 'left':
+            curpos = obj.x
+            nexpos = sorted([GRID_SIZE/2, obj.x-GRID_SIZE, self.getWidth()-\
+            GRID_SIZE/2])[1]
+            steps = abs((nexpos-curpos)/FROG_SPEED)
+        if direction == 'right':
+            curpos = obj.x
+            nexpos = sorted([GRID_SIZE/2, obj.x+GRID_SIZE, self.getWidth()-\
+            GRID_SIZE/2])[1]
+            steps = abs((nexpos-curpos)/FROG_SPEED)
+        return [curpos,nexpos,steps]
+
+    def __endanimation__(self,obj,direction,steps,dt,curpos,nexpos):
+        """
+        Helper method of step.
+
+        Moves the sprite for one frame, and concludes the slide once it has moved a
+        full grid square
+
+        Parameter obj: The sprite to animate
+        Precondtion: obj is a SpriteState object
+
+        Parameter direction: The direction to slide.
+        Precondition: direction is a string
+
+        Parameter steps: The velocity of the frog
+        Precondtion: steps is a number (float)
+
+        Parameter dt: The time since the last animation frame.
+        Precondition: dt is a float.
+
+        Parameter curpos: The current position of the frog
+        Precondtion: curpos is a number (float)
+
+        Parameter nexpos: The next position of the frog
+        Precondtion: nexpos is a number (float)
+        """
+        amount = steps*dt
+        if steps==0:
+            self._animating = False
+            return 2
+        if direction == 'up':
+            obj.y +=amount
+            if abs(obj.y-curpos) >= GRID_SIZE:
+                obj.y = nexpos
+                obj.frame=0
+                self._animating = False
+        if direction == 'down':
+            obj.y -=amount
+            if abs(obj.y-curpos) >= GRID_SIZE:
+                obj.y = nexpos
+                obj.frame=0
+                self._animating = False
+        if direction == 'left':
+            obj.x -=amount
+            if abs(obj.x-curpos) >= GRID_SIZE:
+                obj.x = nexpos
+                obj.frame=0
+                self._animating = False
+        if direction == 'right':
+            obj.x +=amount
+            if abs(obj.x-curpos) >= GRID_SIZE:
+                obj.x = nexpos
+                obj.frame=0
+                self._animating = False